@@ -59,3 +59,343 @@ for timeline in timelines:
     globals()[suite.__name__] = suite
 
 timeline = None
+
+
+class Time_DotCloud_1M:
+    '''
+    包含 10^6 个点的 :class:`~.DotCloud` 的渲染
+    '''
+    def setup(self):
+        import numpy as np
+
+        from janim.imports import RIGHT, DotCloud
+
+        def create_dots() -> DotCloud:
+            rng = np.random.default_rng(0)
+            points = rng.uniform(-4, 4, (1_000_000, 3))
+            points[:, 2] = 0
+            dots = DotCloud(radius=0.005)
+            dots.points.set(points)
+            return dots
+
+        class DotCloud1M(Timeline):
+            def construct(self):
+                dots = create_dots().show()
+                self.play(dots.anim.points.shift(RIGHT))
+
+        class DotCloud1MGpuUpdate(Timeline):
+            def construct(self):
+                dots = create_dots()
+                dots.gpu_update('''
+                    void update(int index, float t, inout vec3 point, inout vec4 color, inout float radius)
+                    {
+                        point.y += 0.2 * sin(t * 2.0 + point.x);
+                    }
+                ''')
+                dots.show()
+                self.forward()
+
+        with Config(fps=10):
+            self.built = DotCloud1M().build(quiet=True)
+            self.built_gpu_update = DotCloud1MGpuUpdate().build(quiet=True)
+
+        # 先渲染一次，使得之后计时的部分不包含首次创建缓冲区等开销
+        self.built.capture(0)
+        self.built_gpu_update.capture(0)
+
+    def time_render_static(self):
+        self.built.capture(0)
+
+    def time_render_moving(self):
+        for i in range(10):
+            self.built.capture(i / 10)
+
+    def time_render_gpu_update(self):
+        for i in range(10):
+            self.built_gpu_update.capture(i / 10)
+
+
+class Time_TextTransform:
+    '''
+    不同长度的 :class:`~.Text` 之间的 :class:`~.Transform`，主要开销在子路径的配对
+    '''
+    params = [10, 100, 1000]
+    param_names = ['chars']
+
+    def setup(self, chars: int):
+        from janim.imports import Text, VItem
+
+        def make_string(words: list[str]) -> str:
+            string = ' '.join(words[i % len(words)] for i in range(chars // 6 + 1))[:chars]
+            return '\n'.join(string[i: i + 50] for i in range(0, len(string), 50))
+
+        words = ['janim', 'transform', 'subpath', 'benchmark', 'glyph']
+        self.string1 = make_string(words)
+        self.string2 = make_string(words[::-1])
+
+        text1 = Text(self.string1, font_size=12)
+        text2 = Text(self.string2, font_size=12)
+
+        # 将所有字符合并为一个含有多个子路径的物件，用于单独测试 align_for_interpolate
+        self.merged1 = VItem()
+        self.merged2 = VItem()
+        for char in text1.walk_descendants(VItem):
+            if char.points.has():
+                self.merged1.points.add_subpath(char.points.get())
+        for char in text2.walk_descendants(VItem):
+            if char.points.has():
+                self.merged2.points.add_subpath(char.points.get())
+
+    def time_align_for_interpolate(self, chars: int):
+        type(self.merged1.points).align_for_interpolate(self.merged1.points, self.merged2.points)
+
+    def time_build(self, chars: int):
+        from janim.imports import Text, Transform
+
+        string1 = self.string1
+        string2 = self.string2
+
+        class TextTransform(Timeline):
+            def construct(self):
+                self.play(Transform(Text(string1, font_size=12), Text(string2, font_size=12)))
+
+        with Config(fps=10):
+            TextTransform().build(quiet=True)
+
+
+class Time_VPoints_20k:
+    '''
+    对含有 2*10^4 个点的 :class:`~.Cmpt_VPoints` 的常用操作，例如 :class:`~.Create` 每帧都会调用的 ``pointwise_become_partial``
+    '''
+    def setup(self):
+        import numpy as np
+
+        from janim.imports import VItem
+
+        rng = np.random.default_rng(0)
+        points = rng.uniform(-4, 4, (10_000, 3))
+        points[:, 2] = 0
+        self.item = VItem()
+        self.item.points.set_as_corners(points)
+
+    def time_pointwise_become_partial(self):
+        cmpt = self.item.points.copy()
+        for i in range(10):
+            cmpt.pointwise_become_partial(self.item.points, 0, i / 10)
+
+    def time_point_from_proportion(self):
+        for i in range(10):
+            self.item.points.point_from_proportion(i / 10)
+
+    def time_quick_point_from_proportion(self):
+        for i in range(10):
+            self.item.points.quick_point_from_proportion(i / 10)
+
+    def time_points_from_proportions(self):
+        import numpy as np
+
+        alphas = np.linspace(0, 1, 200)
+        for i in range(10):
+            self.item.points.points_from_proportions((alphas + i / 10) % 1)
+
+
+class Time_Relation_100k:
+    '''
+    含有 10^5 个节点的 :class:`~.Relation` 的构建与遍历
+    '''
+    params = ['flat', 'nested']
+    param_names = ['shape']
+
+    def setup(self, shape: str):
+        from janim.items.relation import Relation
+
+        class Leaf(Relation):
+            pass
+
+        self.relation_cls = Relation
+        self.leaves = [Leaf() for _ in range(100_000)]
+        self.leaf_cls = Leaf
+        self.root = self.build(shape)
+
+    def build(self, shape: str):
+        Relation = self.relation_cls
+        root = Relation()
+        if shape == 'flat':
+            root.add(*self.leaves)
+        else:
+            groups = [Relation().add(*self.leaves[i: i + 1000]) for i in range(0, len(self.leaves), 1000)]
+            root.add(*groups)
+        return root
+
+    def time_build(self, shape: str):
+        root = self.build(shape)
+        root.descendants()
+        root.clear_children()
+
+    def time_walk(self, shape: str):
+        for _ in self.root.walk_self_and_descendants():
+            pass
+        for _ in self.root.walk_nearest_descendants(self.leaf_cls):
+            pass
+        for leaf in self.leaves[::1000]:
+            leaf.ancestors()
+
+
+class Time_PointsSet:
+    '''
+    :meth:`~.Cmpt_Points.set` 的吞吐量，主要开销在 :meth:`~.Signal.emit` 对各个缓存的标记
+    '''
+    def setup(self):
+        from janim.imports import LEFT, RIGHT, UP, Group, VItem
+
+        self.item = VItem(LEFT, RIGHT, UP)
+        # 作为子物件时，box 的标记会向上递归
+        self.group = Group(Group(self.item))
+        self.points = self.item.points.get()
+
+    def time_set_10k(self):
+        cmpt = self.item.points
+        points = self.points
+        for i in range(10_000):
+            cmpt.set(points)
+
+    def time_emit_10k(self):
+        from janim.components.points import Cmpt_Points
+
+        cmpt = self.item.points
+        for i in range(10_000):
+            Cmpt_Points.set.emit(cmpt)
+
+
+class Time_TextPoints_2000:
+    '''
+    对含有 2000 个字符的 :class:`~.Text` 整体进行变换，主要开销在逐个子物件的处理
+    '''
+    def setup(self):
+        from janim.imports import Text
+
+        string = ''.join(chr(ord('a') + i % 26) for i in range(2000))
+        self.string = '\n'.join(string[i: i + 80] for i in range(0, len(string), 80))
+        self.text = Text(self.string)
+
+    def time_build(self):
+        from janim.imports import Text
+
+        Text(self.string)
+
+    def time_rotate(self):
+        for i in range(10):
+            self.text.points.rotate(0.1)
+
+    def time_shift(self):
+        from janim.imports import RIGHT
+
+        for i in range(10):
+            self.text.points.shift(RIGHT * 0.1)
+
+    def time_edit_chars(self):
+        self._edit_chars()
+
+    def time_edit_chars_batched(self):
+        with self.text.batch_edit():
+            self._edit_chars()
+
+    def _edit_chars(self):
+        from janim.imports import DOWN, RED, UP, TextChar
+
+        for char in self.text.walk_descendants(TextChar):
+            char.points.shift(UP * 0.1)
+            char.color.set(RED)
+            char.points.shift(DOWN * 0.1)
+
+
+class Time_TextRender_2000:
+    '''
+    含有 2000 个字符的 :class:`~.Text` 的渲染，其中的字符会被合并为一次绘制
+    '''
+    def setup(self):
+        from janim.imports import RIGHT, Text
+
+        string = ''.join(chr(ord('a') + i % 26) for i in range(2000))
+        string = '\n'.join(string[i: i + 80] for i in range(0, len(string), 80))
+
+        class TextRender2000(Timeline):
+            def construct(self):
+                text = Text(string).show()
+                self.forward()
+                self.play(text.anim.points.shift(RIGHT).rotate(0.3))
+
+        with Config(fps=10):
+            self.built = TextRender2000().build(quiet=True)
+
+        # 先渲染一次，使得之后计时的部分不包含首次创建缓冲区等开销
+        self.built.capture(0)
+
+    def time_render_static(self):
+        for i in range(10):
+            self.built.capture(i / 10)
+
+    def time_render_moving(self):
+        for i in range(10):
+            self.built.capture(1 + i / 10)
+
+
+class Time_VItemBatch_10k:
+    '''
+    含有 10^4 个图形的 :class:`~.VItemBatch` 的构建、插值与渲染
+    '''
+    def setup(self):
+        import numpy as np
+
+        from janim.imports import (BatchUpdater, Circle, Square, Transform,
+                                   VItemBatch)
+
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(-4, 4, (10_000, 3))
+        positions[:, 2] = 0
+
+        def create_batches() -> tuple[VItemBatch, VItemBatch]:
+            circles = VItemBatch.from_template(Circle(radius=0.03, fill_alpha=1), positions)
+            squares = VItemBatch.from_template(Square(side_length=0.05, fill_alpha=1), positions[::-1])
+            return circles, squares
+
+        def wave(arrays, p):
+            arrays.points[:, 1] += 0.2 * np.sin(arrays.points[:, 0] + p.global_t)
+
+        class VItemBatch10k(Timeline):
+            def construct(self):
+                circles, squares = create_batches()
+                self.play(Transform(circles, squares))
+                self.play(BatchUpdater(squares, wave))
+
+        self.timeline_cls = VItemBatch10k
+        self.circles, self.squares = create_batches()
+
+        with Config(fps=10):
+            self.built = VItemBatch10k().build(quiet=True)
+
+        # 先渲染一次，使得之后计时的部分不包含首次创建缓冲区等开销
+        self.built.capture(0)
+
+    def time_align_for_interpolate(self):
+        self.circles.align_for_interpolate(self.circles, self.squares)
+
+    def time_build(self):
+        with Config(fps=10):
+            self.timeline_cls().build(quiet=True)
+
+    def time_render(self):
+        for i in range(10):
+            self.built.capture(i / 5)
+
+
+class Mem_Items:
+    '''
+    大量物件的内存占用
+    '''
+    def peakmem_dots_20k(self):
+        from janim.imports import Dot, Group
+
+        group = Group(*[Dot() for _ in range(20_000)])
+        group.points.box
+        group.copy()
@@ -171,6 +171,11 @@ def tool_parser(parser: ArgumentParser) -> None:
         nargs='*',
         help=_('Tool(s) that you want to use')
     )
+    parser.add_argument(
+        '--rebuild-index',
+        action='store_true',
+        help=_('Rebuild the font index by reading all the system fonts again')
+    )
     parser.set_defaults(func=tool)
 
 
@@ -59,7 +59,7 @@ class ShowPartial(DataUpdater):
                 cmpt.pointwise_become_partial(cmpt, lower, higher)     # pragma: no cover
             else:
                 end_indices = np.array(cmpt.get_subpath_end_indices())
-                begin_indices = np.array([0, *[indice + 2 for indice in end_indices[:-1]]])
+                begin_indices = np.r_[0, end_indices[:-1] + 2]
 
                 points = cmpt.get()
                 cond1 = np.isclose(points[begin_indices], points[end_indices]).all(axis=1)
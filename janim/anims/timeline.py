@@ -13,6 +13,7 @@ from collections import defaultdict
 from contextlib import nullcontext
 from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Iterable, Self, overload
 
 import moderngl as mgl
@@ -38,7 +39,7 @@ from janim.items.svg.typst import TypstText
 from janim.items.text import Text
 from janim.locale.i18n import get_local_strings
 from janim.logger import log
-from janim.render.base import RenderData, Renderer, create_context
+from janim.render.base import RenderData, Renderer, get_standalone_context
 from janim.render.framebuffer import (FRAME_BUFFER_BINDING, blend_context,
                                       create_framebuffer, uniforms)
 from janim.render.uniform import get_uniforms_context_var
@@ -609,6 +610,14 @@ class Timeline(metaclass=ABCMeta):
                 self.renderer = data.create_renderer()
             self.renderer.render(data)
 
+        def render_merged(self, datas: list[Item], data: Item) -> None:
+            '''
+            使用 ``data`` 的渲染器一次绘制 ``datas`` 中的物件，参考 :meth:`~.Item._get_mergeable_apprs`
+            '''
+            if self.renderer is None:
+                self.renderer = data.create_renderer()
+            self.renderer.render_merged(data, datas)
+
     # region ItemAppearance.stack
 
     def track(self, item: Item) -> None:
@@ -916,6 +925,16 @@ class BuiltTimeline:
     def current_camera_info(self) -> CameraInfo:
         return self.timeline.compute_item(self.timeline.camera, self._time, True).points.info
 
+    def align_t_for_render(self, global_t: float) -> float:
+        '''
+        得到渲染 ``global_t`` 时刻的画面时实际使用的时间
+        '''
+        global_t = self.timeline.time_aligner.align_t_for_render(global_t)
+        # 使得最后一帧采用略提早一点点的时间渲染，使得一些结束在结尾的动画不突变
+        if global_t == self.duration:
+            global_t -= 1e-4
+        return global_t
+
     def render_all(self, ctx: mgl.Context, global_t: float, *, blend_on: bool = True) -> None:
         '''
         渲染所有可见物件
@@ -923,10 +942,7 @@ class BuiltTimeline:
         blending = not blend_on and not get_uniforms_context_var(ctx).get().get('JA_BLENDING')
 
         timeline = self.timeline
-        global_t = timeline.time_aligner.align_t_for_render(global_t)
-        # 使得最后一帧采用略提早一点点的时间渲染，使得一些结束在结尾的动画不突变
-        if global_t == self.duration:
-            global_t -= 1e-4
+        global_t = self.align_t_for_render(global_t)
         self._time = global_t
         try:
             with ContextSetter(Animation.global_t_ctx, global_t),   \
@@ -964,16 +980,31 @@ class BuiltTimeline:
                         if not rcc.t_range.at <= global_t < rcc.t_range.end:
                             continue
                         additional.append(rcc.func())
+                    # 记录可以被合并到其它物件的渲染器中进行绘制的物件，例如 Text 中的字符
+                    merge_owners: dict[Timeline.ItemAppearance, tuple[Timeline.ItemAppearance, Item]] = {}
+                    for appr, data in render_datas:
+                        if appr.render_disabled:
+                            continue
+                        owner = (appr, data)
+                        for sub_appr in data._get_mergeable_apprs():
+                            merge_owners.setdefault(sub_appr, owner)
                     # 剔除被标记 render_disabled 的物件，得到 render_items_final
                     render_datas_final: list[tuple[Item, Callable]] = []
+                    data_owners: dict[Item, tuple[Timeline.ItemAppearance, Item]] = {}
                     for appr, data in render_datas:
                         if appr.render_disabled:
                             appr.render_disabled = False    # 重置，因为每次都要重新标记
                             continue
                         render_datas_final.append((data, appr.render))
+                        owner = merge_owners.get(appr, None)
+                        if owner is not None:
+                            data_owners[data] = owner
                     render_datas_final.extend(it.chain(*additional))
                     # 按深度排序
                     render_datas_final.sort(key=lambda x: x[0].depth, reverse=True)
+                    # 排序后相邻的、属于同一个物件的可合并物件，合并为一次绘制，这样不会改变绘制的先后顺序
+                    if data_owners:
+                        render_datas_final = self.merge_render_datas(render_datas_final, data_owners)
                     # 渲染
                     for data, render in render_datas_final:
                         render(data)
@@ -985,15 +1016,40 @@ class BuiltTimeline:
         except Exception:
             traceback.print_exc()
 
+    @staticmethod
+    def merge_render_datas(
+        render_datas: list[tuple[Item, Callable]],
+        data_owners: dict[Item, tuple[Timeline.ItemAppearance, Item]]
+    ) -> list[tuple[Item, Callable]]:
+        '''
+        将 ``render_datas`` 中相邻的、在 ``data_owners`` 中对应同一个物件的部分，
+        替换为对该物件的 :meth:`~.Timeline.ItemAppearance.render_merged` 的一次调用
+        '''
+        result: list[tuple[Item, Callable]] = []
+        i = 0
+        while i < len(render_datas):
+            owner = data_owners.get(render_datas[i][0], None)
+            j = i + 1
+            if owner is not None:
+                while j < len(render_datas) and data_owners.get(render_datas[j][0], None) is owner:
+                    j += 1
+
+            if j - i == 1:
+                result.append(render_datas[i])
+            else:
+                owner_appr, owner_data = owner
+                datas = [data for data, render in render_datas[i:j]]
+                result.append((owner_data, partial(owner_appr.render_merged, datas)))
+            i = j
+
+        return result
+
     capture_ctx: mgl.Context | None = None
     capture_fbo: mgl.Framebuffer | None = None
 
     def capture(self, global_t: float) -> Image.Image:
         if BuiltTimeline.capture_ctx is None:
-            try:
-                BuiltTimeline.capture_ctx = create_context(standalone=True, require=430)
-            except ValueError:
-                BuiltTimeline.capture_ctx = create_context(standalone=True, require=330)
+            BuiltTimeline.capture_ctx = get_standalone_context()
 
             pw, ph = self.cfg.pixel_width, self.cfg.pixel_height
             BuiltTimeline.capture_fbo = create_framebuffer(BuiltTimeline.capture_ctx, pw, ph)
@@ -4,8 +4,9 @@ import inspect
 from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Self
+from typing import TYPE_CHECKING, Any, Callable, Self
 
+import numpy as np
 from tqdm import tqdm as ProgressDisplay
 
 from janim.anims.anim_stack import AnimStack
@@ -22,6 +23,9 @@ from janim.render.base import Renderer
 from janim.utils.rate_functions import RateFunc, linear
 from janim.utils.simple_functions import clip
 
+if TYPE_CHECKING:
+    from janim.items.vitem_batch import BatchArrays, VItemBatch
+
 _ = get_local_strings('updater')
 
 
@@ -67,6 +71,7 @@ class StepUpdaterParams:
 updater_params_ctx: ContextVar[UpdaterParams] = ContextVar('updater_params_ctx')
 
 type DataUpdaterFn[T] = Callable[[T, UpdaterParams], Any]
+type BatchUpdaterFn = Callable[[BatchArrays, UpdaterParams], Any]
 type GroupUpdaterFn[T] = Callable[[T, UpdaterParams], Any]
 type ItemUpdaterFn = Callable[[UpdaterParams], Item]
 type StepUpdaterFn[T] = Callable[[T, UpdaterParams], Any]
@@ -204,6 +209,48 @@ class _DataUpdater(ItemAnimation):
         return clip((value - lower), 0, 1)
 
 
+class BatchUpdater(DataUpdater['VItemBatch']):
+    '''
+    以数组的形式对 :class:`~.VItemBatch` 中的所有图形进行修改的 :class:`DataUpdater`
+
+    ``func`` 接收 :class:`~.BatchArrays` 与 :class:`UpdaterParams`，对其中的数组进行原地修改即可，例如：
+
+    .. code-block:: python
+
+        def wave(arrays: BatchArrays, p: UpdaterParams) -> None:
+            x = arrays.centers[arrays.shape_indices, 0]
+            arrays.points[:, 1] += 0.5 * np.sin(2 * x + p.global_t)
+            arrays.fill[:, 3] = arrays.alphas
+
+        self.play(BatchUpdater(dots, wave, lag_ratio=0.01))
+
+    与 :class:`DataUpdater` 不同，这里的 ``lag_ratio`` 作用于批量物件中的每个图形，
+    每个图形各自的进度记录在 ``arrays.alphas`` 中，而 ``p.alpha`` 仍然是整体的进度
+    '''
+    def __init__(
+        self,
+        item: VItemBatch,
+        func: BatchUpdaterFn,
+        *,
+        lag_ratio: float = 0,
+        **kwargs
+    ):
+        super().__init__(item, self._apply_arrays, **kwargs)
+        self.batch_func = func
+        self.shape_lag_ratio = lag_ratio
+
+    def _apply_arrays(self, data: VItemBatch, p: UpdaterParams) -> None:
+        arrays = data.get_arrays()
+
+        # 与 _DataUpdater.get_sub_alpha 的计算一致，只是对所有图形一起计算
+        count = len(arrays.alphas)
+        full_length = (count - 1) * self.shape_lag_ratio + 1
+        arrays.alphas = np.clip(p.alpha * full_length - np.arange(count) * self.shape_lag_ratio, 0, 1)
+
+        self.batch_func(arrays, p)
+        data.set_arrays(arrays)
+
+
 class GroupUpdater[T: Item](Animation):
     '''
     以时间为参数对一组物件的数据进行修改
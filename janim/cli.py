@@ -191,6 +191,18 @@ def write(args: Namespace) -> None:
 
 
 def tool(args: Namespace) -> None:
+    if args.rebuild_index:
+        from janim.utils.font.database import get_database
+
+        t = time.time()
+        db = get_database(rebuild_index=True)
+        log.info(
+            _('Rebuilt the font index with {count} fonts in {time:.2f} s')
+            .format(count=len(db.font_by_full_name), time=time.time() - t)
+        )
+        if not args.tool_name:
+            return
+
     if not args.tool_name:
         log.error(_('No tool specified for use'))
         return
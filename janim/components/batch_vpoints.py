@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+from typing import Iterable, Self
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+import janim.utils.refresh as refresh
+from janim.components.points import Cmpt_Points
+from janim.components.vpoints import Cmpt_VPoints
+from janim.constants import OUT
+from janim.typing import Vect, VectArray
+from janim.utils.data import AlignedData, Array
+from janim.utils.iterables import resize_preserving_order
+from janim.utils.bezier import partial_quadratic_bezier_curves
+from janim.utils.space_ops import normalize
+
+# 批量对齐图形时，每次计算的候选值数量的上限
+MAX_BATCH_CANDIDATES = 1_000_000
+
+type ShapeKey = int | slice | Iterable[int] | Iterable[bool] | np.ndarray
+
+
+class Cmpt_BatchVPoints[ItemT](Cmpt_VPoints[ItemT], impl=True):
+    '''
+    批量图形的曲线点坐标数据，用于 :class:`~.VItemBatch`
+
+    - 所有图形的点坐标连续地存放在同一个数组中，相邻的图形之间以 ``NAN_POINT`` 分隔，
+      也就是说，从 :class:`~.Cmpt_VPoints` 的角度来看，每个图形都是一段（或多段）子路径
+
+    - 另外记录每个图形的点数量 :meth:`get_shape_counts`，由此得到每个图形在数组中的位置，
+      因此单个图形也可以由多段子路径组成（例如圆环）
+
+    - 使用 :meth:`set` 直接设置点坐标时，如果点的数量与原先一致，则保留原先的图形划分，
+      否则会将每段子路径视为一个图形；需要指定图形划分时请使用 :meth:`set_shapes`
+    '''
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._counts = Array(dtype=np.int64)
+
+    def copy(self) -> Self:
+        cmpt_copy = super().copy()
+        cmpt_copy._counts = self._counts.copy()
+        return cmpt_copy
+
+    def become(self, other: Cmpt_BatchVPoints) -> Self:
+        if not self._counts.is_share(other._counts):
+            self._counts = other._counts.copy()
+        super().become(other)
+        return self
+
+    def not_changed(self, other: Cmpt_BatchVPoints) -> bool:
+        return super().not_changed(other) and self._counts.is_share(other._counts)
+
+    # region align
+
+    @classmethod
+    def align_for_interpolate(cls, cmpt1: Cmpt_BatchVPoints, cmpt2: Cmpt_BatchVPoints) -> AlignedData[Self]:
+        cmpt1_copy = cmpt1.copy()
+        cmpt2_copy = cmpt2.copy()
+
+        if cmpt1_copy.not_changed(cmpt2_copy):
+            return AlignedData(cmpt1_copy, cmpt2_copy, cmpt1_copy.copy())
+
+        # 图形数量不同时，重复数量较少一方的图形，使得数量一致
+        n1, n2 = cmpt1.get_shape_count(), cmpt2.get_shape_count()
+        if n1 != n2:
+            for cmpt, other, n in ((cmpt1_copy, cmpt2, n1), (cmpt2_copy, cmpt1, n2)):
+                if n == 0:
+                    cmpt.set_shapes(other.get_shape_centers()[:, np.newaxis])
+                elif n < max(n1, n2):
+                    cmpt.select(cls.get_resize_indices(n, max(n1, n2)))
+
+        # 只需要对点数量不同的图形进行对齐，同类图形的批量一般不需要这一步
+        counts1, counts2 = cmpt1_copy.get_shape_counts(), cmpt2_copy.get_shape_counts()
+        mismatched = np.flatnonzero(counts1 != counts2)
+        if len(mismatched) != 0:
+            shapes1 = cmpt1_copy.get_shapes()
+            shapes2 = cmpt2_copy.get_shapes()
+
+            # 都只有单个路径的图形，按照点数量分组后批量对齐，其余的逐个对齐
+            single = cmpt1_copy.get_single_path_flags()[mismatched] & cmpt2_copy.get_single_path_flags()[mismatched]
+            for idx in mismatched[~single]:
+                shapes1[idx], shapes2[idx] = cls.align_shape(shapes1[idx], shapes2[idx])
+
+            pairs = np.column_stack([counts1[mismatched[single]], counts2[mismatched[single]]])
+            for (c1, c2), group in zip(*cls.group_by_rows(pairs, mismatched[single])):
+                if c1 < c2:
+                    cls.replace_shapes(shapes1, group, cls.insert_n_curves_to_shapes((c2 - c1) // 2, shapes1, group))
+                else:
+                    cls.replace_shapes(shapes2, group, cls.insert_n_curves_to_shapes((c1 - c2) // 2, shapes2, group))
+
+            cmpt1_copy.set_shapes(shapes1)
+            cmpt2_copy.set_shapes(shapes2)
+
+        return AlignedData(cmpt1_copy, cmpt2_copy, cmpt1_copy.copy())
+
+    @staticmethod
+    def get_resize_indices(n: int, length: int) -> np.ndarray:
+        '''
+        将 ``n`` 个图形扩充到 ``length`` 个时，每个位置所对应的原图形下标，与 :func:`~.resize_preserving_order` 一致
+        '''
+        return resize_preserving_order(np.arange(n), length)
+
+    @staticmethod
+    def align_shape(shape1: np.ndarray, shape2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        对齐单个图形的点坐标，与 :meth:`Cmpt_VPoints.align_for_interpolate` 的处理一致
+        '''
+        cmpt1 = Cmpt_VPoints()
+        cmpt2 = Cmpt_VPoints()
+        cmpt1.set(shape1)
+        cmpt2.set(shape2)
+        aligned = Cmpt_VPoints.align_for_interpolate(cmpt1, cmpt2)
+        return aligned.data1.get(), aligned.data2.get()
+
+    @staticmethod
+    def group_by_rows(keys: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+        '''
+        按照 ``keys`` 的每一行对 ``values`` 进行分组
+        '''
+        if len(keys) == 0:
+            return np.zeros((0, keys.shape[1]), dtype=keys.dtype), []
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(inverse.reshape(-1), kind='stable')
+        splits = np.cumsum(np.bincount(inverse.reshape(-1)))[:-1]
+        return unique, np.split(values[order], splits)
+
+    @staticmethod
+    def replace_shapes(shapes: list[np.ndarray], indices: np.ndarray, new_shapes: np.ndarray) -> None:
+        for idx, shape in zip(indices, new_shapes):
+            shapes[idx] = shape
+
+    @staticmethod
+    def insert_n_curves_to_shapes(n: int, shapes: list[np.ndarray], indices: np.ndarray) -> np.ndarray:
+        '''
+        :meth:`Cmpt_VPoints.insert_n_curves_to_point_list` 的批量版本，对 ``shapes`` 中 ``indices`` 所指的图形进行处理，
+        这些图形的点数量需要相同，返回形如 ``(len(indices), 点数量 + 2 * n, 3)`` 的数组
+        '''
+        points = np.stack([shapes[idx] for idx in indices])
+        if points.shape[1] == 1:
+            return np.repeat(points, 2 * n + 1, axis=1)
+
+        m = points.shape[1] // 2
+        curves = points[:, np.arange(m)[:, np.newaxis] * 2 + np.arange(3)]
+
+        # 分批计算，避免候选值数组占用过多内存
+        step = max(1, MAX_BATCH_CANDIDATES // (m * n))
+        ipc = np.vstack([
+            Cmpt_BatchVPoints.get_insertions_per_curve_of_shapes(n, curves[i: i + step])
+            for i in range(0, len(curves), step)
+        ])
+
+        # 以下与 Cmpt_VPoints.insert_n_curves_to_point_list 的处理一致，只是所有图形的曲线一起计算
+        curves = curves.reshape(-1, 3, 3)
+        ipc = ipc.reshape(-1)
+        n_parts = ipc + 1
+        offsets = np.r_[0, np.cumsum(n_parts)[:-1]]
+        a = np.empty(n_parts.sum())
+        b = np.empty(n_parts.sum())
+        for n_inserts in np.unique(ipc):
+            alphas = np.linspace(0, 1, n_inserts + 2)
+            part_indices = offsets[ipc == n_inserts, np.newaxis] + np.arange(n_inserts + 1)
+            a[part_indices] = alphas[:-1]
+            b[part_indices] = alphas[1:]
+
+        parts = partial_quadratic_bezier_curves(np.repeat(curves, n_parts, axis=0), a, b)
+        parts = parts.reshape(len(points), m + n, 3, 3)
+        return np.concatenate([points[:, :1], parts[:, :, 1:].reshape(len(points), -1, 3)], axis=1)
+
+    @staticmethod
+    def get_insertions_per_curve_of_shapes(n: int, curves: np.ndarray) -> np.ndarray:
+        '''
+        :meth:`Cmpt_VPoints.get_insertions_per_curve` 的批量版本，``curves`` 形如 ``(图形数量, 曲线数量, 3, 3)``
+        '''
+        s, m = curves.shape[:2]
+
+        diff = curves[:, :, 2] - curves[:, :, 0]
+        norms = np.sqrt(diff[..., 0]**2 + diff[..., 1]**2 + diff[..., 2]**2)
+
+        # 第 k 次插入时的候选值，长度为 0 的曲线不参与分配
+        values = np.empty((s, m, n), dtype=norms.dtype)
+        values[:, :, 0] = norms
+        for k in range(1, n):
+            values[:, :, k] = values[:, :, k - 1] * (k / (k + 1))
+        values[norms == 0] = -np.inf
+
+        # 按曲线顺序排列后使用稳定排序，使得值相同时优先分配给下标小的曲线；
+        # 所有曲线长度都为 0 时，结果是全部插入到第一段中，与逐个计算一致
+        chosen = np.argsort(-values.reshape(s, m * n), axis=1, kind='stable')[:, :n] // n
+        chosen += np.arange(s)[:, np.newaxis] * m
+        return np.bincount(chosen.reshape(-1), minlength=s * m).reshape(s, m)
+
+    # endregion
+
+    # region 点数据 | Points
+
+    def set(self, points: VectArray) -> Self:
+        if not isinstance(points, np.ndarray):
+            points = np.array(points)
+        if points.size == 0:
+            points = np.zeros((0, 3))
+        if len(points) % 2 == 0 and len(points) != 0:
+            # 与 Cmpt_VPoints.set 一致，最后一个点会被忽略
+            points = points[:-1]
+
+        counts = self._counts.data
+        if counts.sum() + max(len(counts) - 1, 0) != len(points):
+            self._counts.data = self.get_subpath_counts_from_points(points)
+
+        super().set(points)
+        return self
+
+    @staticmethod
+    def get_subpath_counts_from_points(points: np.ndarray) -> np.ndarray:
+        '''
+        得到每段子路径的点数量
+        '''
+        if len(points) == 0:
+            return np.zeros(0, dtype=np.int64)
+        end_indices = np.append(np.flatnonzero(np.isnan(points[1::2, 0])) * 2, len(points) - 1)
+        start_indices = np.append(0, end_indices[:-1] + 2)
+        return end_indices - start_indices + 1
+
+    def set_shapes(self, shapes: Iterable[VectArray]) -> Self:
+        '''
+        设置每个图形的点坐标，每个图形的点数量需要为奇数
+
+        例如 ``.set_shapes([shape1_points, shape2_points, ...])``
+        '''
+        shapes = [np.asarray(shape, dtype=float).reshape(-1, 3) for shape in shapes]
+        counts = np.array([len(shape) for shape in shapes], dtype=np.int64)
+        if len(shapes) == 0:
+            points = np.zeros((0, 3))
+        else:
+            sep = np.full((1, 3), np.nan)
+            points = np.vstack([part for shape in shapes for part in (sep, shape)][1:])
+
+        self._counts.data = counts
+        super().set(points)
+        return self
+
+    def set_shapes_by_array(self, shapes: np.ndarray) -> Self:
+        '''
+        与 :meth:`set_shapes` 相同，但是传入的是形如 ``(图形数量, 每个图形的点数量, 3)`` 的数组，
+        也就是所有图形的点数量相同，这样可以避免逐个图形的处理
+        '''
+        shapes = np.asarray(shapes)
+        n, count = shapes.shape[:2]
+        if n == 0:
+            return self.set_shapes([])
+
+        points = np.full((n, count + 1, 3), np.nan)
+        points[:, :count] = shapes
+
+        self._counts.data = np.full(n, count, dtype=np.int64)
+        super().set(points.reshape(-1, 3)[:-1])
+        return self
+
+    def get_shape_count(self) -> int:
+        '''
+        得到图形的数量
+        '''
+        return self._counts.len()
+
+    def get_shape_counts(self) -> np.ndarray:
+        '''
+        得到每个图形的点数量
+        '''
+        return self._counts.data
+
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
+    def get_shape_starts(self) -> np.ndarray:
+        '''
+        得到每个图形的起始点在 :meth:`get` 中的下标
+        '''
+        counts = self._counts.data
+        return np.append(0, np.cumsum(counts + 1)[:-1])
+
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
+    def get_shape_indices(self) -> np.ndarray:
+        '''
+        得到每个点所属的图形的下标，结果长度与点数量相同
+
+        图形之间分隔用的 ``NAN_POINT`` 被视为属于前一个图形
+        '''
+        counts = self._counts.data
+        return np.repeat(np.arange(len(counts)), counts + 1)[:len(self.get())]
+
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
+    def get_single_path_flags(self) -> np.ndarray:
+        '''
+        得到每个图形是否只由单段子路径组成
+        '''
+        is_sep = np.full(len(self.get()), False)
+        is_sep[1::2] = np.isnan(self.get()[1::2, 0])
+        # 图形之间的分隔被视为属于前一个图形，所以除了最后一个图形以外都会多计入一次
+        sep_counts = np.bincount(self.get_shape_indices()[is_sep], minlength=self.get_shape_count())
+        sep_counts[:-1] -= 1
+        return sep_counts == 0
+
+    def get_shape(self, index: int) -> np.ndarray:
+        '''
+        得到第 ``index`` 个图形的点坐标
+        '''
+        start = self.get_shape_starts()[index]
+        return self.get()[start: start + self._counts.data[index]]
+
+    def get_shapes(self) -> list[np.ndarray]:
+        '''
+        得到每个图形的点坐标列表
+        '''
+        points = self.get()
+        return [
+            points[start: start + count]
+            for start, count in zip(self.get_shape_starts(), self._counts.data)
+        ]
+
+    def select(self, key: ShapeKey) -> Self:
+        '''
+        只保留 ``key`` 所选中的图形，``key`` 可以是下标、切片、下标列表或布尔列表
+        '''
+        indices = np.arange(self.get_shape_count())[self.format_shape_key(key)]
+        counts = self._counts.data[indices]
+        if len(indices) == 0:
+            return self.set_shapes([])
+
+        # 连同图形后面分隔用的 NAN_POINT 一并取出，最后再去掉末尾多余的一个
+        starts = self.get_shape_starts()[indices]
+        point_indices = np.repeat(starts - np.cumsum(np.append(0, counts[:-1] + 1)), counts + 1)
+        point_indices += np.arange(len(point_indices))
+
+        points = np.vstack([self.get(), np.full((1, 3), np.nan)])[point_indices[:-1]]
+
+        self._counts.data = counts
+        super().set(points)
+        return self
+
+    @staticmethod
+    def format_shape_key(key: ShapeKey) -> int | slice | np.ndarray:
+        if isinstance(key, (int, np.integer)):
+            return np.array([key])
+        if isinstance(key, slice):
+            return key
+        return np.asarray(list(key) if not isinstance(key, np.ndarray) else key)
+
+    # endregion
+
+    # region 图形的包围框 | Shape boxes
+
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
+    def get_shape_boxes(self) -> np.ndarray:
+        '''
+        得到每个图形的包围框，结果形如 ``(图形数量, 2, 3)``，其中 ``[:, 0]`` 是最小值，``[:, 1]`` 是最大值
+        '''
+        if self.get_shape_count() == 0:
+            return np.zeros((0, 2, 3))
+        points = self.get()
+        starts = self.get_shape_starts()
+        # fmin 与 fmax 会忽略分隔用的 NAN_POINT
+        return np.stack([
+            np.fmin.reduceat(points, starts),
+            np.fmax.reduceat(points, starts)
+        ], axis=1)
+
+    def get_shape_centers(self) -> np.ndarray:
+        '''
+        得到每个图形包围框的中心
+        '''
+        return self.get_shape_boxes().mean(axis=1)
+
+    # endregion
+
+    # region 逐图形变换 | Per-shape transforms
+
+    def _expand(self, values: float | VectArray, shape: tuple[int, ...]) -> np.ndarray:
+        '''
+        将单个值或每个图形各自的值，扩展为每个点各自的值
+        '''
+        values = np.broadcast_to(values, (self.get_shape_count(), *shape))
+        return values[self.get_shape_indices()]
+
+    def shift_shapes(self, vectors: Vect | VectArray) -> Self:
+        '''
+        平移每个图形，``vectors`` 可以是单个向量，也可以是每个图形各自的向量
+        '''
+        self.set(self.get() + self._expand(vectors, (3,)))
+        return self
+
+    def move_shapes_to(self, positions: Vect | VectArray) -> Self:
+        '''
+        将每个图形包围框的中心移动到 ``positions``
+        '''
+        return self.shift_shapes(np.asarray(positions) - self.get_shape_centers())
+
+    def scale_shapes(self, factors: float | Iterable[float] | VectArray) -> Self:
+        '''
+        以每个图形包围框的中心为基准缩放每个图形
+
+        ``factors`` 可以是单个数值，也可以是每个图形各自的数值，或者是每个图形在 xyz 三个方向上各自的缩放倍数
+        '''
+        factors = np.asarray(factors, dtype=float)
+        if factors.ndim == 1 and len(factors) == self.get_shape_count():
+            factors = factors[:, np.newaxis]
+
+        centers = self._expand(self.get_shape_centers(), (3,))
+        self.set((self.get() - centers) * self._expand(factors, (3,)) + centers)
+        return self
+
+    def rotate_shapes(self, angles: float | Iterable[float], axis: Vect = OUT) -> Self:
+        '''
+        以每个图形包围框的中心为基准，绕 ``axis`` 旋转每个图形
+
+        ``angles`` 可以是单个角度，也可以是每个图形各自的角度
+        '''
+        if self.get_shape_count() == 0:
+            return self
+        angles = np.broadcast_to(np.asarray(angles, dtype=float), self.get_shape_count())
+        matrices = Rotation.from_rotvec(angles[:, np.newaxis] * normalize(axis)).as_matrix()
+
+        centers = self._expand(self.get_shape_centers(), (3,))
+        rotated = np.einsum('nij,nj->ni', matrices[self.get_shape_indices()], self.get() - centers)
+        self.set(rotated + centers)
+        return self
+
+    # endregion
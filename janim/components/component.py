@@ -38,7 +38,7 @@ class _CmptMeta(type):
 
 
 class Component[ItemT](refresh.Refreshable, metaclass=_CmptMeta):
-    @dataclass
+    @dataclass(slots=True)
     class BindInfo:
         '''
         对组件定义信息的封装
@@ -94,14 +94,16 @@ class Component[ItemT](refresh.Refreshable, metaclass=_CmptMeta):
         # 与 super().mark_refresh(func) 等价，这样写是为了尽可能优化性能
         refresh.Refreshable.mark_refresh(self, func)
 
-        if self.bind is not None:
+        if (recurse_up or recurse_down) and self.bind is not None:
             self.bind.at_item.broadcast_refresh_of_component(self, func, recurse_up, recurse_down)
 
     def copy(self) -> Self:
         cmpt_copy = copy.copy(self)
         # cmpt_copy.bind = None
         cmpt_copy.reset_refresh()
-        setattr(cmpt_copy, SIGNAL_OBJ_SLOTS_NAME, None)
+        # 只在确实有信号记录时才重置，避免给实例额外增加属性
+        if getattr(cmpt_copy, SIGNAL_OBJ_SLOTS_NAME, None) is not None:
+            setattr(cmpt_copy, SIGNAL_OBJ_SLOTS_NAME, None)
         return cmpt_copy
 
     def become(self, other) -> Self: ...
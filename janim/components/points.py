@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+from itertools import accumulate
 from typing import Callable, Iterable, Self
 
 import numpy as np
@@ -217,12 +218,16 @@ class Cmpt_Points[ItemT](Component[ItemT]):
         '''
         表示物件（包括后代物件）的矩形包围框
         '''
-        box_datas = [
-            cmpt.self_box.data
+        # 子物件较多时，将所有点合并后一次计算比逐个计算 self_box 快得多
+        cmpts = [
+            cmpt
             for cmpt in self.walk_same_cmpt_of_self_and_descendants_without_mock()
             if cmpt.has()
         ]
-        return self.BoundingBox(np.vstack(box_datas) if box_datas else [])
+        if len(cmpts) == 1:
+            # 只有一个有点的组件时（不一定是自身），直接使用它已缓存的 self_box
+            return cmpts[0].self_box
+        return self.BoundingBox(np.vstack([cmpt.get() for cmpt in cmpts]) if cmpts else [])
 
     @property
     @set.self_refresh
@@ -385,12 +390,16 @@ class Cmpt_Points[ItemT](Component[ItemT]):
         *,
         about_point: Vect | None = None,
         about_edge: Vect | None = ORIGIN,
-        root_only: bool = False
+        root_only: bool = False,
+        pointwise: bool = False
     ) -> Self:
         '''
         将所有点作为单独的一个参数传入 ``func``，并将 ``func`` 返回的结果作为新的点坐标数据
 
         视 ``about_point`` 为原点，若其为 ``None``，则将物件在 ``about_edge`` 方向上的边界作为 ``about_point``
+
+        如果 ``func`` 对每个点的作用互不影响（例如平移、旋转、缩放），可以传入 ``pointwise=True``，
+        此时会将自己以及后代物件的所有点合并起来只调用一次 ``func``，对于有大量子物件的物件（例如文字）会快很多
         '''
         if about_point is None and about_edge is not None:
             if root_only:
@@ -398,7 +407,17 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             else:
                 about_point = self.box.get(about_edge)
 
-        for cmpt in self.walk_same_cmpt_of_self_and_descendants_without_mock(root_only):
+        cmpts = list(self.walk_same_cmpt_of_self_and_descendants_without_mock(root_only))
+
+        batch = _PointsFnBatch.current
+        if batch is not None and batch.defer(self, cmpts, func, about_point):
+            return self
+
+        if pointwise and len(cmpts) > 1:
+            _PointsFnBatch(func, about_point).run(cmpts)
+            return self
+
+        for cmpt in cmpts:
             if cmpt.has():
                 if about_point is None:
                     cmpt.set(func(cmpt.get()))
@@ -424,7 +443,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             lambda points: np.array([func(p) for p in points]),
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
         return self
 
@@ -457,7 +477,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             lambda points: points @ full_matrix.T,
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
 
         return self
@@ -511,7 +532,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             lambda points: points @ rot_matrix_T,
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
         return self
 
@@ -568,7 +590,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             lambda points: scale_factor * points,
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
         return self
 
@@ -600,7 +623,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             func,
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
         return self
 
@@ -823,7 +847,8 @@ class Cmpt_Points[ItemT](Component[ItemT]):
         self.apply_points_fn(
             lambda points: points + vector,
             about_edge=None,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=True
         )
         return self
 
@@ -1188,3 +1213,90 @@ class Cmpt_Points[ItemT](Component[ItemT]):
 
     def set_z(self, z: float, direction: Vect = ORIGIN) -> Self:
         return self.set_coord(z, dim=2, direction=direction)
+
+
+class _PointsFnBatch:
+    '''
+    :meth:`Cmpt_Points.apply_points_fn` 在 ``pointwise=True`` 时的批量处理
+
+    - 将所有组件的点合并起来只调用一次 ``func``，再按原来的长度拆分回各个组件
+    - 在此期间，通过 ``Cmpt_Points.apply_points_fn`` 信号连接的、使用相同 ``func`` 与 ``about_point`` 的变换
+      （例如 :class:`~.TextChar` 的 ``mark``）会被收集起来，在下一轮中一并处理，而不是每个组件各自调用一次
+    '''
+    current: _PointsFnBatch | None = None
+
+    def __init__(self, func: PointsFn, about_point: Vect | None):
+        self.func = func
+        self.about_point = about_point
+        self.pending: list[Cmpt_Points] = []
+        self.pending_ids: set[int] = set()
+
+    def defer(
+        self,
+        cmpt: Cmpt_Points,
+        cmpts: list[Cmpt_Points],
+        func: PointsFn,
+        about_point: Vect | None
+    ) -> bool:
+        '''
+        尝试将 ``cmpts`` 留到下一轮处理，返回是否成功
+        '''
+        if func is not self.func:
+            return False
+        # 子类可能会在变换后进行额外的处理（例如 Cmpt_VPoints 的 make_approximately_smooth），所以不能延后
+        if type(cmpt).apply_points_fn is not Cmpt_Points.apply_points_fn:
+            return False
+        if about_point is None or self.about_point is None:
+            if about_point is not self.about_point:
+                return False
+        elif not np.array_equal(about_point, self.about_point):
+            return False
+
+        ids = {id(item) for item in cmpts}
+        # 同一个组件在一轮中被变换多次时，合并处理会只作用一次，因此这种情况不延后
+        if not ids.isdisjoint(self.pending_ids):
+            return False
+
+        self.pending.extend(cmpts)
+        self.pending_ids.update(ids)
+        return True
+
+    def run(self, cmpts: list[Cmpt_Points]) -> None:
+        prev = _PointsFnBatch.current
+        _PointsFnBatch.current = self
+        # 合并各个组件 set 产生的刷新标记，祖先物件的 box 只需要标记一次
+        try:
+            with Signal.defer_emits():
+                while cmpts:
+                    self.apply(cmpts)
+                    self.pending = []
+                    self.pending_ids = set()
+                    for cmpt in cmpts:
+                        Cmpt_Points.apply_points_fn.emit(cmpt, self.func, self.about_point)
+                    cmpts = self.pending
+        finally:
+            _PointsFnBatch.current = prev
+
+    def apply(self, cmpts: list[Cmpt_Points]) -> None:
+        cmpts = [cmpt for cmpt in cmpts if cmpt.has()]
+        if not cmpts:
+            return
+
+        # 只有一个组件时不需要合并与拆分
+        if len(cmpts) == 1:
+            points = cmpts[0].get()
+        else:
+            points = np.vstack([cmpt.get() for cmpt in cmpts])
+
+        if self.about_point is None:
+            points = self.func(points)
+        else:
+            points = self.func(points - self.about_point) + self.about_point
+
+        if len(cmpts) == 1:
+            cmpts[0].set(points)
+            return
+
+        indices = list(accumulate(cmpt.count() for cmpt in cmpts))[:-1]
+        for cmpt, cmpt_points in zip(cmpts, np.split(np.asarray(points), indices)):
+            cmpt.set(cmpt_points)
@@ -5,6 +5,8 @@ from enum import Enum
 from typing import Callable, Generator, Iterable, Self
 
 import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 
 from janim.utils.paths import PathFunc, straight_path
 import janim.utils.refresh as refresh
@@ -17,8 +19,13 @@ from janim.logger import log
 from janim.typing import Vect, VectArray
 from janim.utils.bezier import (PathBuilder,
                                 approx_smooth_quadratic_bezier_handles, bezier,
-                                integer_interpolate, inverse_interpolate,
+                                curves_and_props_from_proportions,
+                                get_cumulative_lengths,
+                                get_quadratic_bezier_curves,
+                                integer_interpolate,
+                                partial_quadratic_bezier_curves,
                                 partial_quadratic_bezier_points,
+                                quadratic_bezier_points_at,
                                 smooth_quadratic_path)
 from janim.utils.data import AlignedData
 from janim.utils.space_ops import (get_norm, get_unit_normal, normalize,
@@ -26,6 +33,9 @@ from janim.utils.space_ops import (get_norm, get_unit_normal, normalize,
 
 _ = get_local_strings('vpoints')
 
+# 在 Cmpt_VPoints.distribute_subpaths 中，距离矩阵元素数量超过该值时改用 KD 树
+MAX_DISTANCE_MATRIX_SIZE = 1_000_000
+
 
 class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
     '''
@@ -63,13 +73,15 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         *,
         about_point: Vect | None = None,
         about_edge: Vect | None = ORIGIN,
-        root_only: bool = False
+        root_only: bool = False,
+        pointwise: bool = False
     ) -> Self:
         super().apply_points_fn(
             func,
             about_point=about_point,
             about_edge=about_edge,
-            root_only=root_only
+            root_only=root_only,
+            pointwise=pointwise
         )
         for cmpt in self.walk_same_cmpt_of_self_and_descendants_without_mock(root_only):
             if not isinstance(cmpt, Cmpt_VPoints) or not cmpt.make_smooth_after_applying_functions:
@@ -109,57 +121,17 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
                 cmpt1_copy, cmpt2_copy = cmpt2_copy, cmpt1_copy
                 subpaths1, subpaths2 = subpaths2, subpaths1
 
-            # 用于计算相对距离的“中心”
-            # 这里的 ``RIGHT * (i * 1e-5)`` 是为了是有重合的点有所差别，比如可以保证图形字符 “O” 配对时的一致性
-            def center(i: int, points: np.ndarray) -> np.ndarray:
-                min = np.min(points, axis=0)
-                max = np.max(points, axis=0)
-                return (min + max) * 0.5 + RIGHT * (i * 1e-5)
-
-            # 这里的 ``/ .box.width`` 是为了缩放到一致
-            subpaths1_center = np.array([center(i, subpath) for i, subpath in enumerate(subpaths1)])
+            # 用于计算相对距离的“中心”，这里的 ``/ .box.width`` 是为了缩放到一致
+            subpaths1_center = cls.get_subpath_centers(cmpt1_copy)
             subpaths1_center -= cmpt1_copy.box.center
             if cmpt1_copy.box.width != 0:
                 subpaths1_center /= cmpt1_copy.box.width
-            subpaths2_center = np.array([center(i, subpath) for i, subpath in enumerate(subpaths2)])
+            subpaths2_center = cls.get_subpath_centers(cmpt2_copy)
             subpaths2_center -= cmpt2_copy.box.center
             if cmpt2_copy.box.width != 0:
                 subpaths2_center /= cmpt2_copy.box.width
 
-            # 这两个函数使用曼哈顿距离
-            def nearest_idx(point: np.ndarray) -> int:
-                return abs(subpaths2_center - point).sum(axis=1).argmin()
-
-            def sorted_idx(point: np.ndarray) -> Iterable[int]:
-                return abs(subpaths2_center - point).sum(axis=1).argsort()
-
-            type SubPath1Idx = int
-
-            distributions: list[list[SubPath1Idx]] = [[] for _ in range(len(subpaths2))]
-
-            # 将 subpaths1 按照最近原则分配给 subpaths2
-            for idx1, center1 in enumerate(subpaths1_center):
-                distributions[nearest_idx(center1)].append(idx1)
-
-            # 遍历分配结果，如果发现有 subpaths2 中的子路径没有分配到内容，则从其它子路径那边抢一个来
-            for idx2, distri in enumerate(distributions):
-                # 如果有分配到内容，则跳过
-                if distri:
-                    continue
-
-                # 按距离遍历其它的子路径
-                for other_idx in sorted_idx(subpaths2_center[idx2]):
-                    if other_idx == idx2:
-                        continue
-
-                    # 如果其它子路径有两个以上的分配，则从它这里抢一个
-                    other_distri = distributions[other_idx]
-                    if len(other_distri) >= 2:
-                        distri.append(other_distri.pop(0))
-                        break
-
-                # 一定能抢到，所以执行到这里时 distri 应当不为空
-                assert distri
+            distributions = cls.distribute_subpaths(subpaths1_center, subpaths2_center)
 
             # 构建新的子路径
             new_subpaths1 = []
@@ -197,6 +169,69 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
 
         return AlignedData(cmpt1_copy, cmpt2_copy, cmpt1_copy.copy())
 
+    @staticmethod
+    def get_subpath_centers(cmpt: Cmpt_VPoints) -> np.ndarray:
+        '''
+        得到每个子路径包围框的中心，用于 :meth:`align_for_interpolate` 中子路径的配对
+
+        这里的 ``RIGHT * (i * 1e-5)`` 是为了是有重合的点有所差别，比如可以保证图形字符 “O” 配对时的一致性
+        '''
+        points = cmpt.get()
+        end_indices = np.array(cmpt.get_subpath_end_indices())
+        start_indices = np.r_[0, end_indices[:-1] + 2]
+
+        # 每段除了子路径本身外，还包含了其后用于分隔的 NAN_POINT，使用 fmin/fmax 可以忽略它们
+        mins = np.fmin.reduceat(points, start_indices, axis=0)
+        maxs = np.fmax.reduceat(points, start_indices, axis=0)
+        return (mins + maxs) * 0.5 + np.outer(np.arange(len(start_indices)), RIGHT * 1e-5)
+
+    @staticmethod
+    def distribute_subpaths(centers1: np.ndarray, centers2: np.ndarray) -> list[list[int]]:
+        '''
+        将 ``centers1`` 中的每一项按最近原则（曼哈顿距离）分配给 ``centers2``，要求 ``len(centers1) >= len(centers2)``
+
+        如果有 ``centers2`` 中的项没有分配到内容，则按距离从其它分配到两个以上的项那边抢一个来，
+        以保证每一项都至少分配到一个
+
+        返回的列表中，第 ``i`` 项是分配给 ``centers2[i]`` 的 ``centers1`` 下标列表
+
+        数量较少时使用距离矩阵计算最近项，数量较多时使用 KD 树，避免距离矩阵占用过多内存
+        '''
+        n2 = len(centers2)
+
+        if len(centers1) * n2 <= MAX_DISTANCE_MATRIX_SIZE:
+            nearest = cdist(centers1, centers2, 'cityblock').argmin(axis=1)
+        else:
+            nearest = cKDTree(centers2).query(centers1, p=1)[1]
+
+        # 按 nearest 分组，组内保持 centers1 中的顺序
+        counts = np.bincount(nearest, minlength=n2)
+        order = np.argsort(nearest, kind='stable')
+        distributions: list[list[int]] = [
+            group.tolist()
+            for group in np.split(order, np.cumsum(counts)[:-1])
+        ]
+
+        empty_indices = np.flatnonzero(counts == 0)
+        if len(empty_indices) == 0:
+            return distributions
+
+        # 对于没有分配到内容的，按距离遍历其它的项，如果有两个以上的分配，则从它那里抢一个
+        for idx2, dists in zip(empty_indices, cdist(centers2[empty_indices], centers2, 'cityblock')):
+            distri = distributions[idx2]
+            for other_idx in dists.argsort():
+                if other_idx == idx2:
+                    continue
+                other_distri = distributions[other_idx]
+                if len(other_distri) >= 2:
+                    distri.append(other_distri.pop(0))
+                    break
+
+            # 一定能抢到，所以执行到这里时 distri 应当不为空
+            assert distri
+
+        return distributions
+
     def interpolate(
         self,
         cmpt1: Self,
@@ -228,28 +263,68 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
 
-        bezier_tuples = list(Cmpt_VPoints.get_bezier_tuples_from_points(points))
-        norms = [
-            0 if np.isnan(tup[1][0]) else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
+        points = np.asarray(points)
+        curves = get_quadratic_bezier_curves(points)
+        ipc = Cmpt_VPoints.get_insertions_per_curve(n, curves)
+
+        # 每段曲线被分为 n_inserts + 1 段，这里得到所有小段在原曲线上的起止比例
+        n_parts = ipc + 1
+        offsets = np.r_[0, np.cumsum(n_parts)[:-1]]
+        a = np.empty(n_parts.sum())
+        b = np.empty(n_parts.sum())
+        for n_inserts in np.unique(ipc):
+            # 使用 np.linspace 使得比例与逐段计算时完全一致
             alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
+            indices = offsets[ipc == n_inserts, np.newaxis] + np.arange(n_inserts + 1)
+            a[indices] = alphas[:-1]
+            b[indices] = alphas[1:]
 
-        return np.vstack(new_points)
+        parts = partial_quadratic_bezier_curves(np.repeat(curves, n_parts, axis=0), a, b)
+        return np.vstack([points[:1], parts[:, 1:].reshape(-1, 3)])
+
+    @staticmethod
+    def get_insertions_per_curve(n: int, curves: np.ndarray) -> np.ndarray:
+        '''
+        将 ``n`` 个插入的曲线按照长度分配给 ``curves`` 中的每段曲线，得到每段曲线插入的数量
+
+        每次都将插入分配给当前 “长度 / (已插入数量 + 1)” 最大的曲线，也就是按最高平均数法分配，
+        这里直接在所有可能的候选值中取最大的 ``n`` 个，而不是逐个插入
+        '''
+        m = len(curves)
+        ipc = np.zeros(m, dtype=int)
+        if n <= 0 or m == 0:
+            return ipc
+
+        # 与 get_norm 相同的计算顺序，使得结果与逐段计算时完全一致
+        diff = curves[:, 2] - curves[:, 0]
+        norms = np.sqrt(diff[:, 0]**2 + diff[:, 1]**2 + diff[:, 2]**2)
+        norms[np.isnan(curves[:, 1, 0])] = 0
+
+        total = norms.sum()
+        if total == 0:
+            # 所有曲线的长度都为 0 时，全部插入到第一段中
+            ipc[0] = n
+            return ipc
+
+        # 每段曲线最终分配到的数量不会超过 norm * (n + m) / total，以此限制候选值的数量
+        bounds = np.minimum(np.floor(norms * (n + m) / total).astype(int) + 1, n)
+        bounds[norms == 0] = 0
+
+        # 逐次乘上 k / (k + 1) 得到第 k 次插入时的候选值，与逐个插入时的计算过程一致
+        order = np.argsort(-bounds, kind='stable')
+        sorted_bounds = bounds[order]
+        values = [norms[order[:np.count_nonzero(sorted_bounds)]]]
+        for k in range(1, sorted_bounds[0]):
+            active = np.count_nonzero(sorted_bounds > k)
+            values.append(values[-1][:active] * (k / (k + 1)))
+
+        candidate_values = np.concatenate(values)
+        candidate_indices = np.concatenate([order[:len(v)] for v in values])
+
+        # 值相同时，优先分配给下标小的曲线
+        chosen = np.lexsort((candidate_indices, -candidate_values))[:n]
+        ipc += np.bincount(candidate_indices[chosen], minlength=m)
+        return ipc
 
     def insert_n_curves(self, n: int, root_only=False) -> Self:
         for cmpt in self.walk_same_cmpt_of_self_and_descendants_without_mock(root_only):
@@ -306,16 +381,17 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         return self
 
     @staticmethod
-    def get_bezier_tuples_from_points(points: VectArray) -> Iterable[np.ndarray]:
+    def get_bezier_tuples_from_points(points: VectArray) -> np.ndarray:
         '''
         由 ``points`` 得到由每一组贝塞尔曲线控制点组成的列表
 
         例如，对于有 7 个点的 ``points``，返回值是 ``(points[[0, 1, 2]], points[[2, 3, 4]], points[[4, 5, 6]])``
+
+        返回的是形状为 ``(n, 3, 3)`` 的数组，具体参考 :func:`~.get_quadratic_bezier_curves`
         '''
-        n_curves = max(0, len(points) - 1) // 2
-        return (points[2 * i: 2 * i + 3] for i in range(n_curves))
+        return get_quadratic_bezier_curves(points)
 
-    def get_bezier_tuples(self) -> Iterable[np.ndarray]:
+    def get_bezier_tuples(self) -> np.ndarray:
         '''
         得到由每一组贝塞尔曲线控制点组成的列表，具体参考 :meth:`get_bezier_tuples_from_points`
         '''
@@ -352,8 +428,25 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         '''
         num_curves = self.curves_count()
         n, residue = integer_interpolate(0, num_curves, alpha)
-        curve_func = self.get_nth_curve_function(n)
-        return curve_func(residue)
+        return quadratic_bezier_points_at(self.get_nth_curve_points(n)[np.newaxis], residue)[0]
+
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
+    def get_length_table(self) -> np.ndarray:
+        '''
+        得到曲线长度的累计表，以 0 开头，长度为曲线数量 + 1，用于根据比例得到曲线上的点
+
+        每段曲线的长度使用从起点到终点的直线距离近似，起点与控制点重合的曲线长度视为 0
+
+        该结果会被缓存，直到点数据改变
+        '''
+        curves = self.get_bezier_tuples()
+        # Approximate length with straight line from start to end
+        diff = curves[:, 2] - curves[:, 0]
+        lengths = np.sqrt(diff[:, 0]**2 + diff[:, 1]**2 + diff[:, 2]**2)
+        # Don't consider null curves
+        lengths[(curves[:, 0] == curves[:, 1]).all(axis=1)] = 0
+        return get_cumulative_lengths(lengths)
 
     def curve_and_prop_of_partial_point(self, alpha: float) -> tuple[int, float]:
         '''
@@ -362,27 +455,11 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         '''
         if alpha == 0:
             return (0, 0.0)
-        partials: list[float] = [0]
-        for tup in self.get_bezier_tuples():
-            if (tup[0] == tup[1]).all():
-                # Don't consider null curves
-                arclen = 0
-            else:
-                # Approximate length with straight line from start to end
-                arclen = get_norm(tup[2] - tup[0])
-            partials.append(partials[-1] + arclen)
-        full = partials[-1]
-        if full == 0:
+        partials = self.get_length_table()
+        if partials[-1] == 0:
             return len(partials), 1.0
-        # First index where the partial length is more than alpha times the full length
-        index = next(
-            (i for i, x in enumerate(partials) if x >= full * alpha),
-            len(partials) - 1  # Default
-        )
-        residue = float(inverse_interpolate(
-            partials[index - 1] / full, partials[index] / full, alpha
-        ))
-        return index - 1, residue
+        index, residue = curves_and_props_from_proportions(partials, alpha)
+        return int(index), float(residue)
 
     def point_from_proportion(self, alpha: float) -> np.ndarray:
         if alpha <= 0:
@@ -390,7 +467,36 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         elif alpha >= 1:
             return self.get_end()
         index, residue = self.curve_and_prop_of_partial_point(alpha)
-        return self.get_nth_curve_function(index)(residue)
+        return quadratic_bezier_points_at(self.get_nth_curve_points(index)[np.newaxis], residue)[0]
+
+    def points_from_proportions(self, alphas: Iterable[float]) -> np.ndarray:
+        '''
+        :meth:`point_from_proportion` 的批量版本，得到沿着整个曲线上所在比例为 ``alphas`` 中每一项处的点
+
+        例如在每一帧中需要让许多物件沿着同一路径移动时，可以一次性得到所有的位置
+        '''
+        self._raise_error_if_no_points()
+        alphas = np.asarray(alphas, dtype=float)
+
+        result = np.empty((len(alphas), 3))
+        result[alphas <= 0] = self.get_start()
+        result[alphas >= 1] = self.get_end()
+
+        middle = (alphas > 0) & (alphas < 1)
+        if not middle.any():
+            return result
+
+        partials = self.get_length_table()
+        if partials[-1] == 0:
+            # 与 point_from_proportion 一致，长度为 0 的路径无法取得中间比例处的点
+            raise PointError(
+                _('n must be a value of 0~{maxn}, {n} is invalid')
+                .format(maxn=self.curves_count() - 1, n=len(partials))
+            )
+
+        indices, residues = curves_and_props_from_proportions(partials, alphas[middle])
+        result[middle] = quadratic_bezier_points_at(self.get_bezier_tuples()[indices], residues)
+        return result
 
     def pointwise_become_partial(self, other: Cmpt_VPoints | Item, a: float, b: float) -> Self:
         if isinstance(other, Item):
@@ -623,19 +729,24 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
 
         对于闭合路径，结果中对应部分会被设置为 ``True``
         '''
-        result = np.full(self.count(), False)
-        if len(result) == 0:
-            return result
+        return self.get_closepath_flags_from_points(self.get())
 
-        points = self.get()
+    @staticmethod
+    def get_closepath_flags_from_points(points: VectArray) -> np.ndarray:
+        '''
+        与 :meth:`get_closepath_flags` 相同，但是直接对 ``points`` 进行计算
+        '''
+        if len(points) == 0:
+            return np.full(0, False)
 
-        start_idx = 0
-        for end_idx in self.walk_subpath_end_indices():
-            if np.isclose(points[end_idx], points[start_idx]).all():
-                result[start_idx: end_idx + 1] = True
-            start_idx = end_idx + 2
+        is_sep = np.full(len(points), False)
+        is_sep[1::2] = np.isnan(points[1::2, 0])
+        end_indices = np.append(np.flatnonzero(is_sep) - 1, len(points) - 1)
+        start_indices = np.append(0, end_indices[:-1] + 2)
 
-        return result
+        closed = np.isclose(points[end_indices], points[start_indices]).all(axis=1)
+        # 每个点所在子路径的序号，分隔用的 NAN_POINT 不属于任何子路径
+        return closed[np.cumsum(is_sep)] & ~is_sep
 
     @staticmethod
     def get_parts_by_end_indices(array: np.ndarray, end_indices: np.ndarray) -> list[np.ndarray]:
@@ -19,7 +19,7 @@ import time
 import traceback
 from bisect import bisect_left
 
-from PySide6.QtCore import QByteArray, Qt, Signal
+from PySide6.QtCore import QByteArray, Qt, QTimer, Signal
 from PySide6.QtGui import QAction, QCloseEvent, QHideEvent, QIcon, QShowEvent
 from PySide6.QtWidgets import (QApplication, QCompleter, QLabel, QLineEdit,
                                QMainWindow, QMessageBox, QPushButton,
@@ -56,6 +56,9 @@ class AnimViewer(QMainWindow):
     '''
     play_finished = Signal()
 
+    # 播放时帧率不足的情况下，会依次尝试以这些比例降低渲染的分辨率，参考 adjust_render_scale
+    render_scales = (1, 0.75, 0.5, 0.35, 0.25)
+
     def __init__(
         self,
         built: BuiltTimeline,
@@ -140,6 +143,8 @@ class AnimViewer(QMainWindow):
             self.play_timer.start_precise_timer()
         if self.play_timer.skip_enabled:
             self.play_timer.take_skip_count()
+        self.schedule_prerender()
+        self.set_render_scale_index(0)
 
         if self.built.timeline.has_audio() and self.audio_player is None:
             self.audio_player = AudioPlayer(self.built.cfg.audio_framerate,
@@ -175,6 +180,11 @@ class AnimViewer(QMainWindow):
         self.action_frame_skip.setShortcut('Ctrl+P')
         self.action_frame_skip.setAutoRepeat(False)
 
+        self.action_frame_cache = menu_functions.addAction(_('Pre-render cache(&B)'))
+        self.action_frame_cache.setCheckable(True)
+        self.action_frame_cache.setShortcut('Ctrl+B')
+        self.action_frame_cache.setAutoRepeat(False)
+
         menu_functions.addSeparator()
 
         self.action_rebuild = menu_functions.addAction(_('Rebuild(&L)'))
@@ -311,10 +321,20 @@ class AnimViewer(QMainWindow):
     def setup_play_timer(self) -> None:
         self.play_timer = PreciseTimer(parent=self)
 
+        # 在事件循环空闲时逐帧进行预渲染，参考 on_prerender_timer_timeout
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setInterval(0)
+
         self.fps_counter = 0
         self.fps_prev = 0
         self.fps_record_start = time.time()
 
+        self.render_scale_index = 0
+        # 降低分辨率后尚待验证的一级：(降低前的序号, 降低前的帧率)
+        self.render_scale_probe: tuple[int, int] | None = None
+        # 本次播放中允许降到的最低一级分辨率的序号
+        self.render_scale_limit = len(self.render_scales) - 1
+
     def set_play_state(self, playing: bool) -> None:
         if playing != self.play_timer.isActive():
             self.switch_play_state()
@@ -322,16 +342,21 @@ class AnimViewer(QMainWindow):
     def switch_play_state(self) -> None:
         if self.play_timer.isActive():
             self.play_timer.stop()
+            self.schedule_prerender()
         else:
             if self.timeline_view.at_end():
                 self.timeline_view.set_progress(0)
             self.fps_record_start = time.time()
             self.fps_counter = 0
+            self.render_scale_probe = None
+            self.render_scale_limit = len(self.render_scales) - 1
             self.play_timer.start_precise_timer()
+            self.glw.set_render_scale(self.render_scales[self.render_scale_index])
 
     def hideEvent(self, event: QHideEvent) -> None:
         super().hideEvent(event)
         self.play_timer.stop()
+        self.prerender_timer.stop()
 
     # endregion (play_timer)
 
@@ -340,6 +365,7 @@ class AnimViewer(QMainWindow):
     def setup_slots(self) -> None:
         self.action_stay_on_top.toggled.connect(self.on_stay_on_top_toggled)
         self.action_frame_skip.toggled.connect(self.on_frame_skip_toggled)
+        self.action_frame_cache.toggled.connect(self.on_frame_cache_toggled)
         self.action_rebuild.triggered.connect(self.on_rebuild_triggered)
         self.action_select.triggered.connect(self.on_select_triggered)
         self.connect_action_widget(self.action_painter, Painter)
@@ -352,6 +378,8 @@ class AnimViewer(QMainWindow):
         self.timeline_view.space_pressed.connect(lambda: self.switch_play_state())
 
         self.play_timer.timeout.connect(self.on_play_timer_timeout)
+        self.play_timer.stopped.connect(self.on_play_timer_stopped)
+        self.prerender_timer.timeout.connect(self.on_prerender_timer_timeout)
         self.glw.rendered.connect(self.on_glw_rendered)
         self.name_edit.editingFinished.connect(self.on_name_edit_finished)
         self.btn_export.clicked.connect(self.on_export_clicked)
@@ -368,6 +396,10 @@ class AnimViewer(QMainWindow):
         self.play_timer.set_skip_enabled(flag)
         self.update_fps_label()
 
+    def on_frame_cache_toggled(self, flag: bool) -> None:
+        self.glw.set_frame_cache_enabled(flag)
+        self.schedule_prerender()
+
     def on_rebuild_triggered(self) -> None:
         module = inspect.getmodule(self.built.timeline)
         progress = self.timeline_view.progress()
@@ -501,21 +533,68 @@ class AnimViewer(QMainWindow):
 
         self.glw.set_time(time)
         self.time_label.setText(f'{time:.1f}/{self.built.duration:.1f} s')
+        self.schedule_prerender()
 
     def on_glw_rendered(self) -> None:
         cur = time.time()
         self.fps_counter += 1
         if cur - self.fps_record_start >= 1:
             self.fps_prev = self.fps_counter
+            self.adjust_render_scale()
             self.update_fps_label()
             self.fps_counter = 0
             self.fps_record_start = cur
 
     def update_fps_label(self) -> None:
         if self.action_frame_skip.isChecked():
-            self.fps_label.setText(f'Preview FPS: {self.fps_prev} ({self.built.cfg.preview_fps})')
+            text = f'Preview FPS: {self.fps_prev} ({self.built.cfg.preview_fps})'
         else:
-            self.fps_label.setText(f'Preview FPS: {self.fps_prev}/{self.built.cfg.preview_fps}')
+            text = f'Preview FPS: {self.fps_prev}/{self.built.cfg.preview_fps}'
+        if self.glw.render_scale < 1:
+            text += f' [{self.glw.render_scale:.0%}]'
+        self.fps_label.setText(text)
+
+    def adjust_render_scale(self) -> None:
+        '''
+        播放时根据实际的预览帧率调整渲染的分辨率
+
+        - 帧率低于 ``preview_fps`` 时，降低一级分辨率
+        - 降低分辨率后，如果下一秒的帧率没有提高，说明瓶颈不在渲染上，
+          则恢复原先的分辨率，并且在本次播放中不再尝试降低到这一级
+        - 帧率足够，并且渲染一帧的用时还有很多余量时，提高一级分辨率
+
+        暂停时总是以完整的分辨率渲染，参考 :meth:`on_play_timer_stopped`
+        '''
+        if not self.play_timer.isActive():
+            return
+
+        if self.render_scale_probe is not None:
+            prev_index, prev_fps = self.render_scale_probe
+            self.render_scale_probe = None
+            if self.fps_prev <= prev_fps:
+                self.render_scale_limit = prev_index
+                self.set_render_scale_index(prev_index)
+                return
+
+        preview_fps = self.built.cfg.preview_fps
+        index = self.render_scale_index
+        if self.fps_prev < preview_fps * 0.9:
+            if index < self.render_scale_limit:
+                self.render_scale_probe = (index, self.fps_prev)
+                index += 1
+        elif index > 0 and self.glw.render_duration * preview_fps < 0.25:
+            index -= 1
+        self.set_render_scale_index(index)
+
+    def set_render_scale_index(self, index: int) -> None:
+        self.render_scale_index = index
+        if self.play_timer.isActive():
+            self.glw.set_render_scale(self.render_scales[index])
+
+    def on_play_timer_stopped(self) -> None:
+        # 暂停时以完整的分辨率重新渲染当前帧
+        self.glw.set_render_scale(1)
+        self.update_fps_label()
 
     def on_play_timer_timeout(self) -> None:
         played_count = 1 + self.play_timer.take_skip_count()
@@ -538,6 +617,36 @@ class AnimViewer(QMainWindow):
             self.play_finished.emit()
             self.play_timer.stop()
 
+    def schedule_prerender(self) -> None:
+        if self.glw.frame_cache_enabled:
+            self.prerender_timer.start()
+
+    def on_prerender_timer_timeout(self) -> None:
+        '''
+        在暂停时，从当前位置开始提前渲染之后的帧，每次只渲染一帧，使得界面的操作不受影响
+
+        播放时不进行预渲染，以免拖慢播放；播放时显示过的帧同样会被缓存，所以之后重播时也不需要重新渲染
+        '''
+        time = self.get_next_prerender_time()
+        if time is None:
+            self.prerender_timer.stop()
+            return
+        self.glw.prerender(time)
+
+    def get_next_prerender_time(self) -> float | None:
+        cache = self.glw.frame_cache
+        if cache is None or not self.glw.frame_cache_enabled or self.play_timer.isActive():
+            return None
+
+        # 最多预渲染缓存容量一半的帧数，使得已经看过的帧仍然能留在缓存中
+        progress = self.timeline_view.progress()
+        end = min(self.timeline_view.maximum(), progress + cache.capacity // 2)
+        for p in range(progress, end + 1):
+            time = self.timeline_view.progress_to_time(p)
+            if time not in cache:
+                return time
+        return None
+
     def on_name_edit_finished(self) -> None:
         if self.name_edit.text().strip() != self.built.timeline.__class__.__name__:
             self.play_timer.stop()
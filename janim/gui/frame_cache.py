@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+import moderngl as mgl
+
+from janim.render.framebuffer import create_framebuffer
+
+FRAME_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+class FrameCache:
+    '''
+    预览界面的帧缓存
+
+    每一帧渲染在单独的 framebuffer 中，以时间为键保存在显存里，
+    再次显示同一帧时只需要把它复制到屏幕上，不需要重新渲染
+
+    缓存的总大小不超过 ``max_bytes``，超出时会复用最久没有用到的帧的 framebuffer
+
+    每一帧只保存颜色纹理，深度缓冲只在渲染时用到，所以所有帧共用同一个
+    '''
+    def __init__(self, ctx: mgl.Context, max_bytes: int = FRAME_CACHE_MAX_BYTES):
+        self.ctx = ctx
+        self.max_bytes = max_bytes
+
+        self.size: tuple[int, int] = (0, 0)
+        self.frames: OrderedDict[float, mgl.Framebuffer] = OrderedDict()
+        self.depth: mgl.Renderbuffer | None = None
+
+    @property
+    def capacity(self) -> int:
+        '''
+        在当前尺寸下最多能缓存的帧数
+        '''
+        pw, ph = self.size
+        # 每个像素的颜色占 4 字节，共用的深度缓冲不计入
+        return max(1, self.max_bytes // max(1, pw * ph * 4))
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        '''
+        设置缓存的画面尺寸，尺寸变化时会清空已有的缓存
+        '''
+        if size != self.size:
+            self.clear()
+            self.size = size
+
+    def clear(self) -> None:
+        for fbo in self.frames.values():
+            self.release_frame(fbo)
+        self.frames.clear()
+        if self.depth is not None:
+            self.depth.release()
+            self.depth = None
+
+    def __contains__(self, t: float) -> bool:
+        return t in self.frames
+
+    def get(self, t: float) -> mgl.Framebuffer | None:
+        '''
+        得到 ``t`` 时刻已缓存的画面，没有缓存则返回 ``None``
+        '''
+        fbo = self.frames.get(t, None)
+        if fbo is not None:
+            self.frames.move_to_end(t)
+        return fbo
+
+    def acquire(self, t: float) -> mgl.Framebuffer:
+        '''
+        得到用于缓存 ``t`` 时刻画面的 framebuffer，需要由调用方渲染其内容
+
+        缓存已满时，会取出最久没有用到的一帧的 framebuffer 复用
+        '''
+        fbo = self.frames.pop(t, None)
+        if fbo is None:
+            if len(self.frames) >= self.capacity:
+                _, fbo = self.frames.popitem(last=False)
+            else:
+                if self.depth is None:
+                    self.depth = self.ctx.depth_renderbuffer(self.size)
+                fbo = create_framebuffer(self.ctx, *self.size, self.depth)
+        self.frames[t] = fbo
+        return fbo
+
+    def discard(self, t: float) -> None:
+        '''
+        移除 ``t`` 时刻的缓存，用于渲染失败的情况
+        '''
+        fbo = self.frames.pop(t, None)
+        if fbo is not None:
+            self.release_frame(fbo)
+
+    @staticmethod
+    def release_frame(fbo: mgl.Framebuffer) -> None:
+        # 深度缓冲是共用的，在 clear 中释放
+        for attachment in fbo.color_attachments:
+            attachment.release()
+        fbo.release()
+
+    @staticmethod
+    def release_framebuffer(fbo: mgl.Framebuffer) -> None:
+        for attachment in (*fbo.color_attachments, fbo.depth_attachment):
+            attachment.release()
+        fbo.release()
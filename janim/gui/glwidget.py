@@ -1,16 +1,27 @@
 
+import time
+
+import moderngl as mgl
 from PySide6.QtCore import QPointF, Signal
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtWidgets import QWidget
 
 from janim.anims.timeline import BuiltTimeline
+from janim.gui.frame_cache import FrameCache
 from janim.render.base import create_context
-from janim.render.framebuffer import FRAME_BUFFER_BINDING, register_qt_glwidget
+from janim.render.framebuffer import (FRAME_BUFFER_BINDING,
+                                      create_framebuffer, framebuffer_context,
+                                      register_qt_glwidget)
 
 
 class GLWidget(QOpenGLWidget):
     '''
     窗口中央的渲染界面
+
+    开启帧缓存（:meth:`set_frame_cache_enabled`）后，画面会先渲染到 :class:`~.FrameCache` 中再复制到屏幕上，
+    已经缓存的帧不需要重新渲染，并且可以使用 :meth:`prerender` 提前渲染之后的帧
+
+    使用 :meth:`set_render_scale` 可以降低渲染的分辨率，画面会被放大到界面的尺寸上
     '''
     rendered = Signal()
 
@@ -18,9 +29,18 @@ class GLWidget(QOpenGLWidget):
         super().__init__(parent)
         self.needs_update_clear_color = False
 
+        self.frame_cache_enabled = False
+        self.frame_cache: FrameCache | None = None
+
+        self.render_scale: float = 1
+        self.scaled_fbo: mgl.Framebuffer | None = None
+        # 最近一次 paintGL 所用的时间，不包括 GPU 上异步执行的部分
+        self.render_duration: float = 0
+
     def set_built(self, built: BuiltTimeline) -> None:
         self.built = built
         self.update_clear_color()
+        self.clear_frame_cache()
         self.update()
 
     def set_time(self, time: float) -> None:
@@ -48,17 +68,130 @@ class GLWidget(QOpenGLWidget):
 
         register_qt_glwidget(self)
 
+        self.qextra = self.context().extraFunctions()
+
         # null_texture 目的是避免还没有 framebuffer 绑定至纹理单元时，在渲染的时候出现警告
         self.null_texture = self.ctx.texture((1, 1), 1)
 
+        self.frame_cache = FrameCache(self.ctx)
+
     def update_clear_color(self) -> None:
         self.needs_update_clear_color = True
 
     def paintGL(self) -> None:
+        start = time.perf_counter()
+
         if self.needs_update_clear_color:
             self.qfuncs.glClearColor(*self.built.cfg.background_color.rgb, 1.)
             self.needs_update_clear_color = False
-        self.qfuncs.glClear(0x00004000 | 0x00000100)    # GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT
-        self.null_texture.use(FRAME_BUFFER_BINDING)
-        self.built.render_all(self.ctx, self.global_t)
+
+        fbo = None
+        if self.frame_cache_enabled:
+            self.frame_cache.set_size(self.get_pixel_size())
+            fbo = self.frame_cache.get(self.global_t)
+
+        if fbo is not None:
+            # 没有经过 render_all，所以这里手动更新所记录的时间，使得 Selector 等功能得到当前画面的信息
+            self.built._time = self.built.align_t_for_render(self.global_t)
+        elif self.render_scale < 1:
+            # 降低分辨率渲染的画面不放入帧缓存，暂停后会以完整的分辨率重新渲染
+            fbo = self.get_scaled_framebuffer()
+            self.render_to_framebuffer(fbo, self.global_t)
+        elif self.frame_cache_enabled:
+            fbo = self.render_to_frame_cache(self.global_t)
+
+        if fbo is None:
+            self.qfuncs.glClear(0x00004000 | 0x00000100)    # GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT
+            self.null_texture.use(FRAME_BUFFER_BINDING)
+            self.built.render_all(self.ctx, self.global_t)
+        else:
+            self.blit_to_screen(fbo)
+
+        self.render_duration = time.perf_counter() - start
         self.rendered.emit()
+
+    def get_pixel_size(self) -> tuple[int, int]:
+        ratio = self.devicePixelRatioF()
+        return (round(self.width() * ratio), round(self.height() * ratio))
+
+    def render_to_framebuffer(self, fbo: mgl.Framebuffer, time: float) -> None:
+        with framebuffer_context(fbo):
+            fbo.clear(*self.built.cfg.background_color.rgb, 1)
+            self.built.render_all(self.ctx, time)
+
+    def blit_to_screen(self, fbo: mgl.Framebuffer) -> None:
+        '''
+        将 ``fbo`` 的画面复制到屏幕上，尺寸不同时会进行线性插值的缩放
+        '''
+        default_fbo = self.defaultFramebufferObject()
+        self.qfuncs.glBindFramebuffer(0x8CA8, fbo.glo)          # GL_READ_FRAMEBUFFER
+        self.qfuncs.glBindFramebuffer(0x8CA9, default_fbo)      # GL_DRAW_FRAMEBUFFER
+        self.qextra.glBlitFramebuffer(0, 0, *fbo.size,
+                                      0, 0, *self.get_pixel_size(),
+                                      0x00004000,               # GL_COLOR_BUFFER_BIT
+                                      0x2601)                   # GL_LINEAR
+        self.qfuncs.glBindFramebuffer(0x8D40, default_fbo)      # GL_FRAMEBUFFER
+
+    # region render_scale
+
+    def set_render_scale(self, scale: float) -> None:
+        '''
+        设置渲染分辨率相对于界面尺寸的比例，小于 1 时会先以较低的分辨率渲染再放大到界面上
+        '''
+        if scale != self.render_scale:
+            self.render_scale = scale
+            self.update()
+
+    def get_scaled_framebuffer(self) -> mgl.Framebuffer:
+        pw, ph = self.get_pixel_size()
+        size = (max(1, round(pw * self.render_scale)), max(1, round(ph * self.render_scale)))
+        if self.scaled_fbo is None or self.scaled_fbo.size != size:
+            if self.scaled_fbo is not None:
+                FrameCache.release_framebuffer(self.scaled_fbo)
+            self.scaled_fbo = create_framebuffer(self.ctx, *size)
+        return self.scaled_fbo
+
+    # endregion
+
+    # region frame_cache
+
+    def set_frame_cache_enabled(self, enabled: bool) -> None:
+        self.frame_cache_enabled = enabled
+        if not enabled:
+            self.clear_frame_cache()
+        self.update()
+
+    def clear_frame_cache(self) -> None:
+        if self.frame_cache is None or not self.frame_cache.frames:
+            return
+        self.makeCurrent()
+        self.frame_cache.clear()
+        self.doneCurrent()
+
+    def prerender(self, time: float) -> None:
+        '''
+        提前把 ``time`` 时刻的画面渲染到帧缓存中，之后显示这一帧时就只需要复制
+        '''
+        if not self.frame_cache_enabled or self.frame_cache is None or time in self.frame_cache:
+            return
+
+        self.makeCurrent()
+        # 预渲染的并不是当前显示的帧，所以需要恢复 render_all 所记录的时间，使得 Selector 等功能不受影响
+        prev_time = self.built._time
+        try:
+            self.frame_cache.set_size(self.get_pixel_size())
+            self.render_to_frame_cache(time)
+        finally:
+            self.built._time = prev_time
+            self.doneCurrent()
+
+    def render_to_frame_cache(self, time: float) -> mgl.Framebuffer:
+        fbo = self.frame_cache.acquire(time)
+        try:
+            self.render_to_framebuffer(fbo, time)
+        except Exception:
+            self.frame_cache.discard(time)
+            raise
+        return fbo
+
+    # endregion
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
-import itertools as it
+import math
 import os
 from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
-from PySide6.QtCore import QPointF, QRect, QRectF, Qt
-from PySide6.QtGui import QFont, QPainter, QPixmap
+import numpy as np
+from PySide6.QtCore import QLineF, QPointF, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QApplication
 
 from janim.anims.animation import TimeRange
 from janim.utils.file_ops import get_janim_dir
 
+if TYPE_CHECKING:
+    from janim.anims.timeline import Timeline
+
 LABEL_DEFAULT_HEIGHT = 3
 LABEL_PIXEL_HEIGHT_PER_UNIT = 8     # px
 
@@ -96,6 +101,35 @@ class Label:
         width = t_range.duration / params.range.duration * params.rect.width()
         return PixelRange(left, width)
 
+    def get_covered_columns(self, params: PaintParams) -> tuple[int, int] | None:
+        '''
+        对于不足一像素宽、没有边框并且不透明的 Label，得到其绘制时所覆盖的像素列 ``[begin, end)``，
+        用于在 :meth:`LabelGroup.paint` 中跳过被完全遮挡的 Label；这种 Label 的文字会被完全裁剪，所以只需要考虑背景
+
+        其它情况返回 ``None``；端点过于接近取整的分界时也返回 ``None``，因为这时所覆盖的像素列取决于绘制时的舍入误差
+        '''
+        if type(self) is not Label \
+                or self.pen != Qt.PenStyle.NoPen \
+                or not isinstance(self.brush, QColor) \
+                or self.brush.alpha() != 255:
+            return None
+
+        # 与 time_range_to_pixel_range 的计算方式相同，但这里会对每个 Label 调用，所以不构造 PixelRange
+        duration = params.range.duration
+        width = params.rect.width()
+        pixel_width = self.t_range.duration / duration * width
+        if pixel_width >= 1:
+            return None
+        left = params.rect.left() + (self.t_range.at - params.range.at) / duration * width
+
+        columns = []
+        for x in (left, left + pixel_width):
+            frac = x - math.floor(x)
+            if abs(frac - 0.5) <= 1 / 32:
+                return None
+            columns.append(math.floor(x + 0.5))
+        return tuple(columns)
+
     def _paint(
         self,
         p: QPainter,
@@ -103,7 +137,7 @@ class Label:
         y_offset: int,
         height: int,
         *,
-        post_fn: Callable[[QRectF]] | None = None   # 只是为了在 LabelGroup._paint 中绘制 tip 使用
+        post_fn: Callable[[QPainter, QRectF]] | None = None     # 在背景之上绘制额外内容，例如 LabelGroup 的 tip 与 AudioLabel 的波形
     ) -> None:
         range = self.time_range_to_pixel_range(params, self.t_range)
         y_pixel = params.rect.y() + (self.y + y_offset) * LABEL_PIXEL_HEIGHT_PER_UNIT - params.y_pixel_offset
@@ -151,17 +185,19 @@ class Label:
             if post_fn is not None:
                 post_fn(p, rect)
             rect.adjust(1, 1, -1, -1)
-            if self.font is not None:
-                prev_font = p.font()
-                p.setFont(self.font)
-            p.setPen(Qt.GlobalColor.black)
-            p.drawText(
-                rect,
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
-                self.name
-            )
-            if self.font is not None:
-                p.setFont(prev_font)
+            # 区段过窄时文字会被完全裁剪，不必绘制
+            if rect.width() > 0:
+                if self.font is not None:
+                    prev_font = p.font()
+                    p.setFont(self.font)
+                p.setPen(Qt.GlobalColor.black)
+                p.drawText(
+                    rect,
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                    self.name
+                )
+                if self.font is not None:
+                    p.setFont(prev_font)
 
     def paint(self, p: QPainter, params: PaintParams, y_offset: int) -> None:
         self._paint(p, params, y_offset, self.height)
@@ -169,6 +205,91 @@ class Label:
     # endregion
 
 
+class AudioLabel(Label):
+    '''
+    音频区段，会在区段中绘制音频的波形
+
+    波形使用 :meth:`~.Audio.get_peaks` 得到的峰值金字塔绘制，每一列像素只需要从合适的一层中取值，
+    所以开销与音频的长度无关
+    '''
+    waveform_pen = QPen(QColor(35, 110, 92), 1)
+
+    def __init__(self, name: str, t_range: TimeRange, info: Timeline.PlayAudioInfo, **kwargs):
+        super().__init__(name, t_range, **kwargs)
+        self.info = info
+
+    def paint(self, p: QPainter, params: Label.PaintParams, y_offset: int) -> None:
+        self._paint(p, params, y_offset, self.height, post_fn=partial(self._paint_waveform, params))
+
+    def _paint_waveform(self, params: Label.PaintParams, p: QPainter, rect: QRectF) -> None:
+        # 这里的 rect 的左侧可能已被对齐到屏幕左端，所以横坐标与时间的对应关系根据 params 计算
+        x_begin = math.floor(max(rect.left(), params.rect.left()))
+        x_end = math.ceil(min(rect.right(), params.rect.right()))
+        if x_end <= x_begin or rect.height() <= 2:
+            return
+
+        info = self.info
+        audio = info.audio
+
+        edges = np.arange(x_begin, x_end + 1, dtype=float)
+        times = (edges - params.rect.left()) / params.rect.width() * params.range.duration + params.range.at
+        sample_edges = (times - info.range.at + info.clip_range.at) * audio.framerate
+        columns = audio.get_peaks().get_columns(sample_edges)
+
+        center = rect.center().y()
+        half = (rect.height() - 2) / 2 / np.iinfo(np.int16).max
+        tops = center - columns[:, 1] * half
+        bottoms = center - columns[:, 0] * half
+
+        p.setPen(self.waveform_pen)
+        p.drawLines([
+            QLineF(x + 0.5, top, x + 0.5, bottom)
+            for x, top, bottom in zip(range(x_begin, x_end), tops.tolist(), bottoms.tolist())
+            if top != bottom
+        ])
+
+
+class LabelIndex:
+    '''
+    :class:`LabelGroup` 中各个 Label 时间区段的区间索引
+
+    Label 按照堆叠时所在的行分为若干个 ``divisions``，
+    同一行中的 Label 互不重叠并且按时间排序，因此起止时间都是有序的，可以直接二分查找
+    '''
+    def __init__(self):
+        self.divisions: list[list[Label]] = []
+        self.starts: list[list[float]] = []
+        self.ends: list[list[float]] = []
+
+    def append(self, row: int, label: Label) -> None:
+        if row == len(self.divisions):
+            self.divisions.append([])
+            self.starts.append([])
+            self.ends.append([])
+        self.divisions[row].append(label)
+        self.starts[row].append(label.t_range.at)
+        self.ends[row].append(label.t_range.end)
+
+    def overlapping(self, begin: float, end: float) -> Iterator[list[Label]]:
+        '''
+        对于每一行，得到与 ``[begin, end]`` 有重叠的 Label
+        '''
+        for division, starts, ends in zip(self.divisions, self.starts, self.ends):
+            left = bisect_left(ends, begin)
+            right = bisect_right(starts, end)
+            if left < right:
+                yield division[left:right]
+
+    def containing(self, t: float) -> Iterator[Label]:
+        '''
+        得到每一行中包含 ``t`` 的 Label（每一行至多一个）
+        '''
+        for division, starts, ends in zip(self.divisions, self.starts, self.ends):
+            idx = bisect_right(ends, t)
+            if idx < len(division) and starts[idx] <= t:
+                yield division[idx]
+
+
 class LabelGroup(Label):
     header_height_expanded = 2
 
@@ -182,7 +303,8 @@ class LabelGroup(Label):
         pen=Qt.PenStyle.NoPen,
         brush=Qt.BrushStyle.NoBrush,
         highlight_pen=Qt.PenStyle.NoPen,
-        highlight_brush=Qt.BrushStyle.NoBrush
+        highlight_brush=Qt.BrushStyle.NoBrush,
+        lazy_labels: Callable[[], list[Label]] | None = None
     ):
         super().__init__(name, t_range, pen=pen, brush=brush)
         self.highlight_pen = highlight_pen
@@ -191,12 +313,26 @@ class LabelGroup(Label):
         self.pix_collapse_tip1 = self.get_pix_collapse_tip1()
         self.pix_collapse_tip2 = self.get_pix_collapse_tip2()
 
-        # 用于优化绘制的遍历
-        self.ordered_divisions: list[list[Label]] | None = None
-        if len(labels) > 32:   # 该 LabelGroup 中 labels 多于 32 个才进行该优化
-            self.ordered_divisions = []
+        # 如果传入了 lazy_labels，则子 Label 会在第一次用到时才创建，
+        # 这样折叠的 LabelGroup 在展开之前不需要创建其中的 Label
+        self._labels: list[Label] | None = None
+        self._lazy_labels = lazy_labels
+        self._index: LabelIndex | None = None
+        if lazy_labels is None:
+            self._init_labels(labels)
 
+        self._height = 0
+        self._collapse = collapse
+        self._header = header
+
+        self.collapse_font = self.get_smaller_font()
+        self.update_font()
+
+        self._needs_refresh_height: bool = True
+
+    def _init_labels(self, labels: Iterable[Label]) -> None:
         labels = sorted(labels, key=lambda x: x.t_range.at)
+        index = LabelIndex()
         stack: list[Label | None] = []
 
         for label in labels:
@@ -208,8 +344,7 @@ class LabelGroup(Label):
             for i, other in enumerate(stack):
                 if other.t_range.end <= label.t_range.at:
                     if not found_place:
-                        if self.ordered_divisions is not None:
-                            self.ordered_divisions[i].append(label)
+                        index.append(i, label)
                         stack[i] = label
                         max_len = i + 1
                         found_place = True
@@ -226,36 +361,35 @@ class LabelGroup(Label):
                 if max_len != len(stack):
                     stack = stack[:max_len]
             else:
-                if self.ordered_divisions is not None:
-                    if len(stack) == len(self.ordered_divisions):
-                        self.ordered_divisions.append([label])
-                    else:
-                        self.ordered_divisions[len(stack)].append(label)
+                index.append(len(stack), label)
                 stack.append(label)
 
-        self.labels = labels
-        self._height = 0
-        self._collapse = collapse
-        self._header = header
-
-        self.collapse_font = self.get_smaller_font()
-        self.update_font()
+        self._labels = labels
+        self._index = index
 
-        self._needs_refresh_height: bool = True
+    def _ensure_labels(self) -> None:
+        if self._labels is None:
+            self._init_labels(self._lazy_labels())
+            self._lazy_labels = None
 
     def is_exclusive(self) -> bool:
         '''
         若 ``labels`` 没有重叠部分则返回 ``True``
         '''
-        if self.ordered_divisions is not None:
-            return len(self.ordered_divisions) <= 1
-        return all(
-            a.t_range.end <= b.t_range.at
-            for a, b in it.pairwise(self.labels)
-        )
+        return len(self.index.divisions) <= 1
 
     # region property
 
+    @property
+    def labels(self) -> list[Label]:
+        self._ensure_labels()
+        return self._labels
+
+    @property
+    def index(self) -> LabelIndex:
+        self._ensure_labels()
+        return self._index
+
     @property
     def height(self) -> int:
         if not self._needs_refresh_height:
@@ -329,22 +463,10 @@ class LabelGroup(Label):
         if self._header:
             y -= self.header_height
 
-        if self.ordered_divisions is not None:
-            for division in self.ordered_divisions:
-                left = bisect_left(division, t, key=lambda x: x.t_range.at)
-                left = max(0, left - 1)
-                right = bisect_right(division, t, key=lambda x: x.t_range.end)
-                right = min(len(division), right + 1)
-                for i in range(left, right):
-                    label = division[i]
-                    result = self._query_label(label, t, y - label.y, policy)
-                    if result is not None:
-                        return result
-        else:
-            for label in self.labels:
-                result = self._query_label(label, t, y - label.y, policy)
-                if result is not None:
-                    return result
+        for label in self.index.containing(t):
+            result = self._query_label(label, t, y - label.y, policy)
+            if result is not None:
+                return result
 
         return None
 
@@ -420,17 +542,31 @@ class LabelGroup(Label):
             if self._header:
                 children_offset += self.header_height_expanded
 
-            if self.ordered_divisions is None:
-                for label in self.labels:
-                    label.paint(p, params, children_offset)
-            else:
-                for division in self.ordered_divisions:
-                    left = bisect_left(division, params.range.at, key=lambda x: x.t_range.at)
-                    left = max(0, left - 1)
-                    right = bisect_right(division, params.range.end, key=lambda x: x.t_range.end)
-                    right = min(len(division), right + 1)
-                    for i in range(left, right):
-                        division[i].paint(p, params, children_offset)
+            # 只绘制与显示区域有重叠的 Label；
+            # 另外，同一行中连续的、不足一像素宽的 Label 如果被之后的一个完全遮挡（参考 get_covered_columns），则跳过，
+            # 否则在缩小显示大量动画时，绘制的次数会远多于像素的列数
+            for division in self.index.overlapping(params.range.at, params.range.end):
+                pending: Label | None = None
+                pending_columns: tuple[int, int] | None = None
+                for label in division:
+                    columns = label.get_covered_columns(params)
+                    if pending is not None:
+                        if columns is None \
+                                or label.y != pending.y \
+                                or label.height != pending.height \
+                                or columns[0] > pending_columns[0] \
+                                or columns[1] < pending_columns[1]:
+                            pending.paint(p, params, children_offset)
+                        pending = pending_columns = None
+
+                    if columns is None:
+                        label.paint(p, params, children_offset)
+                    elif columns[0] < columns[1]:
+                        pending, pending_columns = label, columns
+                    # 否则不会覆盖任何像素，不需要绘制
+
+                if pending is not None:
+                    pending.paint(p, params, children_offset)
 
         # 绘制标题区
         if self._header:
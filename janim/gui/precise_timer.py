@@ -1,10 +1,12 @@
 
 import time
 
-from PySide6.QtCore import QTimer, QObject, Qt
+from PySide6.QtCore import QTimer, QObject, Qt, Signal
 
 
 class PreciseTimer(QTimer):
+    stopped = Signal()
+
     def __init__(self, duration: float | None = None, parent: QObject | None = None):
         super().__init__(parent)
 
@@ -33,6 +35,10 @@ class PreciseTimer(QTimer):
         self.start_time = time.time()
         self.start(int(self.duration * 1000))
 
+    def stop(self) -> None:
+        super().stop()
+        self.stopped.emit()
+
     def on_timeout(self) -> None:
         if not self.isActive():
             return
@@ -2,6 +2,7 @@ import itertools as it
 import math
 from bisect import bisect, bisect_left
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -14,7 +15,7 @@ from janim.anims.animation import FOREVER, Animation, TimeRange
 from janim.anims.composition import AnimGroup
 from janim.anims.timeline import BuiltTimeline, Timeline
 from janim.gui.label import (LABEL_DEFAULT_HEIGHT, LABEL_PIXEL_HEIGHT_PER_UNIT,
-                             Label, LabelGroup, PixelRange)
+                             AudioLabel, Label, LabelGroup, PixelRange)
 from janim.items.item import Item
 from janim.locale.i18n import get_local_strings
 from janim.utils.bezier import interpolate
@@ -111,29 +112,61 @@ class TimelineView(QWidget):
         '''
         构建动画区段信息，以便操作与绘制
         '''
-        def make_label_from_anim(anim: Animation, header: bool = True) -> Label | None:
-            name = anim.name or anim.__class__.__name__
-            color = QColor(*anim.label_color)
+        def get_label_range(anim: Animation) -> TimeRange | None:
+            # 与 make_label_from_anim 得到的区段一致，但是不需要创建 Label
             if isinstance(anim, AnimGroup):
-                labels = [
-                    label
+                ranges = [
+                    t_range
                     for subanim in anim.anims
-                    if (label := make_label_from_anim(subanim)) is not None
+                    if (t_range := get_label_range(subanim)) is not None
                 ]
-                if not labels:
+                if not ranges:
                     return None
-                label = LabelGroup(
-                    name,
-                    TimeRange(      # 这里不直接使用 anim.t_range 是为了处理 FOREVER 的子动画
+                return TimeRange(
+                    min(t_range.at for t_range in ranges),
+                    max(t_range.end for t_range in ranges)
+                )
+            if anim.t_range.end is FOREVER:
+                return TimeRange(anim.t_range.at, self.built.duration)
+            return anim.t_range
+
+        def make_sublabels(anim: AnimGroup) -> list[Label]:
+            return [
+                label
+                for subanim in anim.anims
+                if (label := make_label_from_anim(subanim)) is not None
+            ]
+
+        def make_label_from_anim(anim: Animation, header: bool = True) -> Label | None:
+            name = anim.name or anim.__class__.__name__
+            color = QColor(*anim.label_color)
+            if isinstance(anim, AnimGroup):
+                if anim.collapse:
+                    # 折叠的动画组在展开前不需要子 Label，所以等到展开时再创建
+                    t_range = get_label_range(anim)
+                    if t_range is None:
+                        return None
+                    labels = []
+                    lazy_labels = partial(make_sublabels, anim)
+                else:
+                    labels = make_sublabels(anim)
+                    if not labels:
+                        return None
+                    t_range = TimeRange(    # 这里不直接使用 anim.t_range 是为了处理 FOREVER 的子动画
                         min(label.t_range.at for label in labels),
                         max(label.t_range.end for label in labels)
-                    ),
+                    )
+                    lazy_labels = None
+                label = LabelGroup(
+                    name,
+                    t_range,
                     *labels,
                     collapse=anim.collapse,
                     header=header,
                     brush=color,
                     highlight_pen=QPen(QColor(41, 171, 202), 3),
                     highlight_brush=QColor(41, 171, 202, 40),
+                    lazy_labels=lazy_labels
                 )
             else:
                 label = Label(
@@ -172,10 +205,11 @@ class TimelineView(QWidget):
             multiple = len(infos) != 1
 
             def make_audio_label(info: Timeline.PlayAudioInfo) -> Label:
-                label = Label(info.audio.filename,
-                              info.range,
-                              pen=QColor(85, 193, 167),
-                              brush=QColor(85, 193, 167, 160))
+                label = AudioLabel(info.audio.filename,
+                                   info.range,
+                                   info,
+                                   pen=QColor(85, 193, 167),
+                                   brush=QColor(85, 193, 167, 160))
                 setattr(label, LABEL_OBJ_NAME, info)
                 return label
 
@@ -352,31 +386,13 @@ class TimelineView(QWidget):
         range_begin = info.range.at + (clip_begin - info.clip_range.at)
         range_end = range_begin + (clip_end - clip_begin)
 
-        begin = int(clip_begin * audio.framerate)
-        end = int(clip_end * audio.framerate)
-
-        left_blank = max(0, -begin)
-        right_blank = max(0, end - audio.sample_count())
-
-        data = audio._samples.data[max(0, begin): min(end, audio.sample_count())]
-        if data.ndim > 1:
-            data = np.max(data, axis=1)
-
-        if left_blank != 0 or right_blank != 0:
-            data = np.concatenate([
-                np.zeros(left_blank, dtype=np.int16),
-                data,
-                np.zeros(right_blank, dtype=np.int16)
-            ])
-
         unit = audio.framerate // self.built.cfg.fps
+        begin = int(clip_begin * audio.framerate)
+        count = int(clip_end * audio.framerate - begin) // unit
 
-        data: np.ndarray = np.max(
-            np.abs(
-                data[:len(data) // unit * unit].reshape(-1, unit)
-            ),
-            axis=1
-        ) / np.iinfo(np.int16).max
+        # 使用峰值金字塔得到每帧的最大振幅，不需要遍历原始的采样数据
+        columns = audio.get_peaks().get_columns(begin + unit * np.arange(count + 1))
+        data = np.max(np.abs(columns.astype(float)), axis=1) / np.iinfo(np.int16).max
 
         times = np.linspace(range_begin,
                             range_end,
@@ -398,8 +414,7 @@ class TimelineView(QWidget):
         chart.addAxis(x_clip_axis, Qt.AlignmentFlag.AlignBottom)
 
         series = QLineSeries()
-        for t, y in zip(times, data):
-            series.append(t, y)
+        series.replace([QPointF(t, y) for t, y in zip(times.tolist(), data.tolist())])
         chart.addSeries(series)
         series.attachAxis(x_axis)
         series.attachAxis(y_axis)
@@ -610,6 +625,9 @@ class TimelineView(QWidget):
     def progress(self) -> int:
         return self._progress
 
+    def maximum(self) -> int:
+        return self._maximum
+
     def at_end(self) -> bool:
         return self._progress == self._maximum
 
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import math
 import os
 import subprocess as sp
 from typing import Generator, Iterable, Self
@@ -14,7 +16,7 @@ from janim.logger import log
 from janim.utils.bezier import interpolate
 from janim.utils.config import Config
 from janim.utils.data import Array
-from janim.utils.file_ops import find_file
+from janim.utils.file_ops import find_file, get_audio_cache_dir
 from janim.utils.iterables import resize_with_interpolation
 from janim.utils.simple_functions import clip
 from janim.locale.i18n import get_local_strings
@@ -31,7 +33,7 @@ class Audio:
     另见：:class:`~.Config`
     '''
 
-    audio_cache_map: dict[tuple, tuple[np.ndarray, int, str, str]] = {}
+    audio_cache_map: dict[tuple, tuple[Array, int, str, str, str]] = {}
 
     def __init__(self, file_path: str = '', begin: float = -1, end: float = -1, **kwargs):
         super().__init__(**kwargs)
@@ -39,6 +41,9 @@ class Audio:
         self.framerate = 0
         self.file_path = ''
         self.filename = ''
+        # 读取时的采样数据及其缓存路径，用于判断 get_peaks 是否可以使用磁盘缓存
+        self._decoded: tuple[np.ndarray, str] | None = None
+        self._peaks: AudioPeaks | None = None
         if file_path:
             self.read(file_path, begin, end)
         else:
@@ -79,15 +84,33 @@ class Audio:
             self.filename = os.path.basename(file_path)
             return
 
+        framerate = Config.get.audio_framerate
         mtime = os.path.getmtime(file_path)
-        name = os.path.splitext(os.path.basename(file_path))[0]
-        key = (name, mtime, begin, end)
+        key = (os.path.abspath(file_path), mtime, begin, end, framerate, channels)
 
         cached = self.audio_cache_map.get(key, None)
-        if cached is not None:
-            self._samples.data, self.framerate, self.file_path, self.filename = cached
-            return
+        if cached is None:
+            cache_path = self.get_cache_path(key)
+            samples = self.load_cached_samples(cache_path, channels)
+            if samples is None:
+                data = self.decode(file_path, begin, end, framerate, channels)
+                samples = self.save_cached_samples(cache_path, data, channels)
+
+            cached = (samples, framerate, file_path, os.path.basename(file_path), cache_path)
+            self.audio_cache_map[key] = cached
 
+        # 这里 cached[0] 是 Array，所以只会引用其内容而不会拷贝
+        samples, self.framerate, self.file_path, self.filename, cache_path = cached
+        self._samples.data = samples
+        self._decoded = (self._samples.data, cache_path)
+
+        return self
+
+    @staticmethod
+    def decode(file_path: str, begin: float, end: float, framerate: int, channels: int) -> np.ndarray:
+        '''
+        使用 ffmpeg 将音频文件解码为 ``int16`` 的采样数据，形如 ``(采样点数量, channels)``
+        '''
         command = [
             Config.get.ffmpeg_bin,
             '-vn',
@@ -101,7 +124,7 @@ class Audio:
         command += [
             '-f', 's16le',
             '-acodec', 'pcm_s16le',
-            '-ar', str(Config.get.audio_framerate),     # framerate & samplerate
+            '-ar', str(framerate),     # framerate & samplerate
             '-ac', str(channels),
             '-loglevel', 'error',
             '-',    # output to a pipe
@@ -117,15 +140,85 @@ class Audio:
             log.error(_('Unable to read audio, please install ffmpeg and add it to the environment variables'))
             raise ExitException(EXITCODE_FFMPEG_NOT_FOUND)
 
-        data = data.reshape((-1, channels))
+        return data.reshape((-1, channels))
 
-        self._samples.data = data
-        self.framerate = Config.get.audio_framerate
-        self.file_path = file_path
-        self.filename = os.path.basename(file_path)
-        self.audio_cache_map[key] = (data, self.framerate, self.file_path, self.filename)
+    # region 解码缓存 | Decoding cache
 
-        return self
+    @staticmethod
+    def get_cache_path(key: tuple) -> str:
+        '''
+        得到解码后的采样数据在 ``Config.temp_dir`` 中的缓存路径，
+        以 ``(文件路径, 修改时间, begin, end, framerate, channels)`` 作为键
+        '''
+        md5 = hashlib.md5(repr(key).encode())
+        return os.path.join(get_audio_cache_dir(), md5.hexdigest() + '.pcm')
+
+    @staticmethod
+    def load_cached_samples(cache_path: str, channels: int) -> Array | None:
+        '''
+        以内存映射的方式读取缓存的采样数据，使得读取时不需要将整个文件载入内存，
+        并且多个进程读取同一个文件时可以共用内存
+        '''
+        if not os.path.exists(cache_path):
+            return None
+
+        if os.path.getsize(cache_path) == 0:
+            # 无法对空文件进行内存映射
+            data = np.zeros((0, channels), dtype=np.int16)
+            data.setflags(write=False)
+            return Array.wrap(data)
+
+        try:
+            data = np.memmap(cache_path, dtype=np.int16, mode='r')
+        except (OSError, ValueError):
+            return None
+        if len(data) % channels != 0:
+            return None
+
+        return Array.wrap(data.reshape((-1, channels)))
+
+    @staticmethod
+    def save_cached_samples(cache_path: str, data: np.ndarray, channels: int) -> Array:
+        '''
+        将采样数据写入缓存，并返回以内存映射的方式重新读取的结果
+
+        如果写入失败，则直接返回内存中的数据
+        '''
+        # 先写入临时文件再重命名，避免其它进程读取到不完整的缓存
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            data.tofile(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        else:
+            samples = Audio.load_cached_samples(cache_path, channels)
+            if samples is not None:
+                return samples
+
+        samples = Array(dtype=np.int16)
+        samples.data = data
+        return samples
+
+    # endregion
+
+    def get_peaks(self) -> AudioPeaks:
+        '''
+        得到当前采样数据的峰值金字塔，用于快速绘制波形
+
+        结果会被记录下来，直到采样数据发生变化；
+        对于从文件读取后未经修改的音频，还会与解码后的采样数据一起缓存在磁盘中
+        '''
+        data = self._samples.data
+        if self._peaks is not None and self._peaks.samples is data:
+            return self._peaks
+
+        if self._decoded is not None and self._decoded[0] is data:
+            self._peaks = AudioPeaks.from_cache(data, self._decoded[1] + '.peaks.npy')
+        else:
+            self._peaks = AudioPeaks(data)
+        return self._peaks
 
     def sample_count(self) -> int:
         '''
@@ -259,3 +352,137 @@ class Audio:
         end = interpolate(0, duration, indices[-1] / len(data))
 
         return start, end
+
+
+class AudioPeaks:
+    '''
+    音频的 min/max 峰值金字塔，用于在不同的缩放程度下快速绘制波形
+
+    - 第 0 层将每 :attr:`BASE_BLOCK` 个采样点合并为一个 ``(min, max)``（所有声道中的最小值与最大值）
+    - 之后的每一层都将上一层每两个相邻的值合并，直到只剩下一个值
+
+    绘制时根据每个像素对应的采样点数量，使用 :meth:`get_level` 选取合适的一层即可，
+    而不需要遍历原始的采样数据
+    '''
+    BASE_BLOCK = 32
+
+    def __init__(self, samples: np.ndarray, data: np.ndarray | None = None):
+        self.samples = samples
+        if data is None:
+            data = self.compute(samples)
+        self.data = data
+
+        # 将连续存放的数据按层拆分（只是视图，不会产生拷贝）
+        self.levels: list[np.ndarray] = []
+        start = 0
+        count = self.get_base_count(len(samples))
+        while count != 0:
+            self.levels.append(data[start: start + count])
+            start += count
+            count = 0 if count == 1 else (count + 1) // 2
+
+    @staticmethod
+    def get_base_count(sample_count: int) -> int:
+        return (sample_count + AudioPeaks.BASE_BLOCK - 1) // AudioPeaks.BASE_BLOCK
+
+    @staticmethod
+    def compute(samples: np.ndarray) -> np.ndarray:
+        '''
+        计算所有层的数据，按层连续存放，形如 ``(数量, 2)``
+        '''
+        if len(samples) == 0:
+            return np.empty((0, 2), dtype=np.int16)
+
+        # 将每个块的所有采样点（包括所有声道）排成一行，不足一个块的尾部单独处理
+        block = AudioPeaks.BASE_BLOCK
+        flat = samples.reshape(len(samples), -1)
+        full = len(samples) // block
+        blocks = flat[:full * block].reshape(full, block * flat.shape[1])
+        level = np.column_stack([blocks.min(axis=1), blocks.max(axis=1)])
+        if full * block != len(samples):
+            tail = flat[full * block:]
+            level = np.vstack([level, [[tail.min(), tail.max()]]])
+
+        levels = [level]
+        while len(level) > 1:
+            if len(level) % 2 == 1:
+                level = np.vstack([level, level[-1:]])
+            pairs = level.reshape(-1, 2, 2)
+            level = np.column_stack([pairs[:, :, 0].min(axis=1), pairs[:, :, 1].max(axis=1)])
+            levels.append(level)
+
+        return np.vstack(levels).astype(np.int16)
+
+    @staticmethod
+    def from_cache(samples: np.ndarray, cache_path: str) -> AudioPeaks:
+        '''
+        从磁盘缓存中读取（以内存映射的方式），不存在时计算并写入缓存
+        '''
+        try:
+            data = np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            data = None
+        else:
+            expected = AudioPeaks.compute_total_count(len(samples))
+            if data.shape != (expected, 2) or data.dtype != np.int16:
+                data = None
+
+        if data is None:
+            data = AudioPeaks.compute(samples)
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, data)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        return AudioPeaks(samples, data)
+
+    @staticmethod
+    def compute_total_count(sample_count: int) -> int:
+        total = 0
+        count = AudioPeaks.get_base_count(sample_count)
+        while count != 0:
+            total += count
+            count = 0 if count == 1 else (count + 1) // 2
+        return total
+
+    def get_level(self, samples_per_pixel: float) -> tuple[np.ndarray, int]:
+        '''
+        选取每个值对应的采样点数量不超过 ``samples_per_pixel`` 的最粗糙的一层，
+        返回该层的数据以及每个值对应的采样点数量
+        '''
+        if not self.levels:
+            return np.empty((0, 2), dtype=np.int16), self.BASE_BLOCK
+
+        ratio = max(1., samples_per_pixel / self.BASE_BLOCK)
+        k = min(len(self.levels) - 1, int(math.log2(ratio)))
+        return self.levels[k], self.BASE_BLOCK << k
+
+    def get_columns(self, sample_edges: np.ndarray) -> np.ndarray:
+        '''
+        ``sample_edges`` 是每一列（例如每个像素）的采样点边界，长度为列数 + 1
+
+        返回每一列的 ``(min, max)``，超出音频范围的列为 ``(0, 0)``，形如 ``(列数, 2)``
+        '''
+        count = len(sample_edges) - 1
+        result = np.zeros((max(0, count), 2), dtype=np.int16)
+        if count <= 0 or not self.levels:
+            return result
+
+        level, block = self.get_level((sample_edges[-1] - sample_edges[0]) / count)
+
+        blocks = np.floor_divide(sample_edges, block).astype(int)
+        valid = (sample_edges[:-1] >= 0) & (sample_edges[:-1] < len(self.samples))
+        if not np.any(valid):
+            return result
+
+        # 在末尾补一个值，使得 reduceat 的每一段都不会超过该列的范围（包括最后一列）
+        padded = np.vstack([level, level[-1:]])
+        indices = np.clip(blocks, 0, len(level))
+        result[:, 0] = np.minimum.reduceat(padded[:, 0], indices)[:-1]
+        result[:, 1] = np.maximum.reduceat(padded[:, 1], indices)[:-1]
+        result[~valid] = 0
+        return result
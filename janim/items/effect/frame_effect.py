@@ -12,6 +12,14 @@ _ = get_local_strings('frame_effect')
 
 
 class FrameEffect(Item):
+    '''
+    将所应用的物件先渲染到一个 framebuffer 上，再使用 ``fragment_shader`` 对其进行处理并绘制到画面中
+
+    - ``fragment_shader`` 中可以通过 ``uniform sampler2D fbo`` 读取所应用物件的渲染结果
+    - 如果传入了 ``margin``，则只会在所应用物件的包围框向外扩展 ``margin`` 的区域内进行处理，
+      当效果只影响物件附近的区域时（例如模糊、发光），这可以减少许多开销；
+      默认为 ``None``，表示对整个画面进行处理
+    '''
     renderer_cls = FrameEffectRenderer
 
     apprs = CmptInfo(Cmpt_List[Self, Timeline.ItemAppearance])
@@ -21,12 +29,14 @@ class FrameEffect(Item):
         *items: Item,
         fragment_shader: str,
         cache_key: str | None = None,
+        margin: float | None = None,
         root_only: bool = False,
         **kwargs
     ):
         super().__init__(**kwargs)
         self.fragment_shader = fragment_shader
         self.cache_key = cache_key
+        self.margin = margin
 
         self.apply(*items, root_only=root_only)
 
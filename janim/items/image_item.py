@@ -461,8 +461,8 @@ class VideoInfo:
             Config.get.ffprobe_bin,
             '-v', 'error',
             '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height,r_frame_rate,nb_frames',
-            '-of', 'csv=p=0',
+            '-show_entries', 'stream=width,height,r_frame_rate,nb_frames,color_space,color_range',
+            '-of', 'default=noprint_wrappers=1',
             file_path
         ]
 
@@ -480,12 +480,20 @@ class VideoInfo:
             raise ExitException(EXITCODE_FFPROBE_ERROR)
 
         assert ret
-        s_width, s_height, s_fps, s_nb_frames = ret.split(',')
-
-        self.width = int(s_width)
-        self.height = int(s_height)
-        self.fps_num, self.fps_den = map(int, s_fps.split('/'))
-        self.nb_frames = int(s_nb_frames)
+        # 输出的每一行形如 key=value，并且不一定按照 -show_entries 中的顺序
+        entries = dict(
+            line.split('=', 1)
+            for line in ret.splitlines()
+            if '=' in line
+        )
+
+        self.width = int(entries['width'])
+        self.height = int(entries['height'])
+        self.fps_num, self.fps_den = map(int, entries['r_frame_rate'].split('/'))
+        self.nb_frames = int(entries['nb_frames'])
+        # 色彩空间（例如 bt709、bt470bg、smpte170m）与范围（tv 或 pc），未标注时为 unknown
+        self.color_space = entries.get('color_space', 'unknown')
+        self.color_range = entries.get('color_range', 'unknown')
 
 
 class PixelVideo(Video):
@@ -5,8 +5,8 @@ import inspect
 import itertools as it
 import types
 from dataclasses import dataclass
-from typing import (TYPE_CHECKING, Any, Callable, Iterable, Self,
-                    SupportsIndex, overload)
+from typing import (TYPE_CHECKING, Any, Callable, ContextManager, Iterable,
+                    Mapping, Self, SupportsIndex, overload)
 
 from janim.components.component import CmptInfo, Component, _CmptGroup
 from janim.components.depth import Cmpt_Depth
@@ -19,9 +19,10 @@ from janim.typing import SupportsApartAlpha
 from janim.utils.data import AlignedData
 from janim.utils.iterables import resize_preserving_order
 from janim.utils.paths import PathFunc, straight_path
-from janim.utils.signal import SIGNAL_OBJ_SLOTS_NAME
+from janim.utils.signal import SIGNAL_OBJ_SLOTS_NAME, Signal
 
 if TYPE_CHECKING:
+    from janim.anims.timeline import Timeline
     from janim.items.points import Group
 
 _ = get_local_strings('item')
@@ -31,6 +32,9 @@ CLS_STYLES_NAME = '__cls_styles'
 ALL_STYLES_NAME = '__all_styles'
 MOCKABLE_NAME = '__mockable'
 
+# 大多数物件不会使用 astype，所以默认共用这个只读的空映射，在第一次需要时才创建字典
+_NO_MOCK_CMPT: Mapping[str, Component] = types.MappingProxyType({})
+
 
 class _ItemMeta(type):
     '''
@@ -128,7 +132,7 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
         self.timeline = Timeline.get_context(raise_exc=False)
 
         self._astype: type[Item] | None = None
-        self._astype_mock_cmpt: dict[str, Component] = {}
+        self._astype_mock_cmpt: dict[str, Component] | Mapping[str, Component] = _NO_MOCK_CMPT
 
         self._fix_in_frame = False
 
@@ -192,11 +196,33 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
                     if mock_cmpt is not None:
                         mock_cmpt.mark_refresh(func)
 
+        marker = (cmpt.bind.decl_cls, cmpt.bind.key, func.__name__ if callable(func) else func)
+
         if recurse_up:
-            mark(self.ancestors())
+            mark(self.get_refresh_targets(marker, up=True))
 
         if recurse_down:
-            mark(self.descendants())
+            mark(self.get_refresh_targets(marker, up=False))
+
+    def batch_edit(self) -> ContextManager[None]:
+        '''
+        批量编辑，在 ``with`` 块中对物件的修改所产生的刷新标记会被合并，在退出时统一处理
+
+        例如：
+
+        .. code-block:: python
+
+            with group.batch_edit():
+                for item in group:
+                    item.points.shift(UP)
+                    item.color.set(RED)
+
+        同一个物件的多次修改只会进行一次标记，祖先物件也只会被遍历一次；
+        在块中读取 ``box`` 等缓存值时仍然会得到正确的结果，只是会提前处理已有的标记
+
+        该效果并不局限于 ``self``，而是作用于 ``with`` 块中的所有物件，详见 :meth:`~.Signal.defer_emits`
+        '''
+        return Signal.defer_emits()
 
     def set(self, **styles) -> Self:
         '''
@@ -427,6 +453,8 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
         cmpt = cmpt_info.create()
         cmpt.init_bind(Component.BindInfo(decl_cls, self, name))
 
+        if self._astype_mock_cmpt is _NO_MOCK_CMPT:
+            self._astype_mock_cmpt = {}
         self._astype_mock_cmpt[name] = cmpt
         return cmpt
 
@@ -474,7 +502,7 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
             setattr(copy_item, key, cmpt_copy)
 
         copy_item.components = new_cmpts
-        copy_item._astype_mock_cmpt = {}
+        copy_item._astype_mock_cmpt = _NO_MOCK_CMPT
 
     def copy(self, *, root_only: bool = False):
         '''
@@ -482,7 +510,8 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
         '''
         copy_item = copy.copy(self)
         copy_item.reset_refresh()
-        setattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None)
+        if getattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None) is not None:
+            setattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None)
 
         copy_item.parents = []
         copy_item.children = []
@@ -526,7 +555,8 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
     def store(self):
         copy_item = copy.copy(self)
         copy_item.reset_refresh()
-        setattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None)
+        if getattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None) is not None:
+            setattr(copy_item, SIGNAL_OBJ_SLOTS_NAME, None)
 
         copy_item.parents = []
         copy_item.children = []
@@ -635,6 +665,14 @@ class Item(Relation['Item'], metaclass=_ItemMeta):
         '''
         pass
 
+    def _get_mergeable_apprs(self) -> list[Timeline.ItemAppearance]:
+        '''
+        由子类继承，返回可以合并到自身的渲染器中进行绘制的物件
+
+        这些物件在绘制顺序中相邻的部分会通过渲染器的 ``render_merged`` 一次绘制，详见 :meth:`~.Timeline.render_all` 中的注释
+        '''
+        return []
+
     # endregion
 
     # region timeline
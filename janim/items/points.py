@@ -75,6 +75,46 @@ class DotCloud(Points):
         super().__init__(*args, **kwargs)
 
         self.points.resize_func = resize_preserving_order
+        self.gpu_updater: str | None = None
+
+    def gpu_update(self, code: str | None) -> Self:
+        '''
+        设置在 GPU 上对每个点进行计算的函数，传入 ``None`` 则取消
+
+        ``code`` 中需要使用 GLSL 定义如下函数：
+
+        .. code-block:: glsl
+
+            void update(int index, float t, inout vec3 point, inout vec4 color, inout float radius)
+            {
+                ...
+            }
+
+        其中 ``index`` 是点的下标，``t`` 是当前的全局时间，``point`` ``color`` ``radius`` 初始为物件中的数据，
+        对它们的修改只会影响渲染结果，不会改变物件本身的数据
+
+        适用于点数非常多（例如 10^5 以上）并且位置或颜色随时间变化的情况，
+        与使用 :class:`~.DataUpdater` 在 Python 中每帧重新计算整个数组相比开销小得多
+
+        例：
+
+        .. code-block:: python
+
+            dots = DotCloud(*points)
+            dots.gpu_update("""
+                void update(int index, float t, inout vec3 point, inout vec4 color, inout float radius)
+                {
+                    point.y += 0.2 * sin(t * 2.0 + point.x);
+                }
+            """)
+
+        注：
+
+        - 需要 OpenGL 4.3 及以上
+        - 请在物件显示前调用，因为 ``gpu_updater`` 不是组件数据，之后的更改不会被时间轴记录
+        '''
+        self.gpu_updater = code
+        return self
 
     def init_connect(self) -> None:
         super().init_connect()
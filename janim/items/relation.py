@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Callable, Generator, Self
+from typing import Callable, Generator, Hashable, Self
 
 import janim.utils.refresh as refresh
 from janim.utils.signal import Signal
@@ -50,15 +50,37 @@ class Relation[GRelT: 'Relation'](refresh.Refreshable):
         name = func.__name__ if callable(func) else func
 
         if recurse_up:
-            for obj in self.ancestors():
+            for obj in self.get_refresh_targets(name, up=True):
                 if hasattr(obj, name):
                     obj.mark_refresh(name)
 
         if recurse_down:
-            for obj in self.descendants():
+            for obj in self.get_refresh_targets(name, up=False):
                 if hasattr(obj, name):
                     obj.mark_refresh(name)
 
+    def get_refresh_targets(self, marker: Hashable, *, up: bool) -> list[GRelT]:
+        '''
+        得到递归标记时需要标记的对象，即 :meth:`ancestors` 或 :meth:`descendants`
+
+        在 :meth:`~.Signal.flush_deferred` 期间，对于同一个 ``marker``，会跳过已经标记过的对象以及它们的祖先（后代）
+        '''
+        visited = Signal.get_refresh_visited((marker, up))
+        if visited is None:
+            return self.ancestors() if up else self.descendants()
+
+        result: list[GRelT] = []
+        stack = list(self.parents if up else self.children)
+        while stack:
+            obj = stack.pop()
+            if id(obj) in visited:
+                continue
+            visited.add(id(obj))
+            result.append(obj)
+            stack.extend(obj.parents if up else obj.children)
+
+        return result
+
     @Signal
     def parents_changed(self) -> None:
         '''
@@ -79,20 +101,29 @@ class Relation[GRelT: 'Relation'](refresh.Refreshable):
 
         如果 ``insert=True`` （默认为 ``False``），那么插入到子物件列表的开头
         '''
+        # 使用集合判断是否已经存在，避免大量添加时的 O(n^2) 开销
+        # Use a set for membership checks to avoid O(n^2) cost when adding many objects.
+        children_set = set(self.children)
+        new_children = []
+
         for obj in (reversed(objs) if insert else objs):
             # 理论上这里判断 item not in self.children 就够了，但是防止
             # 有被私自修改 self.parents 以及 self.children 的可能，所以这里都判断了
             # Theoretically, checking item not in self.children is enough here, but to prevent
             # possible modifications to self.parents and self.children, both checks are made here.
-            if obj not in self.children:
-                if insert:
-                    self.children.insert(0, obj)
-                else:
-                    self.children.append(obj)
+            if obj not in children_set:
+                children_set.add(obj)
+                new_children.append(obj)
             if self not in obj.parents:
                 obj.parents.append(self)
             obj.parents_changed()
 
+        if insert:
+            new_children.reverse()
+            self.children[:0] = new_children
+        else:
+            self.children.extend(new_children)
+
         self.children_changed()
         return self
 
@@ -100,12 +131,19 @@ class Relation[GRelT: 'Relation'](refresh.Refreshable):
         '''
         从该对象移除子对象
         '''
+        if len(objs) == 1:
+            try:
+                self.children.remove(objs[0])
+            except ValueError: ...
+        else:
+            # 一次性过滤，避免逐个 list.remove 带来的 O(n^2) 开销
+            # Filter in one pass to avoid the O(n^2) cost of repeated list.remove.
+            removing = set(objs)
+            self.children[:] = [obj for obj in self.children if obj not in removing]
+
         for obj in objs:
             # 理论上这里判断 `item in self.children` 就够了，原因同 `add`
             # Theoretically, checking `item in self.children` is enough here, for the same reason as `add`.
-            try:
-                self.children.remove(obj)
-            except ValueError: ...
             try:
                 obj.parents.remove(self)
             except ValueError: ...
@@ -130,17 +168,15 @@ class Relation[GRelT: 'Relation'](refresh.Refreshable):
 
     def _family(self, *, up: bool) -> list[GRelT]:  # use DFS
         lst = self.parents if up else self.children
-        res = []
+        # 使用 dict 作为有序集合去重，并且直接使用子对象已缓存的结果，避免重复计算
+        # Use a dict as an ordered set for deduplication, and reuse the cached results of sub objects.
+        res: dict[GRelT, None] = {}
 
         for sub_obj in lst:
-            if sub_obj not in res:
-                res.append(sub_obj)
-            res.extend(filter(
-                lambda obj: obj not in res,
-                sub_obj._family(up=up)
-            ))
+            res.setdefault(sub_obj)
+            res.update(dict.fromkeys(sub_obj.ancestors() if up else sub_obj.descendants()))
 
-        return res
+        return list(res)
 
     @parents_changed.self_refresh_with_recurse(recurse_down=True)
     @refresh.register
@@ -174,18 +210,22 @@ class Relation[GRelT: 'Relation'](refresh.Refreshable):
         fn_family: Callable[[Relation], list[Relation]],
     ) -> Generator[RelT, None, None]:
 
-        lst = fn_family(self)[:]
+        lst = fn_family(self)
+        # 使用下标代替 lst.pop(0)，避免 O(n^2) 的开销
+        # Use an index instead of lst.pop(0) to avoid O(n^2) cost.
+        idx = 0
 
-        while lst:
-            obj = lst.pop(0)
+        while idx < len(lst):
+            obj = lst[idx]
+            idx += 1
             if isinstance(obj, base_cls):
                 # DFS 结构保证了使用该做法进行剔除的合理性
                 # DFS structure ensures the validity of using this method for removal.
                 for sub_obj in fn_family(obj):
-                    if not lst:
+                    if idx >= len(lst):
                         break
-                    if lst[0] is sub_obj:
-                        lst.pop(0)
+                    if lst[idx] is sub_obj:
+                        idx += 1
                 yield obj
 
     def walk_ancestors[RelT](self, base_cls: type[RelT] = None) -> Generator[RelT, None, None]:
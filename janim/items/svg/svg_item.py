@@ -1,11 +1,14 @@
 
+from __future__ import annotations
+
+import hashlib
 import os
+import zipfile
 from collections import defaultdict
 from functools import partial
-from typing import Any, Callable, Self
+from typing import TYPE_CHECKING, Any, Callable, Self
 
 import numpy as np
-import svgelements as se
 
 from janim.constants import FRAME_PPI, ORIGIN, RIGHT, TAU
 from janim.items.geometry.arc import Circle
@@ -17,17 +20,28 @@ from janim.items.text import Text, TextLine
 from janim.items.vitem import VItem
 from janim.locale.i18n import get_local_strings
 from janim.logger import log
+from janim.render.renderer_vitem_group import VItemGroupRenderer
 from janim.utils.bezier import PathBuilder, quadratic_bezier_points_for_arc
 from janim.utils.config import Config
-from janim.utils.file_ops import find_file
+from janim.utils.file_ops import find_file, get_svg_cache_dir
 from janim.utils.space_ops import rotation_about_z
 
+if TYPE_CHECKING:
+    import svgelements as se
+
+    from janim.anims.timeline import Timeline
+
 _ = get_local_strings('svg_item')
 
 type SVGElemItem = VItem
 type ItemBuilder = Callable[[], SVGElemItem]
 type GroupIndexer = defaultdict[str, list[int]]
 
+GEOMETRY_CACHE_VERSION = 1
+'''
+几何数据缓存的格式版本，缓存的格式或解析的逻辑发生变化时需要增加，使得旧的缓存失效
+'''
+
 
 def _point_to_3d(x: float, y: float) -> np.ndarray:
     return np.array([x, y, 0])
@@ -49,6 +63,8 @@ class SVGItem(Group[SVGElemItem]):
     '''
     传入 SVG 文件路径，解析为物件
     '''
+    renderer_cls = VItemGroupRenderer
+
     vitem_builders_map: dict[tuple, tuple[list[ItemBuilder], GroupIndexer]] = {}
     group_key: str | None = None
 
@@ -96,6 +112,9 @@ class SVGItem(Group[SVGElemItem]):
         self.scale_descendants_stroke_radius(factor)
         self.move_into_position()
 
+    def _get_mergeable_apprs(self) -> list[Timeline.ItemAppearance]:
+        return VItemGroupRenderer.get_mergeable_apprs(self)
+
     def move_into_position(self) -> None:
         pass
 
@@ -139,6 +158,25 @@ class SVGItem(Group[SVGElemItem]):
         if cached is not None:
             return cls.build_items(*cached)
 
+        cache_path = cls.get_geometry_cache_path(file_path)
+        cached = cls.load_geometry_cache(cache_path)
+        if cached is not None:
+            SVGItem.vitem_builders_map[key] = cached
+            return cls.build_items(*cached)
+
+        builders, indexers = cls.parse_builders(file_path)
+        cls.save_geometry_cache(cache_path, builders, indexers)
+
+        SVGItem.vitem_builders_map[key] = (builders, indexers)
+        return cls.build_items(builders, indexers)
+
+    @classmethod
+    def parse_builders(cls, file_path: str) -> tuple[list[ItemBuilder], GroupIndexer]:
+        '''
+        使用 svgelements 解析文件，得到用于创建物件的函数列表以及分组信息
+        '''
+        import svgelements as se
+
         svg: se.SVG = se.SVG.parse(file_path)   # PPI=96
 
         offset = np.array([svg.width / -2, svg.height / -2])
@@ -197,8 +235,107 @@ class SVGItem(Group[SVGElemItem]):
             for name in names:
                 indexers[name].append(len(builders) - 1)
 
-        SVGItem.vitem_builders_map[key] = (builders, indexers)
-        return cls.build_items(builders, indexers)
+        return builders, indexers
+
+    # region 几何数据缓存 | Geometry cache
+
+    @classmethod
+    def get_geometry_cache_path(cls, file_path: str) -> str:
+        '''
+        得到文件对应的几何数据缓存路径，以文件内容的哈希值（以及 ``group_key``）作为键
+        '''
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            md5.update(f.read())
+        md5.update(repr(cls.group_key).encode())
+        return os.path.join(get_svg_cache_dir(), f'{md5.hexdigest()}_v{GEOMETRY_CACHE_VERSION}.npz')
+
+    @staticmethod
+    def load_geometry_cache(cache_path: str) -> tuple[list[ItemBuilder], GroupIndexer] | None:
+        '''
+        从缓存中读取 :meth:`save_geometry_cache` 保存的几何数据，缓存不存在或无法读取时返回 ``None``
+        '''
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with np.load(cache_path) as data:
+                points = data['points']
+                counts = data['counts']
+                stroke_radius = data['stroke_radius'].tolist()
+                stroke_color = data['stroke_color'].tolist()
+                stroke_alpha = data['stroke_alpha'].tolist()
+                fill_color = data['fill_color'].tolist()
+                fill_alpha = data['fill_alpha'].tolist()
+                group_names = data['group_names'].tolist()
+                group_counts = data['group_counts']
+                group_indices = data['group_indices'].tolist()
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+        splits = np.cumsum(counts)[:-1]
+        builders: list[ItemBuilder] = [
+            partial(
+                SVGItem.build_path_item,
+                item_points,
+                dict(
+                    stroke_radius=stroke_radius[i],
+                    stroke_color=stroke_color[i] or None,
+                    stroke_alpha=stroke_alpha[i],
+                    fill_color=fill_color[i] or None,
+                    fill_alpha=fill_alpha[i]
+                )
+            )
+            for i, item_points in enumerate(np.split(points, splits))
+        ]
+
+        indexers: GroupIndexer = defaultdict(list)
+        start = 0
+        for name, count in zip(group_names, group_counts.tolist()):
+            indexers[name] = group_indices[start: start + count]
+            start += count
+
+        return builders, indexers
+
+    @staticmethod
+    def save_geometry_cache(cache_path: str, builders: list[ItemBuilder], indexers: GroupIndexer) -> None:
+        '''
+        将几何数据保存到缓存中，使得新进程中无需再次解析文件（也无需导入 svgelements）
+
+        只有当所有元素都是路径时才会保存，其它元素（例如文字）需要在创建物件时才能得到几何数据
+        '''
+        if not builders or not all(
+            isinstance(builder, partial) and builder.func is SVGItem.build_path_item
+            for builder in builders
+        ):
+            return
+
+        styles = [builder.args[1] for builder in builders]
+        group_names = list(indexers.keys())
+
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    points=np.vstack([builder.args[0] for builder in builders]),
+                    counts=np.array([len(builder.args[0]) for builder in builders]),
+                    stroke_radius=np.array([style['stroke_radius'] for style in styles], dtype=float),
+                    stroke_color=np.array([style['stroke_color'] or '' for style in styles], dtype=str),
+                    stroke_alpha=np.array([style['stroke_alpha'] for style in styles], dtype=float),
+                    fill_color=np.array([style['fill_color'] or '' for style in styles], dtype=str),
+                    fill_alpha=np.array([style['fill_alpha'] for style in styles], dtype=float),
+                    group_names=np.array(group_names, dtype=str),
+                    group_counts=np.array([len(indexers[name]) for name in group_names], dtype=int),
+                    group_indices=np.array([idx for name in group_names for idx in indexers[name]], dtype=int)
+                )
+            # 先写入临时文件再重命名，避免其它进程读取到不完整的缓存
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # endregion
 
     @staticmethod
     def build_items(
@@ -238,6 +375,8 @@ class SVGItem(Group[SVGElemItem]):
 
     @staticmethod
     def convert_path(path: se.Path, offset: np.ndarray) -> ItemBuilder:
+        import svgelements as se
+
         builder = PathBuilder()
 
         transform_cache: tuple[se.Matrix, np.ndarray, np.ndarray] | None = None
@@ -302,12 +441,13 @@ class SVGItem(Group[SVGElemItem]):
         vitem_points = builder.get()
         vitem_points[:, :2] += offset
 
-        def vitem_builder() -> VItem:
-            vitem = VItem(**vitem_styles)
-            vitem.points.set(vitem_points)
-            return vitem
+        return partial(SVGItem.build_path_item, vitem_points, vitem_styles)
 
-        return vitem_builder
+    @staticmethod
+    def build_path_item(points: np.ndarray, styles: dict) -> VItem:
+        vitem = VItem(**styles)
+        vitem.points.set(points)
+        return vitem
 
     @staticmethod
     def convert_line(line: se.SimpleLine, offset: np.ndarray) -> ItemBuilder:
@@ -373,6 +513,8 @@ class SVGItem(Group[SVGElemItem]):
 
     @staticmethod
     def convert_text(text: se.Text, offset: np.ndarray) -> ItemBuilder:
+        import svgelements as se
+
         styles = SVGItem.get_styles_from_shape(text)
 
         transform = se.Matrix(text.values.get('transform', ''))
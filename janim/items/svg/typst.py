@@ -4,7 +4,9 @@ import hashlib
 import itertools as it
 import os
 import subprocess as sp
+import threading
 import types
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterable, Self, overload
 
 import numpy as np
@@ -45,21 +47,107 @@ class TypstDoc(SVGItem):
         **kwargs
     ):
         self.text = text
+        compile_args = TypstDoc.get_compile_args(
+            text,
+            shared_preamble=shared_preamble,
+            additional_preamble=additional_preamble
+        )
+
+        super().__init__(self.compile_typst(*compile_args), scale=scale, **kwargs)
+
+    def move_into_position(self) -> None:
+        self.points.scale(0.9, about_point=ORIGIN).to_border(UP)
+
+    @classmethod
+    def get_compile_args(
+        cls,
+        text: str,
+        *,
+        shared_preamble: str | None = None,
+        additional_preamble: str | None = None,
+        **kwargs
+    ) -> tuple[str, str, str]:
+        '''
+        得到使用这些参数创建对象时，传给 :meth:`compile_typst` 的参数，多余的参数会被忽略
+        '''
         if shared_preamble is None:
             shared_preamble = Config.get.typst_shared_preamble
         if additional_preamble is None:
             additional_preamble = ''
+        return text, shared_preamble, additional_preamble
 
-        super().__init__(self.compile_typst(text, shared_preamble, additional_preamble), scale=scale, **kwargs)
+    @classmethod
+    def prefetch(cls, *texts: str, **kwargs) -> list[Future[str]]:
+        '''
+        在后台并行编译 ``texts``，之后使用相同的参数创建对象时，只需要等待对应的编译完成（或者直接读取缓存）
 
-    def move_into_position(self) -> None:
-        self.points.scale(0.9, about_point=ORIGIN).to_border(UP)
+        例如，在 ``construct`` 的开头：
+
+        .. code-block:: python
+
+            TypstMath.prefetch('a^2 + b^2 = c^2', 'e^(i pi) + 1 = 0')
+
+        这样后续创建这些公式时就不需要逐个等待 typst 编译
+        '''
+        return [
+            cls.compile_typst_async(*cls.get_compile_args(text, **kwargs))
+            for text in texts
+        ]
+
+    @classmethod
+    def batch(cls, texts: Iterable[str], **kwargs) -> list[Self]:
+        '''
+        使用相同的参数创建多个对象，所有未缓存的内容会先并行编译
+
+        .. code-block:: python
+
+            a, b, c = TypstMath.batch(['a^2', 'b^2', 'c^2'], color=BLUE)
+        '''
+        texts = list(texts)
+        cls.prefetch(*texts, **kwargs)
+        return [cls(text, **kwargs) for text in texts]
 
     @staticmethod
     def compile_typst(text: str, shared_preamble: str, additional_preamble: str) -> str:
         '''
-        编译 Typst 文档
+        编译 Typst 文档，得到 SVG 文件路径
+
+        如果相同的内容已经通过 :meth:`compile_typst_async` 在后台编译，则等待其完成
+        '''
+        svg_file_path, typst_content = TypstDoc._prepare_typst(text, shared_preamble, additional_preamble)
+        if os.path.exists(svg_file_path):
+            return svg_file_path
+
+        future = typst_futures.get(svg_file_path, None)
+        if future is not None:
+            return future.result()
+
+        return _run_typst(Config.get.typst_bin, typst_content, svg_file_path)
+
+    @staticmethod
+    def compile_typst_async(text: str, shared_preamble: str, additional_preamble: str) -> Future[str]:
+        '''
+        在后台线程中编译 Typst 文档，返回 SVG 文件路径的 :class:`~concurrent.futures.Future`
+
+        最多同时进行 :data:`TYPST_MAX_WORKERS` 个 typst 进程；相同的内容只会编译一次
         '''
+        svg_file_path, typst_content = TypstDoc._prepare_typst(text, shared_preamble, additional_preamble)
+        if os.path.exists(svg_file_path):
+            future = Future()
+            future.set_result(svg_file_path)
+            return future
+
+        future = typst_futures.get(svg_file_path, None)
+        if future is None:
+            # 工作线程中无法读取当前的 Config，所以这里传入 typst_bin
+            future = get_typst_executor().submit(_run_typst, Config.get.typst_bin, typst_content, svg_file_path)
+            typst_futures[svg_file_path] = future
+            future.add_done_callback(lambda _: typst_futures.pop(svg_file_path, None))
+
+        return future
+
+    @staticmethod
+    def _prepare_typst(text: str, shared_preamble: str, additional_preamble: str) -> tuple[str, str]:
         typst_temp_dir = get_typst_temp_dir()
         md5 = hashlib.md5(text.encode())
         md5.update(shared_preamble.encode())
@@ -67,8 +155,6 @@ class TypstDoc(SVGItem):
         hash_hex = md5.hexdigest()
 
         svg_file_path = os.path.join(typst_temp_dir, hash_hex + '.svg')
-        if os.path.exists(svg_file_path):
-            return svg_file_path
 
         typst_content = get_typst_template().format(
             shared_preamble=shared_preamble,
@@ -76,31 +162,7 @@ class TypstDoc(SVGItem):
             typst_expression=text
         )
 
-        commands = [
-            Config.get.typst_bin,
-            'compile',
-            '-',
-            svg_file_path,
-            '-f', 'svg'
-        ]
-
-        try:
-            process = sp.Popen(commands, stdin=sp.PIPE)
-        except FileNotFoundError:
-            log.error(_('Could not compile typst file. '
-                        'Please install typst and add it to the environment variables.'))
-            raise ExitException(EXITCODE_TYPST_NOT_FOUND)
-
-        process.stdin.write(typst_content.encode('utf-8'))
-        process.stdin.close()
-        ret = process.wait()
-        if ret != 0:
-            log.error(_('Typst compilation error. Please check the output for more information.'))
-            raise ExitException(EXITCODE_TYPST_COMPILE_ERROR)
-
-        process.terminate()
-
-        return svg_file_path
+        return svg_file_path, typst_content
 
     @classmethod
     def typstify(cls, obj: TypstPattern) -> TypstDoc:
@@ -361,13 +423,14 @@ class TypstText(TypstDoc):
         use_math_environment: bool = False,
         **kwargs
     ):
-        if preamble is None:
-            if use_math_environment:
-                preamble = Config.get.typst_math_preamble
-            else:
-                preamble = Config.get.typst_text_preamble
+        text, shared_preamble, preamble = TypstText.get_compile_args(
+            text,
+            shared_preamble=shared_preamble,
+            preamble=preamble,
+            use_math_environment=use_math_environment
+        )
         super().__init__(
-            f'$ {text} $' if use_math_environment else text,
+            text,
             shared_preamble=shared_preamble,
             additional_preamble=preamble,
             **kwargs
@@ -376,6 +439,27 @@ class TypstText(TypstDoc):
     def move_into_position(self) -> None:
         self.points.to_center()
 
+    @classmethod
+    def get_compile_args(
+        cls,
+        text: str,
+        *,
+        shared_preamble: str | None = None,
+        preamble: str | None = None,
+        use_math_environment: bool = False,
+        **kwargs
+    ) -> tuple[str, str, str]:
+        if preamble is None:
+            if use_math_environment:
+                preamble = Config.get.typst_math_preamble
+            else:
+                preamble = Config.get.typst_text_preamble
+        return TypstDoc.get_compile_args(
+            f'$ {text} $' if use_math_environment else text,
+            shared_preamble=shared_preamble,
+            additional_preamble=preamble
+        )
+
 
 class TypstMath(TypstText):
     '''
@@ -400,6 +484,10 @@ class TypstMath(TypstText):
             **kwargs
         )
 
+    @classmethod
+    def get_compile_args(cls, text: str, *, use_math_environment: bool = True, **kwargs) -> tuple[str, str, str]:
+        return super().get_compile_args(text, use_math_environment=use_math_environment, **kwargs)
+
 
 class Typst(TypstMath):
     def __init__(self, text: str, **kwargs):
@@ -412,6 +500,60 @@ class Typst(TypstMath):
         super().__init__(text, **kwargs)
 
 
+TYPST_MAX_WORKERS = min(8, max(2, os.cpu_count() or 1))
+'''
+后台编译时最多同时运行的 typst 进程数量
+
+即使只有单核，同时运行两个进程也能让进程启动与文件读写的等待相互重叠
+'''
+
+typst_executor: ThreadPoolExecutor | None = None
+typst_futures: dict[str, Future[str]] = {}
+
+
+def get_typst_executor() -> ThreadPoolExecutor:
+    global typst_executor
+
+    if typst_executor is None:
+        typst_executor = ThreadPoolExecutor(TYPST_MAX_WORKERS, thread_name_prefix='janim-typst')
+    return typst_executor
+
+
+def _run_typst(typst_bin: str, typst_content: str, svg_file_path: str) -> str:
+    # 先输出到临时文件再重命名，避免其它进程读取到未写完的文件
+    temp_file_path = f'{svg_file_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    commands = [
+        typst_bin,
+        'compile',
+        '-',
+        temp_file_path,
+        '-f', 'svg'
+    ]
+
+    try:
+        process = sp.Popen(commands, stdin=sp.PIPE)
+    except FileNotFoundError:
+        log.error(_('Could not compile typst file. '
+                    'Please install typst and add it to the environment variables.'))
+        raise ExitException(EXITCODE_TYPST_NOT_FOUND)
+
+    process.stdin.write(typst_content.encode('utf-8'))
+    process.stdin.close()
+    ret = process.wait()
+    if ret != 0:
+        # 编译出错时 typst 可能已经输出了部分内容，需要清理掉未完成的临时文件
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        log.error(_('Typst compilation error. Please check the output for more information.'))
+        raise ExitException(EXITCODE_TYPST_COMPILE_ERROR)
+
+    process.terminate()
+    os.replace(temp_file_path, svg_file_path)
+
+    return svg_file_path
+
+
 cached_typst_template: str | None = None
 
 
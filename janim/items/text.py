@@ -5,7 +5,7 @@ import itertools as it
 import re
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Callable, Concatenate, Iterable, Self
+from typing import TYPE_CHECKING, Any, Callable, Concatenate, Iterable, Self
 
 import numpy as np
 
@@ -19,13 +19,17 @@ from janim.items.points import Group
 from janim.items.vitem import VItem
 from janim.locale.i18n import get_local_strings
 from janim.logger import log
-from janim.typing import JAnimColor
+from janim.render.renderer_vitem_group import VItemGroupRenderer
+from janim.typing import JAnimColor, Vect
 from janim.utils.config import Config
 from janim.utils.font.database import Font, get_font_info_by_attrs
 from janim.utils.font.variant import Style, StyleName, Weight, WeightName
 from janim.utils.simple_functions import decode_utf8
 from janim.utils.space_ops import get_norm, normalize
 
+if TYPE_CHECKING:
+    from janim.anims.timeline import Timeline
+
 _ = get_local_strings('text')
 
 DEFAULT_FONT_SIZE = 24
@@ -59,6 +63,8 @@ type ActAt = int
 type ActStart = tuple[ActName, ActParams]
 type ActEnd = str
 
+type Glyph = tuple[Font, np.ndarray, tuple[int, int]]
+
 available_act_map: dict[ActName, list[Act]] = defaultdict(list)
 
 
@@ -122,15 +128,24 @@ class TextChar(VItem):
         fonts: list[Font],
         font_size: float,
         fill_alpha=None,
+        *,
+        glyph: Glyph | None = None,
+        offset: Vect | None = None,
         **kwargs
     ):
+        '''
+        - ``glyph``: 预先由 :meth:`TextLine.layout_glyphs` 得到的字形，如果没有传入则在这里查找
+        - ``offset``: 字符的位置，如果没有传入则位于原点，需要由 :meth:`TextLine.arrange_in_line` 排列
+        '''
         super().__init__(fill_alpha=fill_alpha, **kwargs)
         self.char = char
 
-        unicode = decode_utf8(char)
-        font_render = self.get_font_for_render(unicode, fonts)
-
-        outline, advance = font_render.get_glyph_data(unicode)
+        if glyph is None:
+            unicode = decode_utf8(char)
+            font_render = self.get_font_for_render(unicode, fonts)
+            outline, advance = font_render.get_glyph_data(unicode)
+        else:
+            font_render, outline, advance = glyph
 
         # 因为 get_glyph_data 得到的字形是 font_size=48 的字形（具体参考 janim.utils.font.Font.__init__ 中的 set_char_size）
         # 所以这里使用 font_size / ORIG_FONT_SIZE 缩放到目标字号
@@ -144,13 +159,19 @@ class TextChar(VItem):
 
         scale_factor = font_scale_factor * frame_scale_factor
 
-        self.points.set(outline * scale_factor)
-
-        # 标记位置
-        self.mark.set([
+        points = outline * scale_factor
+        mark = np.array([
             ORIGIN, RIGHT * font_scale_factor, UP * font_scale_factor,
             [advance[0] * scale_factor, advance[1] * scale_factor, 0]
         ])
+        if offset is not None:
+            points += offset
+            mark += offset
+
+        self.points.set(points)
+
+        # 标记位置
+        self.mark.set(mark)
 
     def init_connect(self) -> None:
         super().init_connect()
@@ -166,13 +187,10 @@ class TextChar(VItem):
         '''
         从字体列表中找到支持显示 ``unicode`` 的字体，如果找不到只好选用第一个
         '''
-        font_render = fonts[0]
         for font in fonts:
-            idx = font.face.get_char_index(unicode)
-            if idx != 0:
-                font_render = font
-                break
-        return font_render
+            if font.has_char(unicode):
+                return font
+        return fonts[0]
 
     def get_mark_orig(self) -> np.ndarray:
         return self.mark._points.data[0]
@@ -227,6 +245,8 @@ class TextLine(VItem, Group[TextChar]):
     '''
     单行文字物件，作为 :class:`Text` 的子物件，在创建 :class:`Text` 时产生s
     '''
+    renderer_cls = VItemGroupRenderer
+
     mark = CmptInfo(Cmpt_Points[Self])
 
     def __init__(
@@ -236,22 +256,62 @@ class TextLine(VItem, Group[TextChar]):
         font_size: float,
         char_kwargs={},
         fill_alpha=None,
+        *,
+        offset: Vect | None = None,
         **kwargs
     ):
+        '''
+        - ``offset``: 如果传入，则直接将字符排列在以 ``offset`` 为起点的一行上，不再需要调用 :meth:`arrange_in_line`
+        '''
         self.text = text
 
+        glyphs = self.layout_glyphs(text, fonts)
+        font_scale_factor = font_size / ORIG_FONT_SIZE
+
+        if offset is None:
+            offsets = [None] * len(text)
+        else:
+            # 与 arrange_in_line(buff=0) 的结果一致：每个字符的起点是前面所有字符 advance 的累加
+            # 缩放因子参考 TextChar.__init__
+            scale_factor = font_scale_factor * Config.get.default_pixel_to_frame_ratio / 64
+            advances = np.zeros((len(text), 3))
+            if glyphs:
+                advances[:, :2] = [glyph[2] for glyph in glyphs]
+                advances *= scale_factor
+            offsets = np.cumsum(advances, axis=0) - advances + offset
+
         super().__init__(
             *[
-                TextChar(char, fonts, font_size, **char_kwargs)
-                for char in text
+                TextChar(char, fonts, font_size, glyph=glyph, offset=char_offset, **char_kwargs)
+                for char, glyph, char_offset in zip(text, glyphs, offsets)
             ],
             fill_alpha=fill_alpha,
             **kwargs
         )
 
         # 标记位置
-        self.mark.set([ORIGIN, RIGHT, UP])
-        self.mark.scale(font_size / ORIG_FONT_SIZE, about_point=ORIGIN)
+        mark = np.array([ORIGIN, RIGHT, UP]) * font_scale_factor
+        if offset is not None:
+            mark += offset
+        self.mark.set(mark)
+
+    @staticmethod
+    def layout_glyphs(text: str, fonts: list[Font]) -> list[Glyph]:
+        '''
+        为 ``text`` 中的每个字符找到用于显示的字体以及字形数据
+
+        相同的字符只会查找一次
+        '''
+        glyph_map: dict[str, Glyph] = {}
+        glyphs: list[Glyph] = []
+        for char in text:
+            glyph = glyph_map.get(char, None)
+            if glyph is None:
+                unicode = decode_utf8(char)
+                font_render = TextChar.get_font_for_render(unicode, fonts)
+                glyph = glyph_map[char] = (font_render, *font_render.get_glyph_data(unicode))
+            glyphs.append(glyph)
+        return glyphs
 
     def init_connect(self) -> None:
         super().init_connect()
@@ -262,6 +322,9 @@ class TextLine(VItem, Group[TextChar]):
                                                                 about_edge=None)
         )
 
+    def _get_mergeable_apprs(self) -> list[Timeline.ItemAppearance]:
+        return VItemGroupRenderer.get_mergeable_apprs(self)
+
     def get_mark_orig(self) -> np.ndarray:
         return self.mark._points.data[0]
 
@@ -297,6 +360,8 @@ class Text(VItem, Group[TextLine]):
 
     如果对换行排版等有较高的需求可以考虑使用 :class:`~.TypstDoc`
     '''
+    renderer_cls = VItemGroupRenderer
+
     class Format(Enum):
         PlainText = 0
         RichText = 1
@@ -366,10 +431,18 @@ class Text(VItem, Group[TextLine]):
 
             self.text += text[idx:]
 
+        if format is not Text.Format.RichText:
+            # 纯文本可以在创建时直接排版，与 arrange_in_line 以及 arrange_in_lines 的默认参数结果一致
+            line_step = DOWN * 0.85 * font_size / ORIG_FONT_SIZE
+            line_offsets = [line_step * i for i in range(self.text.count('\n') + 1)]
+        else:
+            # 富文本需要先在原点处应用样式（例如 font_scale），再进行排版
+            line_offsets = it.repeat(None)
+
         super().__init__(
             *[
-                TextLine(line_text, fonts=fonts, font_size=font_size, **line_kwargs)
-                for line_text in self.text.split('\n')
+                TextLine(line_text, fonts=fonts, font_size=font_size, offset=line_offset, **line_kwargs)
+                for line_text, line_offset in zip(self.text.split('\n'), line_offsets)
             ],
             stroke_alpha=stroke_alpha,
             fill_alpha=fill_alpha,
@@ -378,12 +451,15 @@ class Text(VItem, Group[TextLine]):
 
         if format is Text.Format.RichText:
             self.apply_rich_text()
-        for line in self.children:
-            line.arrange_in_line()
-        self.arrange_in_lines()
+            for line in self.children:
+                line.arrange_in_line()
+            self.arrange_in_lines()
         if center:
             self.points.to_center()
 
+    def _get_mergeable_apprs(self) -> list[Timeline.ItemAppearance]:
+        return VItemGroupRenderer.get_mergeable_apprs(self)
+
     def is_null(self) -> bool:
         return True
 
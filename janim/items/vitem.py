@@ -122,8 +122,12 @@ class VItem(Points):
             pos = self.points.get_start()
             angle_vert = self.points.start_direction
         else:
-            pos = self.points.pfp(alpha)
-            angle_vert = self.points.pfp(clip(alpha + d_alpha, 0, 1)) - self.points.pfp(clip(alpha - d_alpha, 0, 1))
+            pos, after, before = self.points.points_from_proportions([
+                alpha,
+                clip(alpha + d_alpha, 0, 1),
+                clip(alpha - d_alpha, 0, 1)
+            ])
+            angle_vert = after - before
 
         if angle is None:
             angle = math.atan2(angle_vert[1], angle_vert[0])
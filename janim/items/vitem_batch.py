@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Self
+
+import numpy as np
+
+from janim.components.batch_vpoints import Cmpt_BatchVPoints, ShapeKey
+from janim.components.component import CmptGroup, CmptInfo
+from janim.components.radius import Cmpt_Radius
+from janim.components.rgbas import Cmpt_Rgbas, apart_alpha
+from janim.items.points import Points
+from janim.items.vitem import DEFAULT_STROKE_RADIUS, VItem
+from janim.render.renderer_vitem_batch import VItemBatchRenderer
+from janim.typing import Alpha, AlphaArray, ColorArray, JAnimColor, VectArray
+from janim.utils.data import AlignedData
+from janim.utils.iterables import (resize_preserving_order_indice_groups,
+                                   resize_with_interpolation)
+
+
+@dataclass
+class BatchArrays:
+    '''
+    :class:`~.VItemBatch` 数据的数组形式，用于 :meth:`VItemBatch.get_arrays` 与 :class:`~.BatchUpdater`
+
+    - ``points``: 所有图形的点坐标，形如 ``(点数量, 3)``，图形之间以 ``NAN_POINT`` 分隔
+    - ``shape_indices``: 每个点所属的图形的下标，可用于将每个图形各自的数据扩展到每个点上，例如 ``centers[shape_indices]``
+    - ``centers``: 每个图形包围框的中心，形如 ``(图形数量, 3)``
+    - ``stroke`` ``fill``: 每个图形的描边与填充颜色，形如 ``(图形数量, 4)``
+    - ``radius``: 每个图形的描边半径，形如 ``(图形数量,)``
+    - ``alphas``: 每个图形各自的动画进度，仅在 :class:`~.BatchUpdater` 中有意义
+
+    其中 ``points`` ``stroke`` ``fill`` ``radius`` 可以原地修改，``shape_indices`` 与 ``centers`` 是只读的
+    '''
+    points: np.ndarray
+    shape_indices: np.ndarray
+    centers: np.ndarray
+    stroke: np.ndarray
+    fill: np.ndarray
+    radius: np.ndarray
+    alphas: np.ndarray
+
+
+class VItemBatch(Points):
+    '''
+    批量图形物件，将大量同类的图形（例如点、柱、方块）以连续数组的形式存放在一个物件中
+
+    与使用大量的 :class:`~.VItem` 相比：
+
+    - 所有图形的点坐标存放在同一个数组中，详见 :class:`~.Cmpt_BatchVPoints`
+    - 描边颜色 ``stroke``、填充颜色 ``fill`` 以及描边半径 ``radius`` 都是每个图形各自一个值，而不是每个点
+    - 只有一个物件，因此只有一份动画栈与渲染器，并且渲染时只需要一次绘制调用
+
+    例：
+
+    .. code-block:: python
+
+        dots = VItemBatch.from_template(
+            Circle(radius=0.05, fill_alpha=1),
+            np.random.uniform(-3, 3, (10000, 3)) * [1, 1, 0]
+        )
+
+    可以使用 :meth:`select` 与 :meth:`get_shape_item` 选取部分图形，
+    使用 :class:`~.Transform` 在两个批量物件之间插值，
+    以及使用 :class:`~.BatchUpdater` 以数组的形式编写 updater
+    '''
+    points = CmptInfo(Cmpt_BatchVPoints[Self])
+    radius = CmptInfo(Cmpt_Radius[Self], DEFAULT_STROKE_RADIUS)
+
+    stroke = CmptInfo(Cmpt_Rgbas[Self])
+    fill = CmptInfo(Cmpt_Rgbas[Self])
+
+    color = CmptGroup(stroke, fill)
+
+    renderer_cls = VItemBatchRenderer
+
+    def __init__(self, *shapes: VectArray, fill_alpha=0, **kwargs):
+        self.stroke_background = False
+        super().__init__(fill_alpha=fill_alpha, **kwargs)
+
+        if shapes:
+            self.points.set_shapes(shapes)
+
+    def apply_style(
+        self,
+        stroke_radius: float | Iterable[float] | None = None,
+        stroke_color: JAnimColor | ColorArray | None = None,
+        stroke_alpha: Alpha | AlphaArray | None = None,
+        stroke_background: bool | None = None,
+        fill_color: JAnimColor | ColorArray | None = None,
+        fill_alpha: Alpha | AlphaArray | None = None,
+        color: JAnimColor | ColorArray | None = None,
+        alpha: Alpha | AlphaArray | None = None,
+        **kwargs
+    ) -> Self:
+        if stroke_color is None:
+            stroke_color = color
+        if stroke_alpha is None:
+            stroke_alpha = alpha
+
+        if fill_color is None:
+            fill_color = color
+        if fill_alpha is None:
+            fill_alpha = alpha
+
+        if stroke_background is not None:
+            self.stroke_background = stroke_background
+        if stroke_radius is not None:
+            self.radius.set(stroke_radius, root_only=True)
+        self.stroke.set(stroke_color, stroke_alpha, root_only=True)
+        self.fill.set(fill_color, fill_alpha, root_only=True)
+
+        return super().apply_style(**kwargs)
+
+    # region 创建 | Creation
+
+    @classmethod
+    def from_template(cls, template: VItem | VectArray, positions: VectArray, **kwargs) -> VItemBatch:
+        '''
+        将 ``template`` 复制到 ``positions`` 的每个位置上（以包围框中心对齐），得到批量物件
+
+        如果 ``template`` 是 :class:`~.VItem`，则会使用它的描边、填充颜色以及描边半径（各取第一个值）
+        '''
+        if isinstance(template, VItem):
+            template_points = template.points.get()
+        else:
+            template_points = np.asarray(template, dtype=float)
+        positions = np.asarray(positions, dtype=float)
+
+        # fmin fmax 忽略 NAN_POINT
+        center = (np.fmin.reduce(template_points) + np.fmax.reduce(template_points)) / 2
+        shapes = (template_points - center)[np.newaxis] + positions[:, np.newaxis]
+
+        batch = cls()
+        if isinstance(template, VItem):
+            batch.radius.set(template.radius.get()[:1], root_only=True)
+            batch.stroke.set_rgbas(template.stroke.get()[:1])
+            batch.fill.set_rgbas(template.fill.get()[:1])
+            batch.stroke_background = template.stroke_background
+        batch.points.set_shapes_by_array(shapes)
+        batch.set(**kwargs)
+
+        return batch
+
+    @classmethod
+    def from_items(cls, items: Iterable[VItem], **kwargs) -> VItemBatch:
+        '''
+        将多个 :class:`~.VItem` 合并为批量物件，每个物件作为一个图形（不包括子物件）
+
+        描边、填充颜色以及描边半径取自每个物件的第一个值
+        '''
+        items = list(items)
+
+        batch = cls()
+        if items:
+            batch.radius.set([item.radius.get()[0] for item in items], root_only=True)
+            batch.stroke.set_rgbas([item.stroke.get()[0] for item in items])
+            batch.fill.set_rgbas([item.fill.get()[0] for item in items])
+            batch.stroke_background = items[0].stroke_background
+        batch.points.set_shapes([item.points.get() for item in items])
+        batch.set(**kwargs)
+
+        return batch
+
+    # endregion
+
+    # region 选取 | Selection
+
+    def get_shape_count(self) -> int:
+        '''
+        得到图形的数量
+        '''
+        return self.points.get_shape_count()
+
+    def select(self, key: ShapeKey) -> VItemBatch:
+        '''
+        选取部分图形，得到新的批量物件，原物件不受影响
+
+        ``key`` 可以是下标、切片、下标列表或布尔列表，例如 ``batch.select(batch.points.get_shape_centers()[:, 0] > 0)``
+        '''
+        indices = np.arange(self.get_shape_count())[self.points.format_shape_key(key)]
+
+        batch = self.copy(root_only=True)
+        batch.points.select(indices)
+        if self.radius.count() == self.get_shape_count():
+            batch.radius.set(self.radius.get()[indices], root_only=True)
+        for name in ('stroke', 'fill'):
+            rgbas = self.components[name].get()
+            if len(rgbas) == self.get_shape_count():
+                batch.components[name].set_rgbas(rgbas[indices])
+
+        return batch
+
+    def get_shape_item(self, index: int) -> VItem:
+        '''
+        将第 ``index`` 个图形转换为一个单独的 :class:`~.VItem`
+        '''
+        arrays = self.get_arrays()
+        index = np.arange(self.get_shape_count())[index]
+
+        item = VItem()
+        item.points.set(self.points.get_shape(index))
+        item.radius.set(arrays.radius[index: index + 1], root_only=True)
+        item.stroke.set_rgbas(arrays.stroke[index: index + 1])
+        item.fill.set_rgbas(arrays.fill[index: index + 1])
+        item.stroke_background = self.stroke_background
+        return item
+
+    # endregion
+
+    # region 数组形式 | Arrays
+
+    def get_arrays(self) -> BatchArrays:
+        '''
+        以数组的形式得到所有图形的数据，除了 ``shape_indices`` 与 ``centers`` 以外都是可以修改的副本
+
+        另见：:meth:`set_arrays`
+        '''
+        count = self.get_shape_count()
+
+        def expand(array: np.ndarray) -> np.ndarray:
+            # resize_with_interpolation 在长度一致时不会复制，所以这里统一复制一次
+            return np.array(resize_with_interpolation(array, count))
+
+        return BatchArrays(
+            points=np.array(self.points.get()),
+            shape_indices=self.points.get_shape_indices(),
+            centers=self.points.get_shape_centers(),
+            stroke=expand(self.stroke.get()),
+            fill=expand(self.fill.get()),
+            radius=expand(self.radius.get()),
+            alphas=np.ones(count)
+        )
+
+    def set_arrays(self, arrays: BatchArrays) -> Self:
+        '''
+        将 :meth:`get_arrays` 得到的（修改后的）数据设置回物件中
+
+        只有内容发生变化的数据才会被重新设置，这样未变化的数据在渲染时不需要重新上传
+        '''
+        if not np.array_equal(arrays.points, self.points.get(), equal_nan=True):
+            self.points.set(arrays.points)
+
+        count = self.get_shape_count()
+        for cmpt, array in ((self.stroke, arrays.stroke), (self.fill, arrays.fill)):
+            if not np.array_equal(array, resize_with_interpolation(cmpt.get(), count)):
+                cmpt.set_rgbas(array)
+
+        if not np.array_equal(arrays.radius, resize_with_interpolation(self.radius.get(), count)):
+            self.radius.set(arrays.radius, root_only=True)
+
+        return self
+
+    # endregion
+
+    @classmethod
+    def align_for_interpolate(cls, item1: VItemBatch, item2: VItemBatch) -> AlignedData[Self]:
+        n1 = item1.get_shape_count()
+        n2 = item2.get_shape_count()
+
+        aligned = super().align_for_interpolate(item1, item2)
+
+        if n1 == n2 or min(n1, n2) == 0:
+            return aligned
+
+        # 与点坐标的处理一致，通过重复的方式使得每个图形的颜色与半径数据对应
+        count = max(n1, n2)
+        indices = Cmpt_BatchVPoints.get_resize_indices(min(n1, n2), count)
+        item, data = (item1, aligned.data1) if n1 < n2 else (item2, aligned.data2)
+
+        data.radius.set(item.radius.get()[indices] if item.radius.count() == min(n1, n2) else item.radius.get(),
+                        root_only=True)
+        for key in ('stroke', 'fill'):
+            rgbas = item.components[key].get()
+            rgbas = resize_with_interpolation(rgbas[indices] if len(rgbas) == min(n1, n2) else rgbas, count).copy()
+            # 对于重复的图形，分离透明度使得重叠后仍然表现为原来的透明度
+            for group in resize_preserving_order_indice_groups(min(n1, n2), count):
+                if len(group) > 1:
+                    rgbas[group, 3] = apart_alpha(rgbas[group[0], 3], len(group))
+            data.components[key].set_rgbas(rgbas)
+
+        return aligned
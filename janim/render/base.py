@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections import defaultdict
 from contextvars import ContextVar
 from dataclasses import dataclass, field
@@ -71,3 +72,44 @@ def create_context(**kwargs) -> mgl.Context:
     )
     ctx.blend_equation = mgl.FUNC_ADD, mgl.MAX
     return ctx
+
+
+_standalone_ctx: mgl.Context | None = None
+
+
+def get_standalone_context() -> mgl.Context:
+    '''
+    得到进程中共享的 standalone context，若还没有则会创建
+
+    所有的 :class:`~.VideoWriter` 以及 :meth:`~.BuiltTimeline.capture` 共用这一个 context，
+    因此在同一个进程中输出多个时间轴时（例如 ``janim write --all``），
+    着色器程序只会在第一次使用时编译，之后都会复用 :py:obj:`programs_map` 中的缓存
+    '''
+    global _standalone_ctx
+    if _standalone_ctx is None:
+        enable_driver_shader_cache()
+        try:
+            _standalone_ctx = create_context(standalone=True, require=430)
+        except ValueError:
+            _standalone_ctx = create_context(standalone=True, require=330)
+    return _standalone_ctx
+
+
+def enable_driver_shader_cache() -> None:
+    '''
+    让显卡驱动将编译后的着色器二进制持久化到 ``Config.temp_dir`` 中，使得新进程中无需重新编译
+
+    moderngl 无法从 ``glGetProgramBinary`` 得到的二进制数据创建 :class:`moderngl.Program`，
+    所以这里使用驱动自带的磁盘缓存，它们同样以驱动版本和着色器源码的哈希作为键
+
+    需要在驱动被加载前（即创建第一个 context 前）调用才会生效；已经由用户设置的环境变量不会被覆盖
+    '''
+    from janim.utils.config import Config
+    from janim.utils.file_ops import guarantee_existence
+
+    cache_dir = guarantee_existence(os.path.join(Config.get.temp_dir, 'shader_cache'))
+    # Mesa
+    os.environ.setdefault('MESA_SHADER_CACHE_DIR', cache_dir)
+    # NVIDIA
+    os.environ.setdefault('__GL_SHADER_DISK_CACHE', '1')
+    os.environ.setdefault('__GL_SHADER_DISK_CACHE_PATH', cache_dir)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from contextlib import contextmanager
 
 import moderngl as mgl
@@ -20,21 +21,34 @@ def register_qt_glwidget(w: GLWidget) -> None:
     _qt_glwidget = w
 
 
-def create_framebuffer(ctx: mgl.Context, pw: int, ph: int) -> mgl.Framebuffer:
+def create_framebuffer(
+    ctx: mgl.Context,
+    pw: int,
+    ph: int,
+    depth_attachment: mgl.Renderbuffer | None = None
+) -> mgl.Framebuffer:
+    '''
+    创建 ``pw`` x ``ph`` 的 framebuffer
+
+    如果传入了 ``depth_attachment``，则使用这个已有的深度缓冲，使得多个 framebuffer 可以共用，否则创建新的
+    '''
     on_qt = _qt_glwidget is not None and _qt_glwidget.ctx is ctx
     if on_qt:
         prev = _qt_glwidget.qfuncs.glGetIntegerv(0x8CA6)   # GL_FRAMEBUFFER_BINDING
 
+    if depth_attachment is None:
+        depth_attachment = ctx.depth_renderbuffer(
+            (pw, ph),
+            samples=0
+        )
+
     fbo = ctx.framebuffer(
         color_attachments=ctx.texture(
             (pw, ph),
             components=4,
             samples=0,
         ),
-        depth_attachment=ctx.depth_renderbuffer(
-            (pw, ph),
-            samples=0
-        )
+        depth_attachment=depth_attachment
     )
 
     if on_qt and prev == _qt_glwidget.defaultFramebufferObject():
@@ -49,6 +63,25 @@ def create_framebuffer(ctx: mgl.Context, pw: int, ph: int) -> mgl.Framebuffer:
     return fbo
 
 
+framebuffer_pool: defaultdict[tuple[mgl.Context, int, int], list[mgl.Framebuffer]] = defaultdict(list)
+
+
+@contextmanager
+def pooled_framebuffer(ctx: mgl.Context, pw: int, ph: int):
+    '''
+    从按尺寸划分的池中取出一个 framebuffer，退出时归还
+
+    同一时刻只有正在使用的 framebuffer 会被占用，
+    所以即使有许多个 :class:`~.FrameEffect` ，也只需要与最大嵌套层数相同数量的 framebuffer
+    '''
+    free = framebuffer_pool[(ctx, pw, ph)]
+    fbo = free.pop() if free else create_framebuffer(ctx, pw, ph)
+    try:
+        yield fbo
+    finally:
+        free.append(fbo)
+
+
 @contextmanager
 def framebuffer_context(fbo: mgl.Framebuffer):
     on_qt = _qt_glwidget is not None and _qt_glwidget.ctx is fbo.ctx
@@ -170,3 +170,26 @@ def get_janim_compute_shader(filepath: str) -> mgl.ComputeShader:
 
     programs.cache[filepath] = comp
     return comp
+
+
+def get_compute_shader_from_string(shader: str, *, cache_key: str | None = None) -> mgl.ComputeShader:
+    '''
+    从着色器字符串创建 ComputeShader
+    '''
+    ctx = Renderer.data_ctx.get().ctx
+
+    programs = programs_map[ctx]
+    if cache_key is not None:
+        comp = programs.cache.get(cache_key, None)
+        if comp is not None:
+            return comp
+
+    comp = ctx.compute_shader(shader)
+    apply_uniforms(comp)
+
+    if cache_key is not None:
+        programs.cache[cache_key] = comp
+    else:
+        programs.additional.append(comp)
+
+    return comp
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import moderngl as mgl
 import numpy as np
 
-from janim.render.base import Renderer
-from janim.render.program import get_janim_program
+from janim.anims.animation import Animation
+from janim.render.base import Renderer, programs_map
+from janim.render.program import (get_compute_shader_from_string,
+                                  get_janim_program)
+from janim.utils.file_ops import get_janim_dir, readall
 from janim.utils.iterables import resize_with_interpolation
 
 if TYPE_CHECKING:
@@ -14,6 +19,13 @@ if TYPE_CHECKING:
 
 
 class DotCloudRenderer(Renderer):
+    '''
+    :class:`~.DotCloud` 的渲染器
+
+    - 每个点作为一个实例进行绘制（实例化渲染），一次绘制调用即可绘制所有的点
+    - 数据变化时，只会上传发生变化的连续区间，参考 :func:`write_dirty_range`
+    - 如果设置了 :meth:`~.DotCloud.gpu_update`，则会在每次渲染前使用 ComputeShader 在 GPU 上计算点的位置、颜色和半径
+    '''
     def __init__(self):
         self.initialized = False
 
@@ -23,20 +35,41 @@ class DotCloudRenderer(Renderer):
         self.u_fix = self.get_u_fix_in_frame(self.prog)
 
         self.ctx = self.data_ctx.get().ctx
+        self.vbo_direction = self.ctx.buffer(
+            data=np.array([
+                [-1.0, -1.0],   # 左下
+                [1.0, -1.0],    # 右下
+                [-1.0, 1.0],    # 左上
+                [1.0, 1.0]      # 右上
+            ], dtype=np.float32).tobytes()
+        )
         self.vbo_points = self.ctx.buffer(reserve=1)
         self.vbo_color = self.ctx.buffer(reserve=1)
         self.vbo_radius = self.ctx.buffer(reserve=1)
 
-        self.vao = self.ctx.vertex_array(self.prog, [
-            (self.vbo_points, '3f', 'in_point'),
-            (self.vbo_color, '4f', 'in_color'),
-            (self.vbo_radius, '1f', 'in_radius')
-        ])
+        self.vao = self.create_vao(self.vbo_points, self.vbo_color, self.vbo_radius)
+
+        # 以下在使用 gpu_update 时才会创建
+        self.vbo_updated_points: mgl.Buffer | None = None
+        self.vbo_updated_color: mgl.Buffer | None = None
+        self.vbo_updated_radius: mgl.Buffer | None = None
+        self.vao_updated: mgl.VertexArray | None = None
 
         self.prev_points = None
         self.prev_color = None
         self.prev_radius = None
 
+        self.prev_color_data: np.ndarray | None = None
+        self.prev_radius_data: np.ndarray | None = None
+
+    def create_vao(self, vbo_points: mgl.Buffer, vbo_color: mgl.Buffer, vbo_radius: mgl.Buffer) -> mgl.VertexArray:
+        return self.ctx.vertex_array(self.prog, [
+            (self.vbo_direction, '2f', 'in_direction'),
+            (vbo_points, '3f/i', 'in_point'),
+            (vbo_color, '4f/i', 'in_color'),
+            (vbo_radius, '1f/i', 'in_radius')
+        ])
+
     def render(self, item: DotCloud) -> None:
         if not self.initialized:
             self.init()
@@ -49,34 +82,112 @@ class DotCloudRenderer(Renderer):
         if new_color is not self.prev_color or len(new_points) != len(self.prev_points):
             color = resize_with_interpolation(new_color, len(new_points))
             assert color.dtype == np.float32
-            bytes = color.tobytes()
-
-            if len(bytes) != self.vbo_color.size:
-                self.vbo_color.orphan(len(bytes))
-
-            self.vbo_color.write(bytes)
+            write_dirty_range(self.vbo_color, color, self.prev_color_data)
             self.prev_color = new_color
+            self.prev_color_data = color
 
         if new_radius is not self.prev_radius or len(new_points) != len(self.prev_points):
             radius = resize_with_interpolation(new_radius, len(new_points))
             assert radius.dtype == np.float32
-            bytes = radius.tobytes()
-
-            if len(bytes) != self.vbo_radius.size:
-                self.vbo_radius.orphan(len(bytes))
-
-            self.vbo_radius.write(bytes)
+            write_dirty_range(self.vbo_radius, radius, self.prev_radius_data)
             self.prev_radius = new_radius
+            self.prev_radius_data = radius
 
         if new_points is not self.prev_points:
             assert new_points.dtype == np.float32
-            bytes = new_points.tobytes()
-
-            if len(bytes) != self.vbo_points.size:
-                self.vbo_points.orphan(len(bytes))
-
-            self.vbo_points.write(bytes)
+            write_dirty_range(self.vbo_points, new_points, self.prev_points)
             self.prev_points = new_points
 
+        count = len(self.prev_points)
+        if count == 0:
+            return
+
         self.update_fix_in_frame(self.u_fix, item)
-        self.vao.render(mgl.POINTS, vertices=len(self.prev_points))
+        if item.gpu_updater is None:
+            self.vao.render(mgl.TRIANGLE_STRIP, vertices=4, instances=count)
+        else:
+            self.run_gpu_updater(item.gpu_updater, count)
+            self.vao_updated.render(mgl.TRIANGLE_STRIP, vertices=4, instances=count)
+
+    def run_gpu_updater(self, code: str, count: int) -> None:
+        '''
+        使用 ComputeShader 执行 ``code`` 中定义的 ``update`` 函数，
+        结果写入 ``vbo_updated_xxx`` 中，原有数据不受影响
+        '''
+        comp = get_updater_compute_shader(code)
+
+        if self.vao_updated is None:
+            self.vbo_updated_points = self.ctx.buffer(reserve=1)
+            self.vbo_updated_color = self.ctx.buffer(reserve=1)
+            self.vbo_updated_radius = self.ctx.buffer(reserve=1)
+            self.vao_updated = self.create_vao(self.vbo_updated_points,
+                                               self.vbo_updated_color,
+                                               self.vbo_updated_radius)
+
+        for src, dst in ((self.vbo_points, self.vbo_updated_points),
+                         (self.vbo_color, self.vbo_updated_color),
+                         (self.vbo_radius, self.vbo_updated_radius)):
+            if dst.size != src.size:
+                dst.orphan(src.size)
+
+        self.vbo_points.bind_to_storage_buffer(0)
+        self.vbo_color.bind_to_storage_buffer(1)
+        self.vbo_radius.bind_to_storage_buffer(2)
+        self.vbo_updated_points.bind_to_storage_buffer(3)
+        self.vbo_updated_color.bind_to_storage_buffer(4)
+        self.vbo_updated_radius.bind_to_storage_buffer(5)
+
+        comp['count'] = count
+        if 't' in comp._members:
+            comp['t'] = Animation.global_t_ctx.get()
+        comp.run(group_x=(count + 255) // 256)  # 相当于 count / 256 向上取整
+        self.ctx.memory_barrier()
+
+
+@lru_cache(maxsize=1)
+def get_updater_shader_template() -> str:
+    return readall(os.path.join(get_janim_dir(), 'render/shaders/dotcloud_updater.comp.glsl'))
+
+
+def get_updater_compute_shader(code: str) -> mgl.ComputeShader:
+    '''
+    将 ``code`` 插入 ``dotcloud_updater.comp.glsl`` 中得到 ComputeShader，相同的 ``code`` 只会编译一次
+    '''
+    cache_key = f'dotcloud_updater:{code}'
+
+    ctx = Renderer.data_ctx.get().ctx
+    comp = programs_map[ctx].cache.get(cache_key, None)
+    if comp is not None:
+        return comp
+
+    return get_compute_shader_from_string(
+        get_updater_shader_template().replace('#[JA_DOTCLOUD_UPDATER]', code),
+        cache_key=cache_key
+    )
+
+
+def write_dirty_range(vbo: mgl.Buffer, data: np.ndarray, prev: np.ndarray | None) -> None:
+    '''
+    将 ``data`` 写入 ``vbo``
+
+    如果 ``prev`` 是先前写入的数据，并且形状相同，那么只会上传发生变化的那一段连续区间，
+    这样对于大量点中只有少数变化的情况，不必每次都重新上传整个数组
+    '''
+    nbytes = data.nbytes
+    if prev is None or prev.shape != data.shape or vbo.size != nbytes:
+        if vbo.size != nbytes:
+            vbo.orphan(max(nbytes, 1))
+        if nbytes != 0:
+            vbo.write(data.tobytes())
+        return
+
+    if len(data) == 0:
+        return
+
+    changed = np.flatnonzero((data != prev).reshape(len(data), -1).any(axis=1))
+    if len(changed) == 0:
+        return
+
+    first, last = changed[0], changed[-1] + 1
+    row_nbytes = nbytes // len(data)
+    vbo.write(data[first: last].tobytes(), offset=int(first) * row_nbytes)
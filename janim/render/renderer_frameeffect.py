@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 import moderngl as mgl
@@ -8,13 +9,15 @@ import OpenGL.GL as gl
 
 from janim.anims.animation import Animation
 from janim.render.base import Renderer
-from janim.render.framebuffer import (blend_context, create_framebuffer,
-                                      framebuffer_context)
+from janim.render.framebuffer import (blend_context, framebuffer_context,
+                                      pooled_framebuffer)
 from janim.render.program import get_program_from_string
 from janim.utils.config import Config
 
 if TYPE_CHECKING:
+    from janim.anims.timeline import Timeline
     from janim.items.effect.frame_effect import FrameEffect
+    from janim.items.item import Item
 
 
 vertex_shader = '''
@@ -48,7 +51,6 @@ class FrameEffectRenderer(Renderer):
         if self.u_fbo is not None:
             self.u_fbo.value = 0
 
-        self.fbo = create_framebuffer(self.ctx, Config.get.pixel_width, Config.get.pixel_height)
         self.vbo_texcoords = self.ctx.buffer(
             data=np.array([
                 [0.0, 0.0],     # 左上
@@ -69,30 +71,115 @@ class FrameEffectRenderer(Renderer):
             self.init(item.fragment_shader, item.cache_key)
             self.initialized = True
 
+        t = Animation.global_t_ctx.get()
+        if self.u_fbo is not None or item.margin is not None:
+            render_datas = [
+                (appr, appr.stack.compute(t, True))
+                for appr in item.apprs
+                if appr.is_visible_at(t)
+            ]
+
+        region = None
+        if item.margin is not None:
+            region = self.compute_region(render_datas, item.margin)
+            # 所应用的物件都不在画面内
+            if region is not None and np.any(region[0] >= region[1]):
+                return
+
         if self.u_fbo is not None:
-            t = Animation.global_t_ctx.get()
-
-            with blend_context(self.ctx, False), framebuffer_context(self.fbo):
-                self.fbo.clear()
-                # 为了颜色能被正确渲染到透明 framebuffer 上
-                # 这里需要禁用自带 blending 的并使用 shader 里自定义的 blending（参考 program.py 的 injection_ja_finish_up）
-                # 但是 shader 里的 blending 依赖 framebuffer 信息
-                # 所以这里需要使用 glFlush 更新 framebuffer 信息使得正确渲染
-                gl.glFlush()
-                render_datas = [
-                    (appr, appr.stack.compute(t, True))
-                    for appr in item.apprs
-                    if appr.is_visible_at(t)
-                ]
-                render_datas.sort(key=lambda x: x[1].depth, reverse=True)
-                for appr, data in render_datas:
-                    appr.render(data)
-                    # 向透明 framebuffer 绘制时，每次都需要使用 glFlush 更新 framebuffer 信息使得正确渲染
+            pw, ph = Config.get.pixel_width, Config.get.pixel_height
+            with pooled_framebuffer(self.ctx, pw, ph) as fbo:
+                with blend_context(self.ctx, False), framebuffer_context(fbo):
+                    # 需要清空整个 framebuffer，而不只是 scissor 区域，
+                    # 否则区域外残留的其它效果的内容会在采样超出区域时（例如模糊）被读取到
+                    fbo.clear()
+                    # 为了颜色能被正确渲染到透明 framebuffer 上
+                    # 这里需要禁用自带 blending 的并使用 shader 里自定义的 blending（参考 program.py 的 injection_ja_finish_up）
+                    # 但是 shader 里的 blending 依赖 framebuffer 信息
+                    # 所以这里需要使用 glFlush 更新 framebuffer 信息使得正确渲染
                     gl.glFlush()
-
-            self.fbo.color_attachments[0].use(0)
-
+                    render_datas.sort(key=lambda x: x[1].depth, reverse=True)
+                    with self.scissor_context(region):
+                        for appr, data in render_datas:
+                            appr.render(data)
+                            # 向透明 framebuffer 绘制时，每次都需要使用 glFlush 更新 framebuffer 信息使得正确渲染
+                            gl.glFlush()
+
+                fbo.color_attachments[0].use(0)
+                self.render_effect(item, region)
+        else:
+            self.render_effect(item, region)
+
+    def render_effect(self, item: FrameEffect, region: np.ndarray | None) -> None:
         for key, value in item.uniforms().items():
             self.prog[key] = value
 
-        self.vao.render(mgl.TRIANGLE_STRIP)
+        with self.scissor_context(region):
+            self.vao.render(mgl.TRIANGLE_STRIP)
+
+    @contextmanager
+    def scissor_context(self, region: np.ndarray | None):
+        '''
+        在 ``region`` 对应的像素区域内进行绘制，退出时恢复先前的 scissor，
+        使得嵌套的 :class:`~.FrameEffect` 不会清除外层所设置的 scissor
+        '''
+        prev = self.ctx.scissor
+        self.ctx.scissor = self.get_scissor(region)
+        try:
+            yield
+        finally:
+            self.ctx.scissor = prev
+
+    def compute_region(
+        self,
+        render_datas: list[tuple[Timeline.ItemAppearance, Item]],
+        margin: float
+    ) -> np.ndarray | None:
+        '''
+        计算所应用物件在画面中的区域，并向外扩展 ``margin``，
+        结果为标准化坐标下的 ``[[x_min, y_min], [x_max, y_max]]``
+
+        如果有无法确定范围的物件（例如没有 ``points`` 组件的），则返回 ``None`` 表示整个画面
+        '''
+        render_data = self.data_ctx.get()
+        camera_info = render_data.camera_info
+
+        clip_boxes = []
+        for appr, data in render_datas:
+            points = data.components.get('points', None)
+            if points is None:
+                return None
+            if not points.has():
+                continue
+
+            corners = np.array(points.self_box.get_corners())
+            if data._fix_in_frame:
+                clip_box = camera_info.map_fixed_in_frame_points(corners)
+            else:
+                clip_box = camera_info.map_points(corners)
+            clip_box *= camera_info.frame_radius
+
+            buff = margin + render_data.anti_alias_radius
+            radius = data.components.get('radius', None)
+            if radius is not None:
+                buff += radius._radii._data.max()
+
+            clip_boxes.append(np.min(clip_box, axis=0) - buff)
+            clip_boxes.append(np.max(clip_box, axis=0) + buff)
+
+        if not clip_boxes:
+            return np.zeros((2, 2))
+
+        clip_boxes = np.array(clip_boxes) / camera_info.frame_radius
+        return np.clip([np.min(clip_boxes, axis=0), np.max(clip_boxes, axis=0)], -1, 1)
+
+    def get_scissor(self, region: np.ndarray | None) -> tuple[int, int, int, int] | None:
+        '''
+        将 :meth:`compute_region` 得到的区域转换为当前视口中的像素区域 ``(x, y, width, height)``
+        '''
+        if region is None:
+            return None
+        x, y, w, h = self.ctx.viewport
+        x0, y0 = np.floor((region[0] + 1) / 2 * (w, h)).astype(int)
+        x1, y1 = np.ceil((region[1] + 1) / 2 * (w, h)).astype(int)
+        return (int(x + x0), int(y + y0), int(x1 - x0), int(y1 - y0))
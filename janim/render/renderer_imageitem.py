@@ -24,6 +24,7 @@ class ImageItemRenderer(Renderer):
 
         self.u_fix = self.get_u_fix_in_frame(self.prog)
         self.u_image = self.prog['image']
+        self.u_is_yuv = self.prog['is_yuv']
 
         self.ctx = self.data_ctx.get().ctx
         self.vbo_points = self.ctx.buffer(reserve=4 * 3 * 4)
@@ -80,6 +81,7 @@ class ImageItemRenderer(Renderer):
             self.prev_img = item.image.img
 
         self.u_image.value = 0
+        self.u_is_yuv.value = False
         self.texture.filter = item.image.get_filter()
         self.texture.use(0)
         self.update_fix_in_frame(self.u_fix, item)
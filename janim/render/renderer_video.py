@@ -14,6 +14,7 @@ from janim.render.base import Renderer
 from janim.render.program import get_janim_program
 from janim.utils.config import Config
 from janim.utils.iterables import resize_with_interpolation
+from janim.utils.space_ops import get_norm
 
 if TYPE_CHECKING:
     from janim.items.image_item import Video, VideoInfo
@@ -30,6 +31,11 @@ class VideoRenderer(Renderer):
 
         self.u_fix = self.get_u_fix_in_frame(self.prog)
         self.u_image = self.prog['image']
+        self.u_is_yuv = self.prog['is_yuv']
+        self.u_image_u = self.prog['image_u']
+        self.u_image_v = self.prog['image_v']
+        self.u_yuv_bt709 = self.prog['yuv_bt709']
+        self.u_yuv_full_range = self.prog['yuv_full_range']
 
         self.ctx = self.data_ctx.get().ctx
         self.vbo_points = self.ctx.buffer(reserve=4 * 3 * 4)
@@ -49,7 +55,7 @@ class VideoRenderer(Renderer):
             (self.vbo_texcoords, '2f', 'in_texcoord')
         ])
 
-        self.texture: mgl.Texture | None = None
+        self.planes: list[StreamingTexture] | None = None
         self.reader: VideoReader | None = None
 
         self.prev_points = None
@@ -83,40 +89,146 @@ class VideoRenderer(Renderer):
             self.prev_points = new_points
 
         self.update_texture(item)
+
+        minified = self.is_minified(item)
+        for i, plane in enumerate(self.planes):
+            plane.use(i, item.min_mag_filter, minified)
+
         self.u_image.value = 0
-        self.texture.filter = item.min_mag_filter
-        self.texture.use(0)
+        self.u_is_yuv.value = self.reader.yuv
+        if self.reader.yuv:
+            self.u_image_u.value = 1
+            self.u_image_v.value = 2
+            self.u_yuv_bt709.value = self.reader.bt709
+            self.u_yuv_full_range.value = self.reader.full_range
         self.update_fix_in_frame(self.u_fix, item)
         self.vao.render(mgl.TRIANGLE_STRIP)
 
     def update_texture(self, item: Video) -> None:
-        if self.texture is None:
-            width, height = item.info.width, item.info.height
-            self.texture = self.ctx.texture(
-                size=(width, height),
-                components=item.frame_components
-            )
-            self.texture.repeat_x = False
-            self.texture.repeat_y = False
-
         if self.reader is None or self.reader.info is not item.info:
-            self.reader = VideoReader(item.info, item.frame_components)
+            # 不需要透明通道时，使用 yuv420p 进行解码，上传的数据量只有 rgb24 的一半，
+            # 转换为 RGB 的操作在 image.frag.glsl 中进行
+            # 但 yuv420p 的色度只有一半的分辨率，会使颜色在 2x2 的像素间混合，
+            # 所以放大时不进行插值的情况（例如 PixelVideo）仍使用 rgb24，保持像素清晰
+            yuv = item.frame_components == 3 and item.min_mag_filter[1] != mgl.NEAREST
+            self.reader = VideoReader(item.info, item.frame_components, yuv=yuv)
+            self.planes = [
+                StreamingTexture(self.ctx, size, components)
+                for size, components in self.reader.planes
+            ]
             self.prev_frame: bytes | None = None
 
         global_t = Animation.global_t_ctx.get()
         raw_frame = self.reader.get(item.compute_time(global_t))
         if raw_frame is not self.prev_frame:
-            self.texture.write(raw_frame)
-            self.texture.build_mipmaps()
+            view = memoryview(raw_frame)
+            offset = 0
+            for plane in self.planes:
+                plane.write(view[offset: offset + plane.nbytes])
+                offset += plane.nbytes
             self.prev_frame = raw_frame
 
+    def is_minified(self, item: Video) -> bool:
+        '''
+        视频在屏幕上显示的像素尺寸是否小于视频本身的尺寸，只有在这种情况下才需要生成 mipmap
+        '''
+        camera_info = self.data_ctx.get().camera_info
+        points = item.points._points.data
+        if item._fix_in_frame:
+            mapped = camera_info.map_fixed_in_frame_points(points)
+        else:
+            mapped = camera_info.map_points(points)
+
+        # mapped 是 [-1, 1] 范围的标准化坐标，乘上视口尺寸的一半得到像素坐标
+        _, _, vw, vh = self.ctx.viewport
+        mapped *= (vw / 2, vh / 2)
+
+        width = get_norm(mapped[2] - mapped[0])
+        height = get_norm(mapped[1] - mapped[0])
+        return width < item.info.width or height < item.info.height
+
+
+class StreamingTexture:
+    '''
+    通过 PBO（pixel-unpack-buffer）环进行上传的纹理
+
+    每次 :meth:`write` 会将数据写入环中的下一个 PBO，再由该 PBO 向纹理发起上传，
+    这样上传操作可以与之后的渲染并行进行，而不必等待上一次传输结束
+    '''
+    RING_SIZE = 3
+
+    def __init__(self, ctx: mgl.Context, size: tuple[int, int], components: int):
+        self.texture = ctx.texture(size, components)
+        self.texture.repeat_x = False
+        self.texture.repeat_y = False
+
+        self.nbytes = size[0] * size[1] * components
+        self.pbos = [
+            ctx.buffer(reserve=self.nbytes, dynamic=True)
+            for _ in range(self.RING_SIZE)
+        ]
+        self.pbo_index = 0
+
+        self.has_mipmaps = False
+
+    def write(self, data: memoryview) -> None:
+        pbo = self.pbos[self.pbo_index]
+        self.pbo_index = (self.pbo_index + 1) % self.RING_SIZE
+
+        pbo.orphan()
+        pbo.write(data)
+        self.texture.write(pbo, alignment=1)
+        self.has_mipmaps = False
+
+    def use(self, location: int, min_mag_filter: tuple[int, int], minified: bool) -> None:
+        min_filter, mag_filter = min_mag_filter
+        if minified:
+            # 只在被缩小显示时才生成 mipmap，并且同一帧只生成一次
+            if not self.has_mipmaps:
+                self.texture.build_mipmaps()
+                self.has_mipmaps = True
+        else:
+            # 没有生成 mipmap 时，不能使用需要 mipmap 的过滤方式，否则纹理是不完整的
+            min_filter = MIPMAP_FILTER_FALLBACK.get(min_filter, min_filter)
+
+        self.texture.filter = (min_filter, mag_filter)
+        self.texture.use(location)
+
+
+MIPMAP_FILTER_FALLBACK = {
+    mgl.NEAREST_MIPMAP_NEAREST: mgl.NEAREST,
+    mgl.NEAREST_MIPMAP_LINEAR: mgl.NEAREST,
+    mgl.LINEAR_MIPMAP_NEAREST: mgl.LINEAR,
+    mgl.LINEAR_MIPMAP_LINEAR: mgl.LINEAR,
+}
+
 
 class VideoReader:
-    def __init__(self, info: VideoInfo, components: int):
+    def __init__(self, info: VideoInfo, components: int, *, yuv: bool = False):
         assert components in (3, 4)
+        assert not yuv or components == 3
         self.info = info
         self.components = components
-        self.bufsize = info.height * info.width * self.components
+        self.yuv = yuv
+
+        # 按照视频流标注的色彩空间与范围将 YUV 转换为 RGB，参考 image.frag.glsl
+        # 未标注时与 ffmpeg 的默认行为一致，视为 BT.601 与 limited range
+        self.bt709 = info.color_space == 'bt709'
+        self.full_range = info.color_range == 'pc'
+
+        if yuv:
+            # yuv420p 的 U、V 平面在两个方向上都是一半的尺寸（向上取整）
+            chroma_size = ((info.width + 1) // 2, (info.height + 1) // 2)
+            self.planes = [
+                ((info.width, info.height), 1),
+                (chroma_size, 1),
+                (chroma_size, 1)
+            ]
+        else:
+            self.planes = [
+                ((info.width, info.height), components)
+            ]
+        self.bufsize = sum(w * h * c for (w, h), c in self.planes)
 
         self.current_frame = -1
 
@@ -139,6 +251,13 @@ class VideoReader:
 
         return self.raw_frame
 
+    @property
+    def pix_fmt(self) -> str:
+        if self.yuv:
+            # 保持视频流原本的范围，避免 full range 的视频被压缩到 limited range
+            return 'yuvj420p' if self.full_range else 'yuv420p'
+        return 'rgb24' if self.components == 3 else 'rgba'
+
     def open_video_pipe(self, frame: int) -> None:
         if self.process is not None:
             self.process.terminate()
@@ -150,7 +269,7 @@ class VideoReader:
             '-ss', str(frame * self.info.fps_den / self.info.fps_num),
             '-i', self.info.file_path,
             '-f', 'rawvideo',
-            '-pix_fmt', 'rgb24' if self.components == 3 else 'rgba',
+            '-pix_fmt', self.pix_fmt,
             '-loglevel', 'error',
             '-'
         ]
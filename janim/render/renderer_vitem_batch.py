@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import moderngl as mgl
+import numpy as np
+import OpenGL.GL as gl
+
+from janim.render.base import Renderer
+from janim.render.program import get_janim_program
+from janim.utils.iterables import resize_with_interpolation
+
+if TYPE_CHECKING:
+    from janim.items.vitem_batch import VItemBatch
+
+
+class VItemBatchRenderer(Renderer):
+    '''
+    :class:`~.VItemBatch` 的渲染器
+
+    - 每个图形作为一个实例进行绘制（实例化渲染），一次绘制调用即可绘制所有的图形
+    - 每个实例只覆盖对应图形的包围框，并且片段着色器只遍历该图形的曲线，
+      而 :class:`~.VItemRenderer` 会对整个物件的范围遍历所有曲线，图形数量多时开销会大得多
+    - 点坐标通过纹理缓冲读取，因此不需要 OpenGL 4.3
+    '''
+    def __init__(self):
+        self.initialized: bool = False
+
+    def init(self) -> None:
+        self.prog = get_janim_program('render/shaders/vitem_batch')
+
+        self.u_fix = self.get_u_fix_in_frame(self.prog)
+        self.u_stroke_background: mgl.Uniform = self.prog['stroke_background']
+
+        self.ctx = self.data_ctx.get().ctx
+        self.vbo_direction = self.ctx.buffer(
+            data=np.array([
+                [0.0, 0.0],     # 左下
+                [1.0, 0.0],     # 右下
+                [0.0, 1.0],     # 左上
+                [1.0, 1.0]      # 右上
+            ], dtype=np.float32).tobytes()
+        )
+        self.vbo_box = self.ctx.buffer(reserve=1)
+        self.vbo_range = self.ctx.buffer(reserve=1)
+        self.vbo_stroke_color = self.ctx.buffer(reserve=1)
+        self.vbo_fill_color = self.ctx.buffer(reserve=1)
+        self.vbo_radius = self.ctx.buffer(reserve=1)
+        self.vbo_mapped_points = self.ctx.buffer(reserve=1)
+
+        self.vao = self.ctx.vertex_array(self.prog, [
+            (self.vbo_direction, '2f', 'in_direction'),
+            (self.vbo_box, '4f/i', 'in_box'),
+            (self.vbo_range, '2i/i', 'in_range'),
+            (self.vbo_stroke_color, '4f/i', 'in_stroke'),
+            (self.vbo_fill_color, '4f/i', 'in_fill'),
+            (self.vbo_radius, '1f/i', 'in_radius')
+        ])
+
+        self.sampb_mapped_points = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_BUFFER, self.sampb_mapped_points)
+        gl.glTexBuffer(gl.GL_TEXTURE_BUFFER, gl.GL_RGBA32F, self.vbo_mapped_points.glo)
+        self.loc_mapped_points = gl.glGetUniformLocation(self.prog.glo, 'points')
+
+        self.prev_camera_info = None
+
+        self.prev_fix_in_frame = None
+        self.prev_points = None
+        self.prev_counts = None
+        self.prev_radius = None
+        self.prev_stroke = None
+        self.prev_fill = None
+
+        self.radius_data = np.empty(0, dtype=np.float32)
+        self.mapped_points = np.empty((0, 2), dtype=np.float32)
+        self.points_vec4buffer = np.empty((0, 4), dtype=np.float32)
+
+    def render(self, item: VItemBatch) -> None:
+        if not self.initialized:
+            self.init()
+            self.initialized = True
+
+        new_points = item.points._points.data
+        new_counts = item.points._counts.data
+
+        count = len(new_counts)
+        if len(new_points) < 3:
+            return
+        render_data = self.data_ctx.get()
+
+        new_camera_info = render_data.camera_info
+        new_fix_in_frame = item._fix_in_frame
+        new_radius = item.radius._radii._data
+        new_stroke = item.stroke._rgbas._data
+        new_fill = item.fill._rgbas._data
+
+        is_count_changed = self.prev_counts is None or len(self.prev_counts) != count
+        is_points_changed = new_points is not self.prev_points \
+            or new_fix_in_frame != self.prev_fix_in_frame \
+            or new_camera_info is not self.prev_camera_info
+
+        if new_stroke is not self.prev_stroke or is_count_changed:
+            self.write(self.vbo_stroke_color, resize_with_interpolation(new_stroke, count))
+            self.prev_stroke = new_stroke
+
+        if new_fill is not self.prev_fill or is_count_changed:
+            self.write(self.vbo_fill_color, resize_with_interpolation(new_fill, count))
+            self.prev_fill = new_fill
+
+        is_radius_changed = new_radius is not self.prev_radius or is_count_changed
+        if is_radius_changed:
+            self.radius_data = resize_with_interpolation(new_radius, count)
+            self.write(self.vbo_radius, self.radius_data)
+            self.prev_radius = new_radius
+
+        if new_counts is not self.prev_counts:
+            starts = item.points.get_shape_starts()
+            ranges = np.column_stack([starts, starts + new_counts - 1]).astype(np.int32)
+            self.write(self.vbo_range, ranges)
+            self.prev_counts = new_counts
+
+        if is_points_changed:
+            if new_fix_in_frame:
+                mapped = new_camera_info.map_fixed_in_frame_points(new_points)
+            else:
+                mapped = new_camera_info.map_points(new_points)
+            mapped *= new_camera_info.frame_radius
+            self.mapped_points = mapped
+
+            if len(self.points_vec4buffer) != len(mapped):
+                self.points_vec4buffer = np.zeros((len(mapped), 4), dtype=np.float32)
+
+            self.points_vec4buffer[:, :2] = mapped
+            self.points_vec4buffer[:, 2] = item.points.get_closepath_flags()
+            self.write(self.vbo_mapped_points, self.points_vec4buffer)
+
+            self.prev_fix_in_frame = new_fix_in_frame
+            self.prev_camera_info = new_camera_info
+            self.prev_points = new_points
+
+        if is_points_changed or is_radius_changed:
+            # 由于二阶贝塞尔曲线总是位于控制点的凸包内，所以控制点的包围框就能够包含整个图形
+            starts = item.points.get_shape_starts()
+            buff = self.radius_data * (new_camera_info.scaled_factor if new_fix_in_frame else 1)
+            buff = buff[:, np.newaxis] + render_data.anti_alias_radius
+            boxes = np.hstack([
+                np.fmin.reduceat(self.mapped_points, starts) - buff,
+                np.fmax.reduceat(self.mapped_points, starts) + buff
+            ])
+            self.write(self.vbo_box, boxes)
+
+        gl.glUseProgram(self.prog.glo)
+        gl.glUniform1i(self.loc_mapped_points, 0)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(gl.GL_TEXTURE_BUFFER, self.sampb_mapped_points)
+
+        self.update_fix_in_frame(self.u_fix, item)
+        self.u_stroke_background.value = item.stroke_background
+
+        self.vao.render(mgl.TRIANGLE_STRIP, vertices=4, instances=count)
+
+    @staticmethod
+    def write(vbo: mgl.Buffer, data: np.ndarray) -> None:
+        '''
+        将 ``data`` 写入 ``vbo``，浮点数据会被转换为 ``float32``
+        '''
+        if data.dtype.kind == 'f':
+            data = data.astype(np.float32, copy=False)
+        bytes = data.tobytes()
+        if len(bytes) != vbo.size:
+            vbo.orphan(max(len(bytes), 1))
+        vbo.write(bytes)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING
+
+import moderngl as mgl
+import numpy as np
+import OpenGL.GL as gl
+
+from janim.anims.animation import Animation
+from janim.components.vpoints import Cmpt_VPoints
+from janim.render.base import Renderer
+from janim.render.renderer_vitem import VItemRenderer
+from janim.render.renderer_vitem_batch import VItemBatchRenderer
+from janim.render.uniform import get_uniforms_context_var
+
+if TYPE_CHECKING:
+    from janim.anims.timeline import Timeline
+    from janim.items.item import Item
+    from janim.items.vitem import VItem
+
+
+class VItemGroupRenderer(VItemBatchRenderer):
+    '''
+    :class:`~.Text`、:class:`~.TextLine` 以及 :class:`~.SVGItem` （包括 :class:`~.TypstDoc`）的渲染器
+
+    - 物件自身的点（如果有）与 :class:`~.VItem` 一样，使用 :class:`~.VItemRenderer` 绘制
+    - 字符等后代物件中，在绘制顺序中相邻的部分会被合并到这里进行绘制（参考 :meth:`get_mergeable_apprs`），
+      每个后代物件作为一个实例，与 :class:`~.VItemBatchRenderer` 一样只需要一次绘制调用，
+      而不是每个后代物件各自进行一次绘制
+    '''
+    def __init__(self):
+        super().__init__()
+        self.vitem_renderer = VItemRenderer()
+
+        self.prev_points_list: list[np.ndarray] = []
+        self.prev_radius_list: list[np.ndarray] = []
+        self.prev_stroke_list: list[np.ndarray] = []
+        self.prev_fill_list: list[np.ndarray] = []
+
+    @staticmethod
+    def get_mergeable_apprs(item: Item) -> list[Timeline.ItemAppearance]:
+        '''
+        得到 ``item`` 的后代物件中可以合并到这里绘制的物件，参考 :meth:`~.Item._get_mergeable_apprs`
+
+        可以合并的物件需要满足：
+
+        - 使用 :class:`~.VItemRenderer` 进行渲染，并且在当前时刻可见
+        - 与 ``item`` 的 ``fix_in_frame`` 相同
+        - 描边颜色、填充颜色以及描边半径都只有一个值，并且没有描边置于底层和发光效果，
+          因为每个实例只有一组这样的属性
+
+        另外，在没有开启混合时（例如输出透明背景的视频），同一次绘制中的实例之间无法正确叠加，所以不会进行合并
+        '''
+        from janim.anims.timeline import Timeline
+
+        render_data = Renderer.data_ctx.get()
+        if not get_uniforms_context_var(render_data.ctx).get().get('JA_BLENDING', False):
+            return []
+
+        timeline = Timeline.ctx_var.get()
+        global_t = Animation.global_t_ctx.get()
+
+        # item 是当前时刻的数据，子物件记录在 stored_children 中，所以不能直接使用 walk_descendants
+        subs = (sub for child in item.get_children() for sub in child.walk_self_and_descendants())
+
+        apprs: list[Timeline.ItemAppearance] = []
+        for sub in subs:
+            if sub.renderer_cls is not VItemRenderer:
+                continue
+            appr = timeline.item_appearances.get(sub, None)
+            if appr is None or not appr.is_visible_at(global_t):
+                continue
+            if VItemGroupRenderer.is_mergeable(item, appr.stack.compute(global_t, True)):
+                apprs.append(appr)
+
+        return apprs
+
+    @staticmethod
+    def is_mergeable(item: Item, data: VItem) -> bool:
+        return isinstance(data.points, Cmpt_VPoints) \
+            and len(data.points._points.data) >= 3 \
+            and data._fix_in_frame == item._fix_in_frame \
+            and not data.stroke_background \
+            and data.glow._rgba._data[3] == 0.0 \
+            and len(data.stroke._rgbas._data) == 1 \
+            and len(data.fill._rgbas._data) == 1 \
+            and len(data.radius._radii._data) == 1
+
+    def render(self, item: Item) -> None:
+        if isinstance(item.points, Cmpt_VPoints):
+            self.vitem_renderer.render(item)
+
+    def render_merged(self, item: Item, datas: list[VItem]) -> None:
+        '''
+        将 ``datas`` 中的物件作为实例一次绘制，``item`` 自身的点不在这里绘制
+        '''
+        if not self.initialized:
+            self.init()
+            self.initialized = True
+
+        render_data = self.data_ctx.get()
+
+        new_camera_info = render_data.camera_info
+        new_fix_in_frame = item._fix_in_frame
+
+        points_list = [data.points._points.data for data in datas]
+        radius_list = [data.radius._radii._data for data in datas]
+        stroke_list = [data.stroke._rgbas._data for data in datas]
+        fill_list = [data.fill._rgbas._data for data in datas]
+
+        is_points_changed = not self.is_same(points_list, self.prev_points_list)
+        is_mapping_changed = is_points_changed \
+            or new_fix_in_frame != self.prev_fix_in_frame \
+            or new_camera_info is not self.prev_camera_info
+
+        if is_points_changed:
+            counts = np.array([len(points) for points in points_list])
+            self.starts = np.cumsum(counts) - counts
+            self.points = np.concatenate(points_list)
+            self.closepath_flags = self.get_closepath_flags(self.points, self.starts)
+            self.write(self.vbo_range, np.column_stack([self.starts, self.starts + counts - 1]).astype(np.int32))
+            self.prev_points_list = points_list
+
+        if not self.is_same(stroke_list, self.prev_stroke_list):
+            self.write(self.vbo_stroke_color, np.array([stroke[0] for stroke in stroke_list]))
+            self.prev_stroke_list = stroke_list
+
+        if not self.is_same(fill_list, self.prev_fill_list):
+            self.write(self.vbo_fill_color, np.array([fill[0] for fill in fill_list]))
+            self.prev_fill_list = fill_list
+
+        is_radius_changed = not self.is_same(radius_list, self.prev_radius_list)
+        if is_radius_changed:
+            self.radius_data = np.array([radius[0] for radius in radius_list], dtype=np.float32)
+            self.write(self.vbo_radius, self.radius_data)
+            self.prev_radius_list = radius_list
+
+        if is_mapping_changed:
+            if new_fix_in_frame:
+                mapped = new_camera_info.map_fixed_in_frame_points(self.points)
+            else:
+                mapped = new_camera_info.map_points(self.points)
+            mapped *= new_camera_info.frame_radius
+            self.mapped_points = mapped
+
+            if len(self.points_vec4buffer) != len(mapped):
+                self.points_vec4buffer = np.zeros((len(mapped), 4), dtype=np.float32)
+
+            self.points_vec4buffer[:, :2] = mapped
+            self.points_vec4buffer[:, 2] = self.closepath_flags
+            self.write(self.vbo_mapped_points, self.points_vec4buffer)
+
+            self.prev_fix_in_frame = new_fix_in_frame
+            self.prev_camera_info = new_camera_info
+
+        if is_mapping_changed or is_radius_changed:
+            # 与 VItemBatchRenderer 相同，使用控制点的包围框
+            # 分隔子路径的 NaN 会被 fmin 与 fmax 忽略
+            buff = self.radius_data * (new_camera_info.scaled_factor if new_fix_in_frame else 1)
+            buff = buff[:, np.newaxis] + render_data.anti_alias_radius
+            boxes = np.hstack([
+                np.fmin.reduceat(self.mapped_points, self.starts) - buff,
+                np.fmax.reduceat(self.mapped_points, self.starts) + buff
+            ])
+            self.write(self.vbo_box, boxes)
+
+        gl.glUseProgram(self.prog.glo)
+        gl.glUniform1i(self.loc_mapped_points, 0)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(gl.GL_TEXTURE_BUFFER, self.sampb_mapped_points)
+
+        self.update_fix_in_frame(self.u_fix, item)
+        self.u_stroke_background.value = False
+
+        self.vao.render(mgl.TRIANGLE_STRIP, vertices=4, instances=len(datas))
+
+    @staticmethod
+    def is_same(arrays: list[np.ndarray], prev_arrays: list[np.ndarray]) -> bool:
+        '''
+        两个列表中的数据是否逐个是同一个对象，因为这些数据都是只读的，所以这样就可以判断是否发生了变化
+        '''
+        return len(arrays) == len(prev_arrays) and all(map(operator.is_, arrays, prev_arrays))
+
+    @staticmethod
+    def get_closepath_flags(points: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        '''
+        与 :meth:`~.Cmpt_VPoints.get_closepath_flags` 相同，
+        但是 ``points`` 是多个物件的点拼接而成的，``starts`` 是每个物件的起始下标，物件之间的分界同样是子路径的分界
+        '''
+        is_sep = np.isnan(points[:, 0])
+        is_start = np.full(len(points), False)
+        is_start[starts] = True
+        is_start[1:] |= is_sep[:-1]
+
+        start_indices = np.flatnonzero(is_start)
+        end_indices = np.append(start_indices[1:] - 1, len(points) - 1)
+        # 以 NaN 分隔的子路径，结尾是分隔点之前的点
+        end_indices -= is_sep[end_indices]
+
+        closed = np.isclose(points[end_indices], points[start_indices]).all(axis=1)
+        return closed[np.cumsum(is_start) - 1] & ~is_sep
@@ -1,25 +1,60 @@
 #version 330 core
 
+// 每个顶点：四边形的一个角的方向
+in vec2 in_direction;
+
+// 每个实例：一个点
 in vec3 in_point;
 in vec4 in_color;
 in float in_radius;
 
-out vec4 v_pos;
-out vec4 v_color;
-out float v_radius;
+out vec2 g_center;
+out vec4 g_color;
+out float g_radius;
+out vec2 g_point;
 
 uniform bool JA_FIX_IN_FRAME;
 uniform mat4 JA_VIEW_MATRIX;
 uniform float JA_FIXED_DIST_FROM_PLANE;
 uniform mat4 JA_PROJ_MATRIX;
+uniform vec2 JA_FRAME_RADIUS;
+uniform float JA_ANTI_ALIAS_RADIUS;
+
+vec4 normalize_w(vec4 vect)
+{
+    return vect / vect.w;
+}
+
+vec4 get_corner(vec4 pos, vec2 direction)
+{
+    vec4 corner = pos;
+    corner.xy += in_radius * direction;
+    corner = normalize_w(JA_PROJ_MATRIX * corner);
+    corner.xy *= JA_FRAME_RADIUS;
+    corner.xy += JA_ANTI_ALIAS_RADIUS * direction;
+    return corner;
+}
 
 void main()
 {
+    vec4 pos;
     if (JA_FIX_IN_FRAME) {
-        v_pos = vec4(in_point - vec3(0.0, 0.0, JA_FIXED_DIST_FROM_PLANE), 1.0);
+        pos = vec4(in_point - vec3(0.0, 0.0, JA_FIXED_DIST_FROM_PLANE), 1.0);
     } else {
-        v_pos = JA_VIEW_MATRIX * vec4(in_point, 1.0);
+        pos = JA_VIEW_MATRIX * vec4(in_point, 1.0);
     }
-    v_color = in_color;
-    v_radius = in_radius;
+
+    vec4 corner = get_corner(pos, in_direction);
+    // 与左下、右下两个角的距离得到经过投影后的半径
+    vec4 corner0 = get_corner(pos, vec2(-1.0, -1.0));
+    vec4 corner1 = get_corner(pos, vec2(1.0, -1.0));
+
+    g_center = normalize_w(JA_PROJ_MATRIX * pos).xy * JA_FRAME_RADIUS;
+    g_color = in_color;
+    g_radius = (corner1.x - corner0.x) / 2.0 - JA_ANTI_ALIAS_RADIUS;
+    g_point = corner.xy;
+
+    gl_Position = corner;
+    gl_Position.xy /= JA_FRAME_RADIUS;
+    gl_Position.z *= 0.1;
 }
@@ -0,0 +1,48 @@
+#version 430 core
+
+layout(local_size_x = 256) in;
+
+layout(std430, binding = 0) readonly buffer InPoints {
+    float in_points[];      // 每 3 个为一个点
+};
+layout(std430, binding = 1) readonly buffer InColors {
+    vec4 in_colors[];
+};
+layout(std430, binding = 2) readonly buffer InRadii {
+    float in_radii[];
+};
+
+layout(std430, binding = 3) writeonly buffer OutPoints {
+    float out_points[];
+};
+layout(std430, binding = 4) writeonly buffer OutColors {
+    vec4 out_colors[];
+};
+layout(std430, binding = 5) writeonly buffer OutRadii {
+    float out_radii[];
+};
+
+uniform int count;
+uniform float t;
+
+// 在这里插入用户定义的
+// void update(int index, float t, inout vec3 point, inout vec4 color, inout float radius)
+#[JA_DOTCLOUD_UPDATER]
+
+void main() {
+    uint index = gl_GlobalInvocationID.x;
+    if (index >= uint(count))
+        return;
+
+    vec3 point = vec3(in_points[index * 3], in_points[index * 3 + 1], in_points[index * 3 + 2]);
+    vec4 color = in_colors[index];
+    float radius = in_radii[index];
+
+    update(int(index), t, point, color, radius);
+
+    out_points[index * 3] = point.x;
+    out_points[index * 3 + 1] = point.y;
+    out_points[index * 3 + 2] = point.z;
+    out_colors[index] = color;
+    out_radii[index] = radius;
+}
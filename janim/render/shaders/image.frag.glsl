@@ -7,13 +7,51 @@ out vec4 f_color;
 
 uniform sampler2D image;
 
+// 为 true 时，image 存放的是 Y 平面，U、V 平面分别存放在 image_u 和 image_v 中
+uniform bool is_yuv;
+uniform sampler2D image_u;
+uniform sampler2D image_v;
+// 视频流的色彩空间与范围：yuv_bt709 为 false 时使用 BT.601，yuv_full_range 为 false 时使用 limited range
+uniform bool yuv_bt709;
+uniform bool yuv_full_range;
+
 // used by JA_FINISH_UP
 uniform bool JA_BLENDING;
 uniform sampler2D JA_FRAMEBUFFER;
 
+vec4 sample_image()
+{
+	if (!is_yuv)
+		return texture(image, v_texcoord);
+
+	float y = texture(image, v_texcoord).r;
+	vec2 uv = vec2(texture(image_u, v_texcoord).r, texture(image_v, v_texcoord).r) - 0.501961;
+	if (!yuv_full_range) {
+		// limited range 中 Y 的范围是 16~235，U、V 的范围是 16~240
+		y = 1.164383 * (y - 0.062745);
+		uv *= 1.138393;
+	}
+
+	vec3 rgb;
+	if (yuv_bt709) {
+		rgb = vec3(
+			y + 1.5748 * uv.y,
+			y - 0.187324 * uv.x - 0.468124 * uv.y,
+			y + 1.8556 * uv.x
+		);
+	} else {
+		rgb = vec3(
+			y + 1.402 * uv.y,
+			y - 0.344136 * uv.x - 0.714136 * uv.y,
+			y + 1.772 * uv.x
+		);
+	}
+	return vec4(clamp(rgb, 0.0, 1.0), 1.0);
+}
+
 void main()
 {
-	f_color = texture(image, v_texcoord) * v_color;
+	f_color = sample_image() * v_color;
 
 	#[JA_FINISH_UP]
 }
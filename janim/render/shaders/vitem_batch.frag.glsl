@@ -0,0 +1,160 @@
+#version 330 core
+
+in vec2 v_coord;
+flat in ivec2 v_range;
+flat in vec4 v_stroke;
+flat in vec4 v_fill;
+flat in float v_radius;
+
+out vec4 f_color;
+
+uniform float JA_ANTI_ALIAS_RADIUS;
+
+uniform bool stroke_background;
+
+const float INFINITY = 1.0 / 0.0;
+
+uniform samplerBuffer points;   // vec4(x, y, isclosed, 0)
+
+// used by JA_FINISH_UP
+uniform bool JA_BLENDING;
+uniform sampler2D JA_FRAMEBUFFER;
+
+vec2 get_point(int idx) {
+    return texelFetch(points, idx).xy;
+}
+
+bool get_isclosed(int idx) {
+    return bool(texelFetch(points, idx).z);
+}
+
+vec4 blend_color(vec4 fore, vec4 back) {
+    float a = fore.a + back.a * (1 - fore.a);
+    return clamp(
+        vec4(
+            (fore.rgb * fore.a + back.rgb * back.a * (1 - fore.a)) / a,
+            a
+        ),
+        0.0, 1.0
+    );
+}
+
+float cross2d(vec2 a, vec2 b) {
+    return a.x * b.y - a.y * b.x;
+}
+
+float sign_bezier(vec2 A, vec2 B, vec2 C, vec2 p)
+{
+    vec2 a = C - A, b = B - A, c = p - A;
+    vec2 bary = vec2(
+        c.x * b.y - b.x * c.y,
+        a.x * c.y - c.x * a.y
+    ) / (a.x * b.y - b.x * a.y);
+    vec2 d = vec2(bary.y * 0.5, 0.0) + 1.0 - bary.x - bary.y;
+
+    float sign_bezierInside = d.x > d.y ? sign(d.x * d.x - d.y) : 1.0;
+
+    bvec3 cond = bvec3( p.y >= A.y,
+                        p.y <  C.y,
+                        a.x * c.y > a.y * c.x );
+    float signLineLeft = all(cond) || all(not(cond)) ? -1.0 : 1.0;
+
+    return sign_bezierInside * signLineLeft;
+}
+
+vec3 solve_cubic(float a, float b, float c)
+{
+    float p = b - a * a / 3.0, p3 = p * p * p;
+    float q = a * (2.0 * a * a - 9.0 * b) / 27.0 + c;
+    float d = q * q + 4.0 * p3 / 27.0;
+    float offset = -a / 3.0;
+    if(d >= 0.0) {
+        float z = sqrt(d);
+        vec2 x = (vec2(z, -z) - q) / 2.0;
+        vec2 uv = sign(x) * pow(abs(x), vec2(1.0 / 3.0));
+        return vec3(offset + uv.x + uv.y);
+    }
+    float v = acos(-sqrt(-27.0 / p3) * q / 2.0) / 3.0;
+    float m = cos(v), n = sin(v) * 1.732050808;
+    return vec3(m + m, -n - m, n - m) * sqrt(-p / 3.0) + offset;
+}
+
+float distance_bezier(vec2 A, vec2 B, vec2 C, vec2 p)
+{
+    B = mix(B + vec2(1e-4), B, abs(sign(B * 2.0 - A - C)));
+    vec2 a = B - A, b = A - B * 2.0 + C, c = a * 2.0, d = A - p;
+    vec3 k = vec3(3. * dot(a, b),2. * dot(a, a) + dot(d, b),dot(d, a)) / dot(b, b);
+    vec3 t = clamp(solve_cubic(k.x, k.y, k.z), 0.0, 1.0);
+    vec2 pos = A + (c + b * t.x) * t.x;
+    float dis = length(pos - p);
+    pos = A + (c + b * t.y) * t.y;
+    dis = min(dis, length(pos - p));
+    pos = A + (c + b * t.z) * t.z;
+    dis = min(dis, length(pos - p));
+    return dis;
+}
+
+void main()
+{
+    // 与 vitem.frag.glsl 的区别在于，这里只遍历当前图形的曲线
+    float d = INFINITY;
+    float sgn = 1.0;
+    bool is_closed = false;
+
+    for (int i = v_range.x; i < v_range.y; i += 2) {
+        vec2 B = get_point(i + 1);
+        // 子路径之间的分隔
+        if (isnan(B.x))
+            continue;
+        vec2 A = get_point(i), C = get_point(i + 2);
+        if (A == B && B == C)
+            continue;
+
+        bool closed = get_isclosed(i);
+        float dist;
+
+        vec2 v1 = normalize(B - A);
+        vec2 v2 = normalize(C - B);
+        if (abs(cross2d(v1, v2)) < 1e-3 && dot(v1, v2) > 0.0) {
+            vec2 e = C - A;
+            vec2 w = v_coord - A;
+            vec2 b = w - e * clamp(dot(w, e) / dot(e, e), 0.0, 1.0);
+            dist = length(b);
+
+            if (closed) {
+                bvec3 cond = bvec3( v_coord.y >= A.y,
+                                    v_coord.y  < C.y,
+                                    e.x * w.y > e.y * w.x );
+                if(all(cond) || all(not(cond))) sgn = -sgn;
+            }
+        } else {
+            dist = distance_bezier(A, B, C, v_coord);
+
+            if (closed) {
+                sgn *= sign_bezier(A, B, C, v_coord);
+            }
+        }
+
+        if (dist < d) {
+            d = dist;
+            is_closed = closed;
+        }
+    }
+
+    vec4 fill_color = is_closed ? v_fill : vec4(0.0);
+    fill_color.a *= smoothstep(1, -1, (sgn * d) / JA_ANTI_ALIAS_RADIUS);
+
+    vec4 stroke_color = v_stroke;
+    stroke_color.a *= smoothstep(1, -1, (d - v_radius) / JA_ANTI_ALIAS_RADIUS);
+
+    if (stroke_background) {
+        f_color = blend_color(fill_color, stroke_color);
+    } else {
+        f_color = blend_color(stroke_color, fill_color);
+    }
+
+    if (f_color.a == 0.0)
+        discard;
+
+    #[JA_FINISH_UP]
+}
@@ -0,0 +1,32 @@
+#version 330 core
+
+// 每个顶点：包围框的一个角，取值为 0 或 1
+in vec2 in_direction;
+
+// 每个实例：一个图形
+in vec4 in_box;     // (min_x, min_y, max_x, max_y)，已经过摄像机变换，并且已经包含描边与抗锯齿的范围
+in ivec2 in_range;  // 图形在 points 中的起止下标（包含两端）
+in vec4 in_stroke;
+in vec4 in_fill;
+in float in_radius;
+
+out vec2 v_coord;
+flat out ivec2 v_range;
+flat out vec4 v_stroke;
+flat out vec4 v_fill;
+flat out float v_radius;
+
+uniform bool JA_FIX_IN_FRAME;
+uniform float JA_CAMERA_SCALED_FACTOR;
+uniform vec2 JA_FRAME_RADIUS;
+
+void main()
+{
+    v_coord = mix(in_box.xy, in_box.zw, in_direction);
+    v_range = in_range;
+    v_stroke = in_stroke;
+    v_fill = in_fill;
+    v_radius = JA_FIX_IN_FRAME ? in_radius * JA_CAMERA_SCALED_FACTOR : in_radius;
+
+    gl_Position = vec4(v_coord / JA_FRAME_RADIUS, 0.0, 1.0);
+}
@@ -11,7 +11,7 @@ from janim.anims.timeline import BuiltTimeline, Timeline, TimeRange
 from janim.exception import EXITCODE_FFMPEG_NOT_FOUND, ExitException
 from janim.locale.i18n import get_local_strings
 from janim.logger import log
-from janim.render.base import create_context
+from janim.render.base import get_standalone_context
 from janim.render.framebuffer import create_framebuffer, framebuffer_context
 
 _ = get_local_strings('writer')
@@ -32,13 +32,7 @@ class VideoWriter:
     '''
     def __init__(self, built: BuiltTimeline):
         self.built = built
-        try:
-            self.ctx = create_context(standalone=True, require=430)
-        except ValueError:
-            self.ctx = create_context(standalone=True, require=330)
-
-        pw, ph = built.cfg.pixel_width, built.cfg.pixel_height
-        self.fbo = create_framebuffer(self.ctx, pw, ph)
+        self.ctx = get_standalone_context()
 
     @staticmethod
     def writes(built: BuiltTimeline, file_path: str, *, quiet=False) -> None:
@@ -58,6 +52,10 @@ class VideoWriter:
 
         self.open_video_pipe(file_path)
 
+        # 因为 context 是共享的，framebuffer 只在输出期间存在，输出结束后释放
+        pw, ph = self.built.cfg.pixel_width, self.built.cfg.pixel_height
+        self.fbo = create_framebuffer(self.ctx, pw, ph)
+
         progress_display = ProgressDisplay(
             range(round(self.built.duration * fps) + 1),
             leave=False,
@@ -68,19 +66,22 @@ class VideoWriter:
 
         transparent = self.ext == '.mov'
 
-        with framebuffer_context(self.fbo):
-            for frame in progress_display:
-                self.fbo.clear(*rgb, not transparent)
-                # 在输出 mov 时，framebuffer 是透明的
-                # 为了颜色能被正确渲染到透明 framebuffer 上
-                # 这里需要禁用自带 blending 的并使用 shader 里自定义的 blending（参考 program.py 的 injection_ja_finish_up）
-                # 但是 shader 里的 blending 依赖 framebuffer 信息
-                # 所以这里需要使用 glFlush 更新 framebuffer 信息使得正确渲染
-                if transparent:
-                    gl.glFlush()
-                self.built.render_all(self.ctx, frame / fps, blend_on=not transparent)
-                bytes = self.fbo.read(components=4)
-                self.writing_process.stdin.write(bytes)
+        try:
+            with framebuffer_context(self.fbo):
+                for frame in progress_display:
+                    self.fbo.clear(*rgb, not transparent)
+                    # 在输出 mov 时，framebuffer 是透明的
+                    # 为了颜色能被正确渲染到透明 framebuffer 上
+                    # 这里需要禁用自带 blending 的并使用 shader 里自定义的 blending（参考 program.py 的 injection_ja_finish_up）
+                    # 但是 shader 里的 blending 依赖 framebuffer 信息
+                    # 所以这里需要使用 glFlush 更新 framebuffer 信息使得正确渲染
+                    if transparent:
+                        gl.glFlush()
+                    self.built.render_all(self.ctx, frame / fps, blend_on=not transparent)
+                    bytes = self.fbo.read(components=4)
+                    self.writing_process.stdin.write(bytes)
+        finally:
+            self.release_framebuffer()
 
         self.close_video_pipe(_keep_temp)
 
@@ -96,6 +97,11 @@ class VideoWriter:
                     .format(file_path=file_path)
                 )
 
+    def release_framebuffer(self) -> None:
+        for attachment in (*self.fbo.color_attachments, self.fbo.depth_attachment):
+            attachment.release()
+        self.fbo.release()
+
     def open_video_pipe(self, file_path: str) -> None:
         stem, self.ext = os.path.splitext(file_path)
         self.final_file_path = file_path
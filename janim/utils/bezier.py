@@ -229,6 +229,99 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def partial_quadratic_bezier_curves(
+    curves: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray
+) -> np.ndarray:
+    '''
+    :func:`partial_quadratic_bezier_points` 的批量版本
+
+    - ``curves`` 的形状为 ``(n, 3, 3)``，表示 ``n`` 段二次贝塞尔曲线
+    - ``a`` 和 ``b`` 的形状为 ``(n,)``，表示每段曲线所取的部分
+
+    返回形状为 ``(n, 3, 3)`` 的数组，计算过程与 :func:`partial_quadratic_bezier_points` 逐项一致
+    '''
+    a = np.asarray(a, dtype=float)[:, np.newaxis]
+    b = np.asarray(b, dtype=float)[:, np.newaxis]
+    p0, p1, p2 = curves[:, 0], curves[:, 1], curves[:, 2]
+
+    def curve(t):
+        one_minus_t = 1 - t
+        return p0 * one_minus_t * one_minus_t + 2 * p1 * t * one_minus_t + p2 * t * t
+
+    a_is_1 = a == 1
+    h0 = np.where(a > 0, curve(a), p0)
+    h2 = np.where(b < 1, curve(b), p2)
+    h1_prime = (1 - a) * p1 + a * p2
+    # a == 1 时的结果会在最后被替换，这里避免除以 0
+    end_prop = (b - a) / (1. - a + a_is_1)
+    h1 = (1 - end_prop) * h0 + end_prop * h1_prime
+
+    result = np.stack([h0, h1, h2], axis=1)
+    # 与 partial_quadratic_bezier_points 相同，a == 1 时得到的是退化到终点的曲线
+    if a_is_1.any():
+        result[a_is_1[:, 0]] = p2[a_is_1[:, 0], np.newaxis]
+    return result
+
+
+# 对二次贝塞尔曲线的批量处理
+# 这些函数都以形状为 (n, 3, 3) 的数组表示 n 段二次贝塞尔曲线，也就是 ``curves[i]`` 为第 i 段曲线的三个控制点
+
+def get_quadratic_bezier_curves(points: np.ndarray) -> np.ndarray:
+    '''
+    由 ``points`` 得到形状为 ``(n, 3, 3)`` 的曲线数组
+
+    返回的是 ``points`` 的视图，相邻曲线共用端点，因此对其修改会影响到 ``points``
+    '''
+    points = np.asarray(points)
+    n_curves = max(0, len(points) - 1) // 2
+    stride0, stride1 = points.strides
+    return np.lib.stride_tricks.as_strided(
+        points,
+        shape=(n_curves, 3, 3),
+        strides=(2 * stride0, stride0, stride1)
+    )
+
+
+def quadratic_bezier_points_at(curves: np.ndarray, t: np.ndarray | float) -> np.ndarray:
+    '''
+    得到每段曲线在 ``t`` 处的点，``t`` 可以是单个值或者与曲线数量相同的数组
+    '''
+    t = np.asarray(t, dtype=float)
+    if t.ndim != 0:
+        t = t[:, np.newaxis]
+    return (1 - t)**2 * curves[:, 0] + 2 * t * (1 - t) * curves[:, 1] + t**2 * curves[:, 2]
+
+
+def get_cumulative_lengths(lengths: np.ndarray) -> np.ndarray:
+    '''
+    由每段的长度得到以 0 开头的累计长度表，长度比 ``lengths`` 多 1
+    '''
+    return np.concatenate([[0.], np.cumsum(lengths)])
+
+
+def curves_and_props_from_proportions(
+    cumulative_lengths: np.ndarray,
+    alphas: np.ndarray | float
+) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    根据累计长度表 ``cumulative_lengths``，得到整体比例 ``alphas`` 所在的曲线下标，以及在该曲线上的比例
+
+    ``cumulative_lengths`` 的总长需要大于 0；对于位于长度为 0 的曲线之间的位置，会取第一个满足长度的曲线
+    '''
+    alphas = np.asarray(alphas, dtype=float)
+    full = cumulative_lengths[-1]
+    # 第一个累计长度不小于 alpha * full 的下标
+    index = np.searchsorted(cumulative_lengths, full * alphas, side='left')
+    index = np.clip(index, 1, len(cumulative_lengths) - 1)
+    start = cumulative_lengths[index - 1] / full
+    end = cumulative_lengths[index] / full
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residues = (alphas - start) / (end - start)
+    return index - 1, residues
+
+
 # Linear interpolation variants
 
 @overload
@@ -31,6 +31,8 @@ class Array:
 
     并且通过 ``.data`` 得到的 numpy 数组必定是只读的
     '''
+    __slots__ = ('_data',)
+
     def __init__(self, *, dtype=np.float32):
         self._data = np.empty(0, dtype=dtype)
 
@@ -57,6 +59,16 @@ class Array:
         ret.data = self
         return ret
 
+    @staticmethod
+    def wrap(data: np.ndarray) -> Array:
+        '''
+        直接引用只读的 numpy 数组（例如 ``mode='r'`` 的 :class:`numpy.memmap`），而不进行拷贝
+        '''
+        assert not data.flags.writeable
+        ret = Array(dtype=data.dtype)
+        ret._data = data
+        return ret
+
     def is_share(self, other: Array) -> bool:
         return self.data is other.data
 
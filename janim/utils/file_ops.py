@@ -23,6 +23,16 @@ def get_typst_temp_dir() -> str:
     return guarantee_existence(os.path.join(Config.get.temp_dir, 'Typst'))
 
 
+def get_svg_cache_dir() -> str:
+    from janim.utils.config import Config
+    return guarantee_existence(os.path.join(Config.get.temp_dir, 'svg_cache'))
+
+
+def get_audio_cache_dir() -> str:
+    from janim.utils.config import Config
+    return guarantee_existence(os.path.join(Config.get.temp_dir, 'audio_cache'))
+
+
 def readall(filepath: str) -> str:
     '''
     从文件中读取所有字符
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import ctypes
+import hashlib
+import json
+import mmap
+import os
+import zipfile
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Callable
 
 import freetype as FT
@@ -13,6 +20,7 @@ from janim.exception import FontNotFoundError
 from janim.locale.i18n import get_local_strings
 from janim.logger import log
 from janim.utils.bezier import PathBuilder
+from janim.utils.file_ops import guarantee_existence
 from janim.utils.font.exception import EXCEPTION_MAP
 from janim.utils.font.variant import (WEIGHT_MAP, Style, StyleName, Weight,
                                       WeightName)
@@ -65,44 +73,69 @@ class FontFamily:
         return 2
 
 
+@dataclass(eq=False)
 class FontInfo:
-    def __init__(self, filepath: str, font: TTFont, index: int):
-        self.filepath = filepath
-        self.index = index
-
-        self.name: table__n_a_m_e = font['name']
-        self.os2: table_O_S_2f_2 = font.get('OS/2', None)
-
+    '''
+    字体文件中某个字体的信息
+
+    这些信息会被持久化到字体索引中（参考 :func:`get_database`），因此这里只存放简单的数据，
+    而不是直接存放 fontTools 的 ``name`` 与 ``OS/2`` 表
+    '''
+    filepath: str
+    index: int
+
+    family_name: str
+    full_name: str
+    postscript_name: str
+    compat_name: str        # nameID=4，仅用于兼容已弃用的字体名称
+    weight_class: int | None = None
+    fs_selection: int | None = None
+
+    def __post_init__(self) -> None:
         self.exception = EXCEPTION_MAP.get(self.postscript_name, None)
 
-    @property
-    def family_name(self) -> str:
-        return self.name.getBestFamilyName()
-
-    @property
-    def full_name(self) -> str:
-        return self.name.getBestFullName()
+    @staticmethod
+    def from_ttfont(filepath: str, font: TTFont, index: int) -> FontInfo:
+        name: table__n_a_m_e = font['name']
+        os2: table_O_S_2f_2 = font.get('OS/2', None)
+
+        return FontInfo(
+            filepath,
+            index,
+            name.getBestFamilyName(),
+            name.getBestFullName(),
+            name.getDebugName(6),
+            name.getDebugName(4),
+            None if os2 is None else os2.usWeightClass,
+            None if os2 is None else os2.fsSelection
+        )
 
     @property
-    def postscript_name(self) -> str:
-        return self.name.getDebugName(6)
+    def name(self) -> table__n_a_m_e:
+        '''
+        字体的 ``name`` 表，会在需要时才读取字体文件
+        '''
+        font = TTCollection(self.filepath, lazy=True).fonts[self.index] \
+            if self.filepath.endswith('ttc')                            \
+            else TTFont(self.filepath, lazy=True)
+        return font['name']
 
     @property
     def weight(self) -> int:
         if self.exception is not None and self.exception.weight is not None:
             return self.exception.weight
-        if self.os2 is None:
+        if self.weight_class is None:
             return 400
-        return self.os2.usWeightClass
+        return self.weight_class
 
     @property
     def style(self) -> Style:
         if self.exception is not None and self.exception.style is not None:
             return self.exception.style
-        if self.os2 is None:
+        if self.fs_selection is None:
             return Style.Normal
 
-        fs_selection = self.os2.fsSelection
+        fs_selection = self.fs_selection
         if fs_selection & 0x01:
             return Style.Italic
         if fs_selection & 0x200:
@@ -111,38 +144,110 @@ class FontInfo:
         return Style.Normal
 
 
+FONT_INDEX_VERSION = 1
+'''
+字体索引的格式版本，格式或读取的信息发生变化时需要增加，使得旧的索引失效
+'''
+
 _database: FontDatabase | None = None
 
 
-def get_database() -> FontDatabase:
+def get_font_index_path() -> str:
+    from janim.utils.config import Config
+    return os.path.join(guarantee_existence(Config.get.temp_dir), 'font_index.json')
+
+
+def get_database(*, rebuild_index: bool = False) -> FontDatabase:
+    '''
+    得到系统字体的数据库
+
+    为了避免每个进程都需要读取所有的字体文件，字体信息会被持久化到 ``Config.temp_dir`` 中的字体索引里，
+    并且以每个文件的 ``(路径, 修改时间, 大小)`` 作为校验，只有发生变化的文件才会被重新读取
+
+    :param rebuild_index: 为 ``True`` 时忽略已有的索引，重新读取所有字体文件
+    '''
     global _database
 
-    if _database is not None:
+    if _database is not None and not rebuild_index:
         return _database
 
     from janim.utils.font_manager import findSystemFonts
 
+    index_path = get_font_index_path()
+    index = {} if rebuild_index else load_font_index(index_path)
+
     family_by_name = defaultdict(FontFamily)
     font_by_full_name = {}
 
+    new_index: dict[str, dict] = {}
+    changed = False
+
     for filepath in findSystemFonts():
         try:
-            fonts = TTCollection(filepath, lazy=True).fonts \
-                if filepath.endswith('ttc')                 \
-                else [TTFont(filepath, lazy=True)]
-        except TTLibError:
-            log.debug(_('Skipped font "{filepath}"').format(filepath=filepath))
+            stat = os.stat(filepath)
+        except OSError:
             continue
 
-        for i, font in enumerate(fonts):
-            info = FontInfo(filepath, font, i)
+        entry = index.get(filepath, None)
+        if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+            entry = dict(
+                mtime=stat.st_mtime,
+                size=stat.st_size,
+                faces=[asdict(info) for info in read_font_infos(filepath)]
+            )
+            changed = True
+        new_index[filepath] = entry
+
+        for face in entry['faces']:
+            info = FontInfo(**face)
             family_by_name[info.family_name].add(info)
             font_by_full_name[info.full_name] = info
 
+    if changed or len(new_index) != len(index):
+        save_font_index(index_path, new_index)
+
     _database = FontDatabase(family_by_name, font_by_full_name)
     return _database
 
 
+def read_font_infos(filepath: str) -> list[FontInfo]:
+    '''
+    读取字体文件中所有字体的信息，无法读取的文件会被跳过并得到空列表
+    '''
+    try:
+        fonts = TTCollection(filepath, lazy=True).fonts \
+            if filepath.endswith('ttc')                 \
+            else [TTFont(filepath, lazy=True)]
+        return [FontInfo.from_ttfont(filepath, font, i) for i, font in enumerate(fonts)]
+    except TTLibError:
+        log.debug(_('Skipped font "{filepath}"').format(filepath=filepath))
+        return []
+
+
+def load_font_index(index_path: str) -> dict[str, dict]:
+    try:
+        with open(index_path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('version', None) != FONT_INDEX_VERSION:
+        return {}
+    return data['files']
+
+
+def save_font_index(index_path: str, files: dict[str, dict]) -> None:
+    # 先写入临时文件再重命名，避免多个进程同时写入时读取到不完整的索引
+    tmp_path = f'{index_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(dict(version=FONT_INDEX_VERSION, files=files), f, ensure_ascii=False)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def get_font_info_by_attrs(
     name: str,
     weight: int | Weight | WeightName,
@@ -164,7 +269,7 @@ def get_font_info_by_attrs(
 
     # deprecated
     for full_name, info in db.font_by_full_name.items():
-        if info.name.getDebugName(4) == name:
+        if info.compat_name == name:
             log.warning(
                 _('font="{deprecated}" is deprecated and will no longer be available in JAnim 3.3, '
                   'use font="{full_name}" instead')
@@ -205,8 +310,9 @@ class Font:
 
     def __init__(self, filepath: str | FontInfo, index: int = 0) -> None:
         self.filepath = filepath
-        with open(filepath, 'rb') as file:
-            self.face = FT.Face(file, index=index)
+        self.index = index
+        self.file = MappedFontFile(filepath)
+        self.face = FT.Face(self.file, index=index)
 
         self.face.select_charmap(FT.FT_ENCODING_UNICODE)
 
@@ -217,18 +323,47 @@ class Font:
         self.face.set_char_size(48 << 6, 0, FRAME_PPI, FRAME_PPI)
 
         self.cached_glyph: dict[int, Font.GlyphData] = {}
+        self.glyph_cache: GlyphCache | None = None
+        self.char_coverage: dict[int, bool] = {}
+
+    def has_char(self, char: str) -> bool:
+        '''
+        该字体是否包含 ``char`` 的字形，结果会被记录下来，避免重复查询 cmap
+        '''
+        value = ord(char)
+        has = self.char_coverage.get(value, None)
+        if has is None:
+            has = self.char_coverage[value] = self.face.get_char_index(value) != 0
+        return has
 
     @dataclass
     class GlyphData:
         array: np.ndarray
         advance: tuple[int, int]
 
+    def get_glyph_cache(self) -> GlyphCache:
+        '''
+        得到该字体的字形轮廓磁盘缓存，以字体文件内容的哈希值与字体序号作为键
+        '''
+        if self.glyph_cache is None:
+            md5 = hashlib.md5(self.file.mapped)
+            # 字形轮廓还与读取时使用的字号以及 freetype 的版本（hinting 的实现）有关
+            md5.update(repr((self.index, FRAME_PPI, FT.version(), GLYPH_CACHE_VERSION)).encode())
+            self.glyph_cache = GlyphCache(os.path.join(get_glyph_cache_dir(), md5.hexdigest() + '.npz'))
+        return self.glyph_cache
+
     def get_glyph_data(self, char: str) -> tuple[np.ndarray, tuple[int, int]]:
         value = ord(char)
         cached = self.cached_glyph.get(value, None)
         if cached is not None:
             return cached.array, cached.advance
 
+        glyph_cache = self.get_glyph_cache()
+        cached = glyph_cache.get(value)
+        if cached is not None:
+            self.cached_glyph[value] = cached
+            return cached.array, cached.advance
+
         # 读取字符
         self.face.load_char(value, FT.FT_LOAD_DEFAULT | FT.FT_LOAD_NO_BITMAP)
         glyph: FT.Glyph = self.face.glyph
@@ -253,5 +388,131 @@ class Font:
         data = Font.GlyphData(builder.get(), (glyph.advance.x, glyph.advance.y))
         data.array.setflags(write=False)
         self.cached_glyph[value] = data
+        glyph_cache.add(value, data)
 
         return data.array, data.advance
+
+
+class MappedFontFile:
+    '''
+    以内存映射的方式打开字体文件，使得 freetype 直接读取映射的内存，而不需要将整个文件读入内存
+
+    freetype-py 会对具有 ``read`` 方法的对象调用 ``FT_New_Memory_Face``，
+    所以这里的 ``read`` 返回的是映射内存的 ctypes 视图，而不是复制后的 ``bytes``
+    '''
+    def __init__(self, filepath: str):
+        with open(filepath, 'rb') as file:
+            # ACCESS_COPY 是可写的私有映射，这样才能创建 ctypes 视图；freetype 不会写入字体数据，所以不会产生复制
+            self.mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    def read(self) -> ctypes.Array:
+        return (ctypes.c_ubyte * len(self.mapped)).from_buffer(self.mapped)
+
+
+GLYPH_CACHE_VERSION = 1
+'''
+字形轮廓缓存的格式版本，缓存的格式或字形的解析逻辑发生变化时需要增加，使得旧的缓存失效
+'''
+
+
+def get_glyph_cache_dir() -> str:
+    from janim.utils.config import Config
+    return guarantee_existence(os.path.join(Config.get.temp_dir, 'glyph_cache'))
+
+
+class GlyphCache:
+    '''
+    字形轮廓的磁盘缓存，每个字体文件中的每个字体对应一个缓存文件
+
+    - 读取时，所有字形的点坐标存放在同一个数组中，按需切片得到每个字形的数据
+    - 新解析的字形会被记录下来，在进程退出时（或调用 :meth:`save` 时）与已有的缓存合并后写入
+    '''
+    pending: list[GlyphCache] = []
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.points = np.empty((0, 3))
+        self.ranges: dict[int, tuple[int, int, tuple[int, int]]] = {}
+        self.new_glyphs: dict[int, Font.GlyphData] = {}
+
+        data = self.load(path)
+        if data is not None:
+            codepoints, counts, advances, self.points = data
+            ends = np.cumsum(counts).tolist()
+            self.ranges = {
+                codepoint: (end - count, end, advance)
+                for codepoint, count, end, advance in zip(codepoints.tolist(), counts.tolist(), ends,
+                                                          map(tuple, advances.tolist()))
+            }
+            self.points.setflags(write=False)
+
+    @staticmethod
+    def load(path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return data['codepoints'], data['counts'], data['advances'], data['points']
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+    def get(self, codepoint: int) -> Font.GlyphData | None:
+        item = self.ranges.get(codepoint, None)
+        if item is None:
+            return None
+        start, end, advance = item
+        return Font.GlyphData(self.points[start:end], advance)
+
+    def add(self, codepoint: int, data: Font.GlyphData) -> None:
+        if not self.new_glyphs:
+            GlyphCache.pending.append(self)
+        self.new_glyphs[codepoint] = data
+
+    def save(self) -> None:
+        '''
+        将新解析的字形写入缓存文件
+
+        写入前会重新读取缓存文件，与其它进程在此期间写入的字形合并
+        '''
+        if not self.new_glyphs:
+            return
+
+        glyphs: dict[int, tuple[np.ndarray, tuple[int, int]]] = {}
+
+        data = self.load(self.path)
+        if data is not None:
+            codepoints, counts, advances, points = data
+            for codepoint, array, advance in zip(codepoints.tolist(),
+                                                 np.split(points, np.cumsum(counts)[:-1]),
+                                                 advances.tolist()):
+                glyphs[codepoint] = (array, advance)
+
+        for codepoint, glyph in self.new_glyphs.items():
+            glyphs[codepoint] = (glyph.array, glyph.advance)
+        self.new_glyphs = {}
+
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    codepoints=np.array(list(glyphs.keys()), dtype=np.int64),
+                    counts=np.array([len(array) for array, advance in glyphs.values()], dtype=np.int64),
+                    advances=np.array([advance for array, advance in glyphs.values()], dtype=np.int64),
+                    points=np.vstack([array.reshape(-1, 3) for array, advance in glyphs.values()])
+                )
+            # 先写入临时文件再重命名，避免其它进程读取到不完整的缓存
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def save_pending() -> None:
+        for cache in GlyphCache.pending:
+            cache.save()
+        GlyphCache.pending.clear()
+
+
+atexit.register(GlyphCache.save_pending)
@@ -3,6 +3,13 @@ from functools import wraps
 from typing import Any, Callable, Self
 
 
+# 被 Signal.defer_emits 延后标记的方法名，读取这些方法的缓存值前需要先触发延后的信号
+deferred_names: set[str] = set()
+
+# 仅在 Signal.defer_emits 期间为 True，使得平时读取缓存值时只需要检查这一个标志
+deferred_check: bool = False
+
+
 def register[T](func: T) -> T:
     '''
     用于在需要时才进行值的重新计算，提升性能
@@ -23,7 +30,14 @@ def register[T](func: T) -> T:
 
     @wraps(func)
     def wrapper(self: Refreshable, *args, **kwargs):
-        data = self.refresh_data[name]
+        if deferred_check and name in deferred_names:
+            from janim.utils.signal import Signal
+            Signal.flush_deferred()
+
+        refresh_data = self._refresh_data
+        if refresh_data is None:
+            refresh_data = self._refresh_data = defaultdict(RefreshData)
+        data = refresh_data[name]
 
         if data.is_required:
             data.stored = func(self, *args, **kwargs)
@@ -35,26 +49,56 @@ def register[T](func: T) -> T:
 
 
 class Refreshable:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # 大多数对象的大部分方法不会被调用，所以这里在第一次需要时才创建 refresh_data，以减少内存占用
+    # 由于 Cmpt_List 同时继承自 list，这里不能使用非空的 __slots__
+    _refresh_data: defaultdict[str, 'RefreshData'] | None = None
 
-        self.refresh_data: defaultdict[str, RefreshData] = defaultdict(RefreshData)
+    @property
+    def refresh_data(self) -> defaultdict[str, 'RefreshData']:
+        if self._refresh_data is None:
+            self._refresh_data = defaultdict(RefreshData)
+        return self._refresh_data
 
     def mark_refresh(self, func: Callable | str) -> Self:
         '''
         标记指定的 ``func`` 需要进行更新
         '''
+        refresh_data = self._refresh_data
+        if refresh_data is None:
+            return self
+
+        # 没有记录的方法本身就需要更新，所以只需要处理已有的记录
         name = func.__name__ if callable(func) else func
-        data: RefreshData = self.refresh_data[name]
-        data.is_required = True
+        data = refresh_data.get(name, None)
+        if data is not None:
+            data.is_required = True
+
+        return self
+
+    def mark_refresh_names(self, names: tuple[str, ...]) -> Self:
+        '''
+        标记多个方法需要进行更新，与对每个名称调用 ``mark_refresh`` 等价（不进行递归），用于 :meth:`~.Signal.emit`
+        '''
+        refresh_data = self._refresh_data
+        if refresh_data is None:
+            return self
+
+        for name in names:
+            data = refresh_data.get(name, None)
+            if data is not None:
+                data.is_required = True
 
         return self
 
     def reset_refresh(self) -> Self:
-        self.refresh_data = defaultdict(RefreshData)
+        # 只在确实有记录时才赋值，避免给实例额外增加属性
+        if self._refresh_data is not None:
+            self._refresh_data = None
 
 
 class RefreshData:
+    __slots__ = ('is_required', 'stored')
+
     def __init__(self):
         self.is_required = True
         self.stored: Any = None
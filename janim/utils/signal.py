@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import gc
 import inspect
+import threading
 import weakref
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache, partial, update_wrapper
-from typing import (Callable, Concatenate, Generic, ParamSpec, Self, TypeVar,
-                    overload)
+from typing import (Callable, Concatenate, Generator, Generic, ParamSpec, Self,
+                    TypeVar, overload)
 
 import janim.utils.refresh as refresh
 
@@ -25,6 +27,8 @@ SIGNAL_OBJ_SLOTS_NAME = '__signal_obj_slots'
 
 
 class _SelfSlots:
+    __slots__ = ('normal_slots', 'refresh_slots', 'refresh_slots_with_recurse')
+
     def __init__(self):
         self.normal_slots: list[Callable] = []
         self.refresh_slots: list[Callable] = []
@@ -32,24 +36,60 @@ class _SelfSlots:
 
 
 class _ObjSlots:
+    __slots__ = ('normal_slots', 'refresh_slots')
+
     def __init__(self):
         self.normal_slots: list[Callable] = []
         self.refresh_slots: list[_RefreshSlot] = []
 
 
-@dataclass
+@dataclass(slots=True)
 class _SelfSlotWithRecurse:
     func: Callable
     recurse_up: bool
     recurse_down: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class _RefreshSlot:
     obj: weakref.ReferenceType[refresh.Refreshable]
     func: Callable | str
 
 
+@dataclass(slots=True, frozen=True)
+class _Dispatch:
+    '''
+    将某个类在某个 key 下的所有 ``self_slot`` ``self_refresh`` ``self_refresh_with_recurse`` 展平后的结果，
+    用于减少 :meth:`Signal.emit` 的开销
+    '''
+    normal_slots: tuple[Callable, ...]
+    refresh_names: tuple[str, ...]
+    refresh_slots_with_recurse: tuple[_SelfSlotWithRecurse, ...]
+    # 所有会被标记的方法名，用于 Signal.defer_emits
+    all_refresh_names: frozenset[str]
+    # 是否有该类的对象使用过 connect 或 connect_refresh，若没有则不需要检查对象上的槽
+    check_obj_slots: bool
+
+
+class _DeferredEmits:
+    '''
+    :meth:`Signal.defer_emits` 的状态
+    '''
+    __slots__ = ('depth', 'thread', 'emits', 'visited')
+
+    def __init__(self):
+        self.depth: int = 0
+        # 进行延后的线程，其它线程中的信号不会被延后
+        self.thread: int | None = None
+        # 以 (信号, 发送者, key) 去重，并保持触发的顺序
+        self.emits: dict[tuple[int, int, Key], tuple[Signal, object, Key]] = {}
+        # 仅在 flush 期间不为 None，用于对递归标记的对象去重，详见 Signal.get_refresh_visited
+        self.visited: defaultdict[tuple, set[int]] | None = None
+
+
+_deferred = _DeferredEmits()
+
+
 class Signal(Generic[T, P, R]):
     # for gc
     objects_with_slots: weakref.WeakSet[defaultdict[tuple[Signal, Key], _ObjSlots]] = weakref.WeakSet()
@@ -61,6 +101,11 @@ class Signal(Generic[T, P, R]):
         self.all_slots: defaultdict[FullQualname, defaultdict[Key, _SelfSlots]] \
             = defaultdict(lambda: defaultdict(_SelfSlots))
 
+        # 在注册槽时会被清空，详见 _get_dispatch
+        self.dispatches: dict[tuple[type, Key], _Dispatch] = {}
+        # 有对象使用过 connect 或 connect_refresh 的类
+        self.connected_classes: set[type] = set()
+
     # region typing
 
     @overload
@@ -108,6 +153,28 @@ class Signal(Generic[T, P, R]):
 
         return result
 
+    def _get_dispatch(self, cls: type, key: Key) -> _Dispatch:
+        slots = self._get_cls_slots(cls).get(key, None)
+        if slots is None:
+            slots = _SelfSlots()
+
+        dispatch = _Dispatch(
+            tuple(slots.normal_slots),
+            tuple(func.__name__ for func in slots.refresh_slots),
+            tuple(slots.refresh_slots_with_recurse),
+            frozenset(
+                [func.__name__ for func in slots.refresh_slots]
+                + [slot.func.__name__ for slot in slots.refresh_slots_with_recurse]
+            ),
+            cls in self.connected_classes
+        )
+        self.dispatches[(cls, key)] = dispatch
+        return dispatch
+
+    def _slots_changed(self) -> None:
+        self._get_cls_slots.cache_clear()
+        self.dispatches.clear()
+
     @staticmethod
     def _get_obj_slots(sender: object) -> defaultdict[tuple[Signal, Key], _ObjSlots] | None:
         return getattr(sender, SIGNAL_OBJ_SLOTS_NAME, None)
@@ -140,6 +207,7 @@ class Signal(Generic[T, P, R]):
 
     def _self_slot[T](self, full_qualname: str, func: T, key: str = '') -> T:
         self.all_slots[full_qualname][key].normal_slots.append(func)
+        self._slots_changed()
         return func
 
     def self_refresh(self, func=None, *, key: str = ''):
@@ -157,6 +225,7 @@ class Signal(Generic[T, P, R]):
 
     def _self_refresh[T](self, full_qualname: str, func: T, key: str = '') -> T:
         self.all_slots[full_qualname][key].refresh_slots.append(func)
+        self._slots_changed()
         return func
 
     def self_refresh_with_recurse(self, *, recurse_up: bool = False, recurse_down: bool = False, key: str = ''):
@@ -169,6 +238,7 @@ class Signal(Generic[T, P, R]):
             full_qualname = self._get_cls_full_qualname_from_fback()
             slot = _SelfSlotWithRecurse(func, recurse_up, recurse_down)
             self.all_slots[full_qualname][key].refresh_slots_with_recurse.append(slot)
+            self._slots_changed()
             return func
 
         return decorator
@@ -177,6 +247,7 @@ class Signal(Generic[T, P, R]):
         '''
         使 ``func`` 会在 ``Signal`` 触发时被调用
         '''
+        self._mark_connected(sender)
         obj_slots = self._get_obj_slots_with_default(sender)
         obj_slots[(self, key)].normal_slots.append(func)
 
@@ -184,28 +255,42 @@ class Signal(Generic[T, P, R]):
         '''
         使 ``func`` 会在 ``Signal`` 触发时被标记为需要重新计算
         '''
+        self._mark_connected(sender)
         obj_slots = self._get_obj_slots_with_default(sender)
         slot = _RefreshSlot(weakref.ref(obj), func)
         obj_slots[(self, key)].refresh_slots.append(slot)
 
+    def _mark_connected(self, sender: object) -> None:
+        cls = sender.__class__
+        if cls not in self.connected_classes:
+            self.connected_classes.add(cls)
+            self.dispatches.clear()
+
     def emit(self, sender: object, *args, key: str = '', **kwargs):
-        cls_slots = self._get_cls_slots(sender.__class__)
-        slots = cls_slots[key]
+        cls = sender.__class__
+        dispatch = self.dispatches.get((cls, key), None)
+        if dispatch is None:
+            dispatch = self._get_dispatch(cls, key)
+
+        if _deferred.depth and not args and not kwargs and self._defer(sender, key, dispatch):
+            return
 
         # @self_slot
-        for func in slots.normal_slots:
+        for func in dispatch.normal_slots:
             func(sender, *args, **kwargs)
 
         # @self_refresh
-        for func in slots.refresh_slots:
-            sender.mark_refresh(func)
+        if dispatch.refresh_names:
+            sender.mark_refresh_names(dispatch.refresh_names)
 
         # @self_refresh_with_recurse
-        for slot in slots.refresh_slots_with_recurse:
+        for slot in dispatch.refresh_slots_with_recurse:
             sender.mark_refresh(slot.func, recurse_up=slot.recurse_up, recurse_down=slot.recurse_down)
 
         ####
 
+        if not dispatch.check_obj_slots:
+            return
         obj_slots = self._get_obj_slots(sender)
         if obj_slots is None:
             return
@@ -224,6 +309,97 @@ class Signal(Generic[T, P, R]):
                 continue
             obj.mark_refresh(slot.func)
 
+    # region defer
+
+    @staticmethod
+    @contextmanager
+    def defer_emits() -> Generator[None, None, None]:
+        '''
+        在 ``with`` 块中，只用于标记重新计算的信号（没有参数，并且没有 ``self_slot`` 或 ``connect`` 的普通槽）不会立即触发，
+        而是按 (信号, 发送者, key) 去重后，在退出时统一触发一次；递归的标记也会对已经标记过的对象去重
+
+        这样在大量编辑物件时，同一个物件的多次修改只会进行一次标记，祖先（后代）物件也只会被遍历一次
+
+        在此期间，若读取了可能受延后标记影响的 ``refresh.register`` 缓存值，会先立即触发所有延后的信号，
+        所以不会读取到过时的数据
+
+        一般通过 :meth:`~.Item.batch_edit` 使用；只对调用的线程有效，若其它线程正在延后，则不会产生作用
+        '''
+        thread = threading.get_ident()
+        if _deferred.depth == 0:
+            _deferred.thread = thread
+            refresh.deferred_check = True
+        elif _deferred.thread != thread:
+            yield
+            return
+
+        _deferred.depth += 1
+        try:
+            yield
+        finally:
+            _deferred.depth -= 1
+            if _deferred.depth == 0:
+                try:
+                    Signal.flush_deferred()
+                finally:
+                    refresh.deferred_check = False
+                    _deferred.thread = None
+
+    @staticmethod
+    def flush_deferred() -> None:
+        '''
+        立即触发所有被 :meth:`defer_emits` 延后的信号
+        '''
+        if not _deferred.emits or _deferred.thread != threading.get_ident():
+            return
+
+        emits = list(_deferred.emits.values())
+        _deferred.emits.clear()
+        refresh.deferred_names.clear()
+
+        _deferred.visited = defaultdict(set)
+        # 触发期间不再延后
+        depth, _deferred.depth = _deferred.depth, 0
+        try:
+            for signal, sender, key in emits:
+                signal.emit(sender, key=key)
+        finally:
+            _deferred.visited = None
+            _deferred.depth = depth
+
+    @staticmethod
+    def get_refresh_visited(marker: tuple) -> set[int] | None:
+        '''
+        在 :meth:`flush_deferred` 期间，得到 ``marker`` 所对应的递归标记已经处理过的对象 ``id`` 集合，否则返回 ``None``
+
+        已经处理过的对象，其祖先（后代）也一定已经处理过，因此递归标记时可以在此停止遍历
+        '''
+        visited = _deferred.visited
+        return None if visited is None else visited[marker]
+
+    def _defer(self, sender: object, key: str, dispatch: _Dispatch) -> bool:
+        if dispatch.normal_slots or _deferred.thread != threading.get_ident():
+            return False
+
+        names = dispatch.all_refresh_names
+
+        if dispatch.check_obj_slots:
+            obj_slots = self._get_obj_slots(sender)
+            slots = None if obj_slots is None else obj_slots.get((self, key), None)
+            if slots is not None:
+                if slots.normal_slots:
+                    return False
+                names = names.union(
+                    slot.func if isinstance(slot.func, str) else slot.func.__name__
+                    for slot in slots.refresh_slots
+                )
+
+        _deferred.emits.setdefault((id(self), id(sender), key), (self, sender, key))
+        refresh.deferred_names.update(names)
+        return True
+
+    # endregion
+
 
 def _signal_gc_callback(phase: str, info: dict) -> None:
     if phase != 'start' or info['generation'] != 2:
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from janim.constants import ORIGIN, RIGHT
+from janim.items.geometry.arc import Circle
+from janim.items.geometry.polygon import Square
+from janim.items.points import Group
+from janim.items.text import Text
+from janim.utils.config import Config
+
+
+class PointsBoxTest(unittest.TestCase):
+    def assertBox(self, box, center, width: float, height: float) -> None:
+        np.testing.assert_allclose(box.center, center, atol=1e-6)
+        self.assertAlmostEqual(box.width, width, places=6)
+        self.assertAlmostEqual(box.height, height, places=6)
+
+    def test_group_of_single_item(self) -> None:
+        square = Square(side_length=2)
+        square.points.shift(RIGHT * 3)
+        self.assertBox(Group(square).points.box, RIGHT * 3, 2, 2)
+
+    def test_nested_group_of_single_item(self) -> None:
+        circle = Circle(radius=1.5)
+        self.assertBox(Group(Group(circle)).points.box, ORIGIN, 3, 3)
+
+    def test_single_char_text(self) -> None:
+        with Config(font='Lato'):
+            text = Text('A')
+        char_box = text[0][0].points.self_box
+        self.assertGreater(char_box.width, 0)
+        self.assertBox(text.points.box, char_box.center, char_box.width, char_box.height)
+        # Text 默认居中，读到的包围框不正确时会偏离原点
+        np.testing.assert_allclose(text.points.box.center, ORIGIN, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()